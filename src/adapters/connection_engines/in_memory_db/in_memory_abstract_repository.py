@@ -1,18 +1,36 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from itertools import chain
 from operator import attrgetter
-from typing import Dict, Generic, List, TypeVar
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, Sequence, TypeVar
 from uuid import UUID, uuid4
 
+from adapters.connection_engines.in_memory_db.inverted_index import InvertedIndex
 from domain.entities.base import EntityBase
+from domain.value_objects.change_feed import ChangePosition, Removal, RemovalReason
 from domain.value_objects.ordering import Ordering
+from domain.value_objects.projection import Projection
+from domain.value_objects.search import tokenize
 
 T = TypeVar("T", bound=EntityBase)
 
 
 class InMemoryAbstractRepository(ABC, Generic[T]):
+    # Text fields searched by the `q` filter of list_all and count
+    searchable_fields: tuple[str, ...] = ()
+
     def __init__(self) -> None:
         # A dictionary to store entities in-memory, using UUID as the key
         self._storage: Dict[UUID, T] = {}
+        # Entities moved out of the storage by `archive`
+        self._archive: Dict[UUID, T] = {}
+        # Removals reported by the change feed
+        self._tombstones: List[Removal] = []
+        self._search_index = InvertedIndex()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        # No transactions: the writes are visible as soon as they are made
+        callback()
 
     async def save(self, entity: T) -> T:
         """
@@ -21,8 +39,17 @@ class InMemoryAbstractRepository(ABC, Generic[T]):
 
         entity.id = uuid4()
         self._storage[entity.id] = entity
+        self._index(entity)
         return entity
 
+    async def save_many(self, entities: Sequence[T]) -> List[T]:
+        return [await self.save(entity) for entity in entities]
+
+    async def bulk_insert(self, entities: Sequence[T]) -> int:
+        for entity in entities:
+            await self.save(entity)
+        return len(entities)
+
     async def get(self, **filters) -> T | None:
         """
         Get an entity by filters.
@@ -44,17 +71,30 @@ class InMemoryAbstractRepository(ABC, Generic[T]):
                 for field, value in fields_to_update.items():
                     if hasattr(entity, field):
                         setattr(entity, field, value)
+                if "updated_at" not in fields_to_update:
+                    entity.updated_at = datetime.now(timezone.utc)
+                self._index(entity)
                 updated_count += 1
         return updated_count
 
-    def delete(self, key: UUID) -> None:
+    async def delete(self, **filters) -> int:
         """
-        Delete an entity by its UUID.
-        Throws KeyError if the entity is not found.
+        Delete the entities matching the filters.
+        Returns the number of entities deleted.
         """
-        if key not in self._storage:
-            raise KeyError(f"Entity with UUID {key} not found.")
-        del self._storage[key]
+        deleted_keys = [
+            key
+            for key, entity in self._storage.items()
+            if self._get_filters(entity, **filters)
+        ]
+        removed_at = datetime.now(timezone.utc)
+        for key in deleted_keys:
+            del self._storage[key]
+            self._search_index.remove(key)
+            self._tombstones.append(
+                Removal(id=key, reason=RemovalReason.DELETED, removed_at=removed_at)
+            )
+        return len(deleted_keys)
 
     async def list_all(
         self,
@@ -62,12 +102,15 @@ class InMemoryAbstractRepository(ABC, Generic[T]):
         limit: int = 10,
         order_by: str = "created_at",
         ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
         **filters,
     ) -> List[T]:
+        scores = self._search(filters.pop("q", None))
         filtered_entities = [
             entity
-            for entity in self._storage.values()
-            if self._get_filters(entity, **filters)
+            for entity in self._entities(include_archived)
+            if (scores is None or entity.id in scores)
+            and self._get_filters(entity, **filters)
         ]
 
         if ordering == Ordering.ASC:
@@ -76,23 +119,106 @@ class InMemoryAbstractRepository(ABC, Generic[T]):
             sorted_entities = sorted(
                 filtered_entities, key=attrgetter(order_by), reverse=True
             )
+        if scores is not None:
+            # Most relevant first, the requested ordering breaks ties (stable sort)
+            sorted_entities.sort(key=lambda entity: scores[entity.id], reverse=True)
 
         start = (page - 1) * limit
         end = start + limit
         return sorted_entities[start:end]
 
+    async def list_projected(
+        self,
+        fields: Sequence[str],
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "created_at",
+        ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
+        **filters,
+    ) -> List[Projection]:
+        # Entities are already in memory: the projection has nothing to save here
+        entities = await self.list_all(
+            page, limit, order_by, ordering, include_archived, **filters
+        )
+        names = list(dict.fromkeys(["id", *fields]))
+        return [
+            Projection(
+                id=entity.id,  # type: ignore[arg-type]
+                values={name: getattr(entity, name) for name in names},
+            )
+            for entity in entities
+        ]
+
+    async def list_changes(
+        self,
+        since: ChangePosition | None = None,
+        limit: int = 100,
+    ) -> List[T | Removal]:
+        changes: List[T | Removal] = [*self._storage.values(), *self._tombstones]
+        changes.sort(key=ChangePosition.of)
+        if since is not None:
+            changes = [
+                change for change in changes if ChangePosition.of(change) > since
+            ]
+        return changes[:limit]
+
     async def count(
         self,
+        include_archived: bool = False,
         **filters,
     ) -> int:
+        scores = self._search(filters.pop("q", None))
         filtered_entities = [
             entity
-            for entity in self._storage.values()
-            if self._get_filters(entity, **filters)
+            for entity in self._entities(include_archived)
+            if (scores is None or entity.id in scores)
+            and self._get_filters(entity, **filters)
         ]
 
         return len(filtered_entities)
 
+    async def archive(self, **filters) -> int:
+        """
+        Move the entities matching the filters to the archive.
+        Returns the number of entities moved.
+        """
+        archived = {
+            key: entity
+            for key, entity in self._storage.items()
+            if self._get_filters(entity, **filters)
+        }
+        removed_at = datetime.now(timezone.utc)
+        for key, entity in archived.items():
+            del self._storage[key]
+            self._search_index.remove(key)
+            self._archive[key] = entity
+            self._tombstones.append(
+                Removal(id=key, reason=RemovalReason.ARCHIVED, removed_at=removed_at)
+            )
+        return len(archived)
+
+    def _entities(self, include_archived: bool) -> Iterable[T]:
+        if include_archived:
+            return chain(self._storage.values(), self._archive.values())
+        return self._storage.values()
+
+    def _search(self, text: str | None) -> Dict[Hashable, float] | None:
+        """
+        Scores of the entities matching the search text, None when not searching:
+        like the database repositories, a text without terms is no search.
+        """
+        if not text or not self.searchable_fields or not tokenize(text):
+            return None
+        return self._search_index.search(text)
+
+    def _index(self, entity: T) -> None:
+        if self.searchable_fields:
+            text = " ".join(
+                str(getattr(entity, field) or "") for field in self.searchable_fields
+            )
+            self._search_index.add(entity.id, text)
+
     @abstractmethod
     def _get_filters(self, entity: T, **filters) -> bool:
         pass
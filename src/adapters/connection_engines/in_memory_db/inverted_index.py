@@ -0,0 +1,68 @@
+import math
+from collections import Counter
+from typing import Dict, Hashable
+
+from domain.value_objects.search import tokenize
+
+
+class InvertedIndex:
+    """
+    Term -> documents index for the in-memory repositories.
+
+    Search semantics follow the database indexes: every term must match, the last
+    one as a prefix, and documents are scored by tf-idf (higher is more relevant).
+    """
+
+    def __init__(self) -> None:
+        # term -> {document key: term frequency}
+        self._postings: Dict[str, Dict[Hashable, int]] = {}
+        self._documents: Dict[Hashable, Counter[str]] = {}
+
+    def add(self, key: Hashable, text: str) -> None:
+        self.remove(key)
+        terms = Counter(tokenize(text))
+        self._documents[key] = terms
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[key] = frequency
+
+    def remove(self, key: Hashable) -> None:
+        terms = self._documents.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, text: str) -> Dict[Hashable, float]:
+        """
+        Return the score of every matching document.
+        """
+        terms = tokenize(text)
+        if not terms:
+            return {}
+
+        *exact_terms, prefix = terms
+        term_groups = [[term] for term in exact_terms]
+        term_groups.append([term for term in self._postings if term.startswith(prefix)])
+
+        scores: Dict[Hashable, float] | None = None
+        for group in term_groups:
+            group_scores: Dict[Hashable, float] = {}
+            for term in group:
+                postings = self._postings.get(term, {})
+                idf = math.log(1 + len(self._documents) / len(postings or [None]))
+                for key, frequency in postings.items():
+                    group_scores[key] = group_scores.get(key, 0.0) + frequency * idf
+            if scores is None:
+                scores = group_scores
+            else:
+                scores = {
+                    key: score + group_scores[key]
+                    for key, score in scores.items()
+                    if key in group_scores
+                }
+            if not scores:
+                return {}
+        return scores or {}
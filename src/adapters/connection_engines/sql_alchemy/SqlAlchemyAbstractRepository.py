@@ -1,50 +1,187 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, TypeVar
+from collections import OrderedDict
+from functools import wraps
+from itertools import groupby
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
 
 import sqlalchemy
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import (
+    Executable,
+    RowMapping,
+    asc,
+    bindparam,
+    desc,
+    func,
+    select,
+    tuple_,
+)
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.util import ClauseAdapter
 
+from adapters.connection_engines.sql_alchemy.base import utc_now
+from adapters.connection_engines.sql_alchemy.full_text_search import (
+    SEARCH_PARAMETER,
+    FullTextSearch,
+)
 from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.post_commit import run_after_commit
+from adapters.connection_engines.sql_alchemy.write_queue import WriteQueue
 from domain.entities.base import EntityBase
 from domain.exceptions.common import DatabaseException
+from domain.value_objects.change_feed import ChangePosition, Removal, RemovalReason
 from domain.value_objects.ordering import Ordering
+from domain.value_objects.projection import Projection
 
 Entity = TypeVar("Entity", bound=EntityBase)
 SqlAlchemyModel = TypeVar("SqlAlchemyModel", bound=Base)
 
+# Maximum number of query shapes kept in the statement cache
+STATEMENT_CACHE_SIZE = 512
+
+# Least recently used first
+_statement_cache: OrderedDict[tuple[Any, ...], Executable] = OrderedDict()
+
+
+def _column_names(values: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(values)
+
+
+WriteMethod = TypeVar("WriteMethod", bound=Callable[..., Awaitable[Any]])
+
+
+def _queued_write(method: WriteMethod) -> WriteMethod:
+    """
+    Run a write method through the repository's write queue, if it has one: on a
+    repository bound to the queue's writer session.
+    """
+
+    @wraps(method)
+    async def write(self, *args, **kwargs):
+        if self._write_queue is None:
+            return await method(self, *args, **kwargs)
+        return await self._write_queue.submit(
+            lambda session: method(type(self)(session), *args, **kwargs)
+        )
+
+    return write  # type: ignore[return-value]
+
 
 class SqlAlchemyAbstractRepository(ABC, Generic[Entity, SqlAlchemyModel]):
     # The SQLAlchemy model class (not instance) used by this repository
     model: type[SqlAlchemyModel]
+    # Full-text index used for the `q` filter of list_all and count, if any
+    full_text_search: FullTextSearch | None = None
+    # Model of the table `archive` moves entities to, if any
+    archive_model: type[Base] | None = None
+    # Model of the table recording the removals for the change feed, if any
+    tombstone_model: type[Base] | None = None
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, write_queue: WriteQueue | None = None
+    ) -> None:
         self._session = session
+        # With a write queue, the session only reads: the writes are queued
+        self._write_queue = write_queue
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run the callback once the session's transaction is committed.
+        """
+        if self._write_queue is not None:
+            # The queued writes are committed once they return
+            callback()
+            return
+        run_after_commit(self._session.sync_session, callback)
 
+    @_queued_write
     async def save(self, entity: Entity) -> Entity:
-        model = self._entity_to_model(entity)
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
+        if not self._session.get_bind().dialect.insert_returning:
+            model = self._entity_to_model(entity)
+            self._session.add(model)
+            await self._session.flush()
+            await self._session.refresh(model)
+
+            return self._model_to_entity(model)
+
+        # A single INSERT ... RETURNING round trip, outside of the identity map.
+        # The returned row exposes the same attributes as the model.
+        result = await self._session.execute(
+            self._get_statement("insert", {}), self._entity_to_values(entity)
+        )
+        return self._model_to_entity(result.one())  # type: ignore[arg-type]
+
+    @_queued_write
+    async def save_many(self, entities: Sequence[Entity]) -> List[Entity]:
+        """
+        Insert the entities with multi-row INSERT ... RETURNING statements and
+        return them in the given order.
+        """
+        if not self._session.get_bind().dialect.insert_returning:
+            return [await self.save(entity) for entity in entities]
+
+        saved: List[Entity] = []
+        values = [self._entity_to_values(entity) for entity in entities]
+        # Rows leaving different columns to their defaults can't share a statement
+        for _, rows in groupby(values, key=_column_names):
+            result = await self._session.execute(
+                self._get_statement("insert_many", {}), list(rows)
+            )
+            saved.extend(self._model_to_entity(row) for row in result)  # type: ignore[arg-type]
+        return saved
 
-        return self._model_to_entity(model)
+    @_queued_write
+    async def bulk_insert(self, entities: Sequence[Entity]) -> int:
+        """
+        Insert the entities without reading them back: COPY on PostgreSQL (asyncpg),
+        one executemany elsewhere. Returns the number of entities inserted.
+        """
+        values = [self._entity_to_values(entity) for entity in entities]
+        try:
+            for columns, rows in groupby(values, key=_column_names):
+                if self._dialect_name == "postgresql":
+                    connection = await self._session.connection()
+                    raw_connection = await connection.get_raw_connection()
+                    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                        self._table.name,
+                        records=[tuple(row.values()) for row in rows],
+                        columns=list(columns),
+                    )
+                else:
+                    await self._session.execute(
+                        sqlalchemy.insert(self._table), list(rows)
+                    )
+        except SQLAlchemyError as exception:
+            await self._session.rollback()
+            raise DatabaseException from exception
+        return len(values)
 
+    @_queued_write
     async def update(
         self,
         fields_to_update: dict[str, Any],
         **filters,
     ) -> int:
         try:
-            filter_conditions = self._get_filters(**filters)
-
-            query = (
-                sqlalchemy.update(self.model)
-                .where(*filter_conditions)
-                .values(fields_to_update)
+            query = self._get_statement(
+                "update", filters, fields=tuple(sorted(fields_to_update))
             )
+            params = {
+                **filters,
+                **{f"value_{key}": value for key, value in fields_to_update.items()},
+            }
 
-            result = await self._session.execute(query)
+            result = await self._session.execute(query, params)
             await self._session.flush()
             return result.rowcount  # type: ignore[attr-defined]
         except IntegrityError as exception:
@@ -60,57 +197,130 @@ class SqlAlchemyAbstractRepository(ABC, Generic[Entity, SqlAlchemyModel]):
         limit: int = 10,
         order_by: str = "created_at",
         ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
         **filters,
     ) -> List[Entity]:
-        query = select(self.model)
+        result = await self._list(
+            page, limit, order_by, ordering, (), include_archived, filters
+        )
+        return [self._row_to_entity(row) for row in result.mappings()]
+
+    async def list_projected(
+        self,
+        fields: Sequence[str],
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "created_at",
+        ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
+        **filters,
+    ) -> List[Projection]:
+        """
+        Column projection: only the requested columns (and the id) are read.
+        """
+        columns = tuple(dict.fromkeys(["id", *fields]))
+        result = await self._list(
+            page, limit, order_by, ordering, columns, include_archived, filters
+        )
+        return [Projection(id=row["id"], values=dict(row)) for row in result.mappings()]
 
-        filter_conditions = self._get_filters(**filters)
-        query = query.where(*filter_conditions)
+    async def _list(
+        self,
+        page: int,
+        limit: int,
+        order_by: str,
+        ordering: Ordering,
+        fields: tuple[str, ...],
+        include_archived: bool,
+        filters: dict[str, Any],
+    ) -> sqlalchemy.Result[Any]:
+        filters = self._prepare_search(filters)
+        query = self._get_statement(
+            "list_all_archived" if include_archived else "list_all",
+            filters,
+            order_by=order_by,
+            ordering=ordering,
+            fields=fields,
+        )
+        params = {**filters, "offset": (page - 1) * limit, "limit": limit}
+        return await self._session.execute(query, params)
 
-        query.order_by(self._get_order_expression(order_by=order_by, ordering=ordering))
-        offset = (page - 1) * limit
-        query = query.offset(offset).limit(limit)
+    async def list_changes(
+        self,
+        since: ChangePosition | None = None,
+        limit: int = 100,
+    ) -> List[Entity | Removal]:
+        """
+        Entities created or updated after `since`, in (updated_at, id) order:
+        a seek on the (updated_at, id) index, however large the table is.
+        The removals since then are merged in, read the same way from the tombstones.
+        """
+        params: dict[str, Any] = {"limit": limit}
+        if since is not None:
+            params.update(since_updated_at=since.updated_at, since_id=since.id)
+        query = self._get_statement("changes", params)
 
-        result = await self._session.execute(query)
-        models = result.scalars().all()
+        result = await self._session.execute(query, params)
+        changes: List[Entity | Removal] = [
+            self._row_to_entity(row) for row in result.mappings()
+        ]
+        if self.tombstone_model is None:
+            return changes
 
-        return [self._model_to_entity(model) for model in models]
+        tombstones = await self._session.execute(
+            self._get_statement("tombstones", params), params
+        )
+        removals = [
+            Removal(
+                id=row["id"],
+                reason=RemovalReason(row["reason"]),
+                removed_at=row["removed_at"],
+            )
+            for row in tombstones.mappings()
+        ]
+        return list(heapq.merge(changes, removals, key=ChangePosition.of))[:limit]
 
     async def get(
         self,
         **filters,
     ) -> Entity | None:
-        query = select(self.model)
-
-        filter_conditions = self._get_filters(**filters)
-        query = query.where(*filter_conditions)
-        model = await self._session.scalar(query)
+        query = self._get_statement("get", filters)
+        result = await self._session.execute(query, filters)
+        row = result.mappings().first()
 
-        return self._model_to_entity(model) if model else None
+        return self._row_to_entity(row) if row else None
 
     async def exists(
         self,
         **filters,
     ) -> bool:
-        query = select(self.model)
-
-        filter_conditions = self._get_filters(**filters)
-        query = query.where(*filter_conditions)
-        result = await self._session.scalar(query)
+        query = self._get_statement("get", filters)
+        result = await self._session.scalar(query, filters)
 
         return result is not None
 
+    @_queued_write
     async def delete(
         self,
         **filters,
     ) -> int:
         try:
-            query = sqlalchemy.delete(self.model)
+            if (
+                self.tombstone_model is not None
+                and self._session.get_bind().dialect.delete_returning
+            ):
+                # Tombstones for exactly the rows deleted
+                result = await self._session.execute(
+                    self._get_statement("delete_returning", filters), filters
+                )
+                ids = list(result.scalars())
+                await self._write_tombstones(ids, RemovalReason.DELETED)
+                return len(ids)
 
-            filter_conditions = self._get_filters(**filters)
-            query = query.where(*filter_conditions)
+            await self._copy_tombstones(filters, RemovalReason.DELETED)
+            query = self._get_statement("delete", filters)
 
-            result = await self._session.execute(query)
+            result = await self._session.execute(query, filters)
             await self._session.flush()
             return result.rowcount  # type: ignore[attr-defined]
         except SQLAlchemyError as e:
@@ -119,34 +329,374 @@ class SqlAlchemyAbstractRepository(ABC, Generic[Entity, SqlAlchemyModel]):
 
     async def count(
         self,
+        include_archived: bool = False,
         **filters,
     ) -> int:
-        filter_conditions = self._get_filters(**filters)
-        return (
-            await self._session.scalar(
-                select(func.count()).select_from(self.model).where(*filter_conditions)
+        filters = self._prepare_search(filters)
+        query = self._get_statement(
+            "count_archived" if include_archived else "count", filters
+        )
+        return await self._session.scalar(query, filters) or 0
+
+    @_queued_write
+    async def archive(
+        self,
+        **filters,
+    ) -> int:
+        """
+        Move the entities matching the filters to the archive table, in the
+        current transaction. Returns the number of entities moved.
+        """
+        try:
+            if not self._session.get_bind().dialect.delete_returning:
+                await self._session.execute(
+                    self._get_statement("archive_copy", filters), filters
+                )
+                await self._copy_tombstones(filters, RemovalReason.ARCHIVED)
+                result = await self._session.execute(
+                    self._get_statement("delete", filters), filters
+                )
+                return result.rowcount  # type: ignore[attr-defined]
+
+            # Archive exactly the rows deleted, whatever happened since they matched
+            result = await self._session.execute(
+                self._get_statement("archive_delete", filters), filters
+            )
+            rows = [dict(row) for row in result.mappings()]
+            if rows:
+                await self._session.execute(
+                    self._get_statement("archive_insert", {}), rows
+                )
+            await self._write_tombstones(
+                [row["id"] for row in rows], RemovalReason.ARCHIVED
             )
-            or 0
+            return len(rows)
+        except SQLAlchemyError as exception:
+            await self._session.rollback()
+            raise DatabaseException from exception
+
+    async def _write_tombstones(
+        self, ids: Sequence[Any], reason: RemovalReason
+    ) -> None:
+        if self.tombstone_model is None or not ids:
+            return
+        removed_at = utc_now()
+        await self._session.execute(
+            self._get_statement("tombstone_insert", {}),
+            [
+                {"id": id, "reason": reason.value, "removed_at": removed_at}
+                for id in ids
+            ],
+        )
+
+    async def _copy_tombstones(
+        self, filters: dict[str, Any], reason: RemovalReason
+    ) -> None:
+        """
+        Write the tombstones of the entities matching the filters, before they are
+        removed, on the databases without DELETE ... RETURNING.
+        """
+        if self.tombstone_model is None:
+            return
+        await self._session.execute(
+            self._get_statement("tombstone_copy", filters),
+            {
+                **filters,
+                "tombstone_reason": reason.value,
+                "tombstone_removed_at": utc_now(),
+            },
         )
 
+    def _prepare_search(self, filters: dict[str, Any]) -> dict[str, Any]:
+        """
+        Replace the raw `q` filter by a query in the database's search syntax,
+        or drop it when it has no searchable term.
+        """
+        if SEARCH_PARAMETER not in filters:
+            return filters
+        filters = dict(filters)
+        text = filters.pop(SEARCH_PARAMETER)
+        if self.full_text_search is None or not text:
+            return filters
+        query = self.full_text_search.prepare(self._dialect_name, text)
+        if query is not None:
+            filters[SEARCH_PARAMETER] = query
+        return filters
+
+    @property
+    def _dialect_name(self) -> str:
+        return self._session.get_bind().dialect.name
+
+    def _get_statement(
+        self,
+        operation: str,
+        filters: dict[str, Any],
+        order_by: str | None = None,
+        ordering: Ordering | None = None,
+        fields: tuple[str, ...] = (),
+    ) -> Executable:
+        """
+        Return the statement for this query shape, built once with bind parameters
+        in place of the filter (and pagination/update) values, so later calls only
+        bind values and SQLAlchemy finds its compiled form from the memoized cache key.
+        """
+        key = (
+            self.model,
+            operation,
+            tuple(sorted(filters)),
+            order_by,
+            ordering,
+            fields,
+            # The search clause depends on the dialect
+            self._dialect_name if SEARCH_PARAMETER in filters else None,
+        )
+        statement = _statement_cache.get(key)
+        if statement is not None:
+            _statement_cache.move_to_end(key)
+            return statement
+
+        statement = self._build_statement(operation, key[2], order_by, ordering, fields)
+        if len(_statement_cache) >= STATEMENT_CACHE_SIZE:
+            # Evict the least recently used shape
+            _statement_cache.popitem(last=False)
+        _statement_cache[key] = statement
+        return statement
+
+    def _build_statement(
+        self,
+        operation: str,
+        filter_keys: tuple[str, ...],
+        order_by: str | None,
+        ordering: Ordering | None,
+        fields: tuple[str, ...],
+    ) -> Executable:
+        filter_conditions = self._get_filters(
+            **{key: bindparam(key) for key in filter_keys if key != SEARCH_PARAMETER}
+        )
+        search = self.full_text_search if SEARCH_PARAMETER in filter_keys else None
+
+        if operation == "list_all":
+            # Plain columns, not the model: the rows skip the ORM (identity map,
+            # instance state) and are mapped to entities directly
+            table = self._table
+            query = select(
+                *[table.c[field] for field in fields or table.c.keys()]
+            ).where(*filter_conditions)
+            order_expressions = [
+                self._get_order_expression(
+                    order_by=order_by or "created_at",
+                    ordering=ordering or Ordering.ASC,
+                    columns=table.c,
+                )
+            ]
+            if search is not None:
+                # Most relevant first, the requested ordering breaks ties
+                query, rank = search.apply(query, self._dialect_name)
+                order_expressions.insert(0, rank)
+            return (
+                query.order_by(*order_expressions)
+                .offset(bindparam("offset"))
+                .limit(bindparam("limit"))
+            )
+        if operation in ("list_all_archived", "count_archived"):
+            # The hot and archive tables read as one, the filters adapted to it
+            source = self._with_archive()
+            adapter = ClauseAdapter(source)
+            conditions = [
+                adapter.traverse(condition) for condition in filter_conditions
+            ]
+            if operation == "count_archived":
+                return select(func.count()).select_from(source).where(*conditions)
+            columns = [source.c[field] for field in fields or source.c.keys()]
+            return (
+                select(*columns)
+                .where(*conditions)
+                .order_by(
+                    self._get_order_expression(
+                        order_by=order_by or "created_at",
+                        ordering=ordering or Ordering.ASC,
+                        columns=source.c,
+                    )
+                )
+                .offset(bindparam("offset"))
+                .limit(bindparam("limit"))
+            )
+        if operation == "changes":
+            table = self._table
+            query = select(*table.columns)
+            if "since_id" in filter_keys:
+                query = query.where(
+                    tuple_(table.c.updated_at, table.c.id)
+                    > tuple_(
+                        bindparam("since_updated_at", type_=table.c.updated_at.type),
+                        bindparam("since_id", type_=table.c.id.type),
+                    )
+                )
+            return query.order_by(table.c.updated_at, table.c.id).limit(
+                bindparam("limit")
+            )
+        if operation == "tombstones":
+            tombstones = self._tombstone_table
+            query = select(*tombstones.columns)
+            if "since_id" in filter_keys:
+                query = query.where(
+                    tuple_(tombstones.c.removed_at, tombstones.c.id)
+                    > tuple_(
+                        bindparam(
+                            "since_updated_at", type_=tombstones.c.removed_at.type
+                        ),
+                        bindparam("since_id", type_=tombstones.c.id.type),
+                    )
+                )
+            return query.order_by(tombstones.c.removed_at, tombstones.c.id).limit(
+                bindparam("limit")
+            )
+        if operation == "insert":
+            return sqlalchemy.insert(self._table).returning(*self._table.columns)
+        if operation == "insert_many":
+            return sqlalchemy.insert(self._table).returning(
+                *self._table.columns, sort_by_parameter_order=True
+            )
+        if operation == "get":
+            return select(*self._table.columns).where(*filter_conditions)
+        if operation == "count":
+            query = (
+                select(func.count()).select_from(self.model).where(*filter_conditions)
+            )
+            if search is not None:
+                query, _ = search.apply(query, self._dialect_name)
+            return query
+        if operation == "update":
+            return (
+                sqlalchemy.update(self.model)
+                .where(*filter_conditions)
+                .values({field: bindparam(f"value_{field}") for field in fields})
+            )
+        if operation == "delete":
+            return sqlalchemy.delete(self.model).where(*filter_conditions)
+        if operation == "delete_returning":
+            return (
+                sqlalchemy.delete(self._table)
+                .where(*filter_conditions)
+                .returning(self._table.c.id)
+            )
+        if operation == "tombstone_insert":
+            return sqlalchemy.insert(self._tombstone_table)
+        if operation == "tombstone_copy":
+            tombstones = self._tombstone_table
+            return sqlalchemy.insert(tombstones).from_select(
+                ["id", "reason", "removed_at"],
+                select(
+                    self._table.c.id,
+                    bindparam("tombstone_reason", type_=tombstones.c.reason.type),
+                    bindparam(
+                        "tombstone_removed_at", type_=tombstones.c.removed_at.type
+                    ),
+                ).where(*filter_conditions),
+            )
+        if operation == "archive_delete":
+            return (
+                sqlalchemy.delete(self._table)
+                .where(*filter_conditions)
+                .returning(*self._table.columns)
+            )
+        if operation == "archive_insert":
+            return sqlalchemy.insert(self._archive_table)
+        if operation == "archive_copy":
+            return sqlalchemy.insert(self._archive_table).from_select(
+                list(self._table.columns.keys()),
+                select(*self._table.columns).where(*filter_conditions),
+            )
+        raise ValueError(f"Unknown operation {operation}")
+
+    @property
+    def _table(self) -> sqlalchemy.Table:
+        return self.model.__table__  # type: ignore[return-value]
+
+    @property
+    def _archive_table(self) -> sqlalchemy.Table:
+        if self.archive_model is None:
+            raise NotImplementedError(f"{type(self).__name__} has no archive table")
+        return self.archive_model.__table__  # type: ignore[return-value]
+
+    @property
+    def _tombstone_table(self) -> sqlalchemy.Table:
+        if self.tombstone_model is None:
+            raise NotImplementedError(f"{type(self).__name__} has no tombstone table")
+        return self.tombstone_model.__table__  # type: ignore[return-value]
+
+    def _with_archive(self) -> sqlalchemy.Subquery:
+        """
+        The rows of the table followed by those of its archive table.
+        """
+        table = self._table
+        archive = self._archive_table
+        return sqlalchemy.union_all(
+            select(*table.columns),
+            select(*[archive.c[column.key] for column in table.columns]),
+        ).subquery(table.name)
+
     @staticmethod
     @abstractmethod
     def _model_to_entity(model: SqlAlchemyModel) -> Entity:
         raise NotImplementedError("Subclasses must implement _model_to_entity")
 
+    @staticmethod
+    @abstractmethod
+    def _row_to_entity(row: RowMapping) -> Entity:
+        """
+        Build an entity from a row of all its columns, read without the ORM.
+        """
+        raise NotImplementedError("Subclasses must implement _row_to_entity")
+
     @staticmethod
     @abstractmethod
     def _entity_to_model(entity: Entity) -> SqlAlchemyModel:
         raise NotImplementedError("Subclasses must implement _entity_to_model")
 
+    def _entity_to_row(self, entity: Entity) -> Mapping[str, Any]:
+        """
+        Column values of an entity, by column key. Subclasses can build them
+        directly: a model instance goes through the ORM instrumentation.
+        """
+        model = self._entity_to_model(entity)
+        return {
+            column.key: getattr(model, column.key) for column in self._table.columns
+        }
+
+    def _entity_to_values(self, entity: Entity) -> dict[str, Any]:
+        """
+        Column values to insert for an entity.
+        Unset values are left out so column defaults still apply.
+        """
+        row = self._entity_to_row(entity)
+        values = {}
+        for column in self._table.columns:
+            value = row[column.key]
+            if value is None and (
+                column.default is not None or column.server_default is not None
+            ):
+                continue
+            values[column.key] = value
+        return values
+
     @abstractmethod
     def _get_filters(self, **filters) -> List[Any]:
         return []
 
-    @staticmethod
     def _get_order_expression(
-        order_by: str, ordering: Ordering
-    ) -> sqlalchemy.UnaryExpression[str]:
+        self,
+        order_by: str,
+        ordering: Ordering,
+        columns: sqlalchemy.ColumnCollection[str, Any] | None = None,
+    ) -> sqlalchemy.UnaryExpression[Any]:
+        """
+        Order by one of the columns (of the table, unless others are given).
+        """
+        if columns is None:
+            columns = self.model.__table__.c  # type: ignore[attr-defined]
+        if order_by not in columns:
+            raise ValueError(f"Can't order by {order_by!r}, not a column")
         if ordering == Ordering.ASC:
-            return asc(order_by)
-        return desc(order_by)
+            return asc(columns[order_by])
+        return desc(columns[order_by])
@@ -1,4 +1,4 @@
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timezone
 from typing import Any
 
 import sqlalchemy
@@ -12,6 +12,10 @@ from adapters.connection_engines.sql_alchemy.utils.scripts import (
 )
 
 
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Base(AsyncAttrs, DeclarativeBase):
     type_annotation_map = {
         dict: JSONB(none_as_null=True),
@@ -24,7 +28,8 @@ class Base(AsyncAttrs, DeclarativeBase):
         server_default=sqlalchemy.func.current_timestamp()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        server_default=sqlalchemy.func.current_timestamp(), onupdate=datetime.now()
+        # A callable, evaluated on every update (PostgreSQL also has a trigger)
+        server_default=sqlalchemy.func.current_timestamp(), onupdate=utc_now
     )
 
 
@@ -40,6 +45,8 @@ def create_update_at_trigger(
     :param kwargs:
     :return:
     """
+    if connection.dialect.name != "postgresql":
+        return
     connection.execute(sqlalchemy.DDL(UPDATED_AT_FUNCTION))
     for key in target.tables:
         table = target.tables[key]
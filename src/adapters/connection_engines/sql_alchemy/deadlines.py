@@ -0,0 +1,123 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+# SQLite VM instructions between two checks of the deadline
+SQLITE_PROGRESS_INTERVAL = 1000
+
+
+class Deadline:
+    """
+    Point in time by which a unit of work (e.g. one HTTP request) must be done.
+    Cancelling it (e.g. the client disconnected) makes it expire right away.
+    """
+
+    def __init__(self, timeout: float) -> None:
+        self.expires_at = time.monotonic() + timeout
+        self.cancelled = False
+
+    def remaining(self) -> float:
+        if self.cancelled:
+            return 0.0
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.cancelled or time.monotonic() >= self.expires_at
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(timeout: float) -> Iterator[Deadline]:
+    """
+    Bound the statements executed in the current context by a deadline.
+    """
+    deadline = Deadline(timeout)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def get_current_deadline() -> Deadline | None:
+    return _current_deadline.get()
+
+
+def register_deadline_listeners(engine: Engine) -> None:
+    """
+    Make the database give up the statements of an expired deadline:
+    - SQLite: a progress handler interrupts the statement ("interrupted" error)
+    - PostgreSQL: `SET LOCAL statement_timeout` to the time left, once per transaction
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _install_progress_handler)
+        event.listen(engine, "before_cursor_execute", _bind_sqlite_deadline)
+    elif engine.dialect.name == "postgresql":
+        event.listen(engine, "before_cursor_execute", _set_statement_timeout)
+
+
+def _install_progress_handler(dbapi_connection: Any, connection_record: Any) -> None:
+    # The deadline of the statement running on this connection, set before each one
+    state: Dict[str, Deadline | None] = {"deadline": None}
+    connection_record.info["deadline_state"] = state
+
+    def progress_handler() -> int:
+        deadline = state["deadline"]
+        # Non-zero interrupts the statement
+        return int(deadline is not None and deadline.expired())
+
+    dbapi_connection.await_(
+        dbapi_connection.driver_connection.set_progress_handler(
+            progress_handler, SQLITE_PROGRESS_INTERVAL
+        )
+    )
+
+
+def _bind_sqlite_deadline(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    state = conn.info.get("deadline_state")
+    if state is not None:
+        state["deadline"] = _current_deadline.get()
+
+
+def _set_statement_timeout(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    deadline = _current_deadline.get()
+    if deadline is None or not conn.in_transaction():
+        return
+
+    applied = (id(deadline), id(conn.get_transaction()))
+    if conn.info.get("statement_timeout_applied") == applied:
+        return
+    conn.info["statement_timeout_applied"] = applied
+
+    # An integer computed here, not user input: safe to inline (SET takes no binds)
+    timeout_ms = max(1, int(deadline.remaining() * 1000))
+    timeout_cursor = conn.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+    try:
+        timeout_cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+    finally:
+        timeout_cursor.close()
@@ -0,0 +1,127 @@
+from typing import Any, Sequence
+
+import sqlalchemy
+from sqlalchemy import Select, bindparam, desc, event, func, literal_column
+from sqlalchemy.sql.expression import ColumnClause
+
+from adapters.connection_engines.sql_alchemy.utils.scripts import (
+    POSTGRES_TSVECTOR_COLUMN,
+    POSTGRES_TSVECTOR_INDEX,
+    SQLITE_FTS_DELETE_TRIGGER,
+    SQLITE_FTS_DROP_TABLE,
+    SQLITE_FTS_INSERT_TRIGGER,
+    SQLITE_FTS_TABLE,
+    SQLITE_FTS_UPDATE_TRIGGER,
+)
+from domain.value_objects.search import tokenize
+
+# Name of the bind parameter (and of the repository filter) holding the search text
+SEARCH_PARAMETER = "q"
+
+POSTGRES_WEIGHTS = ("A", "B", "C", "D")
+
+
+class FullTextSearch:
+    """
+    Ranked full-text search over text columns of a table, backed by an index:
+    - SQLite: an FTS5 external content table kept in sync by triggers, ranked by bm25
+    - PostgreSQL: a generated tsvector column with a GIN index, ranked by ts_rank
+
+    The index is created and dropped with the table (metadata create_all/drop_all).
+    All the search terms must match, the last one as a prefix.
+    """
+
+    def __init__(self, table: sqlalchemy.Table, columns: Sequence[str]) -> None:
+        self.table = table
+        self.columns = tuple(columns)
+        self.fts_table = f"{table.name}_fts"
+        self.vector_column = "search_vector"
+
+        event.listen(table, "after_create", self._create_index)
+        event.listen(table, "before_drop", self._drop_index)
+
+    def prepare(self, dialect_name: str, text: str) -> str | None:
+        """
+        Turn user input into a safe query for the dialect's search syntax.
+        Returns None when the input has no searchable term.
+        """
+        terms = tokenize(text)
+        if not terms:
+            return None
+        if dialect_name == "sqlite":
+            return " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+        return " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+
+    def apply(self, statement: Select, dialect_name: str) -> tuple[Select, Any]:
+        """
+        Restrict the statement to the rows matching the `q` bind parameter.
+        Returns the statement and the expression to order it by relevance.
+        """
+        table_name = self.table.name
+        if dialect_name == "sqlite":
+            fts = sqlalchemy.table(self.fts_table, sqlalchemy.column("rowid"))
+            fts_name: ColumnClause[Any] = literal_column(self.fts_table)
+            statement = statement.join(
+                fts, fts.c.rowid == literal_column(f"{table_name}.rowid")
+            ).where(fts_name.op("MATCH")(bindparam(SEARCH_PARAMETER)))
+            # bm25 is lower for better matches
+            return statement, func.bm25(fts_name)
+
+        if dialect_name == "postgresql":
+            vector: ColumnClause[Any] = literal_column(
+                f"{table_name}.{self.vector_column}"
+            )
+            query = func.to_tsquery(
+                literal_column("'simple'::regconfig"), bindparam(SEARCH_PARAMETER)
+            )
+            statement = statement.where(vector.op("@@")(query))
+            return statement, desc(func.ts_rank(vector, query))
+
+        raise NotImplementedError(
+            f"Full-text search is not supported on {dialect_name}"
+        )
+
+    def _create_index(
+        self, target: sqlalchemy.Table, connection: sqlalchemy.Connection, **kwargs: Any
+    ) -> None:
+        dialect_name = connection.dialect.name
+        if dialect_name == "sqlite":
+            columns = ", ".join(self.columns)
+            script_values = dict(
+                fts_table=self.fts_table,
+                table_name=self.table.name,
+                columns=columns,
+                new_columns=", ".join(f"new.{column}" for column in self.columns),
+                old_columns=", ".join(f"old.{column}" for column in self.columns),
+            )
+            for script in (
+                SQLITE_FTS_TABLE,
+                SQLITE_FTS_INSERT_TRIGGER,
+                SQLITE_FTS_DELETE_TRIGGER,
+                SQLITE_FTS_UPDATE_TRIGGER,
+            ):
+                connection.execute(sqlalchemy.DDL(script.format(**script_values)))
+        elif dialect_name == "postgresql":
+            vector_expression = " || ".join(
+                f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+                for column, weight in zip(self.columns, POSTGRES_WEIGHTS)
+            )
+            script_values = dict(
+                table_name=self.table.name,
+                vector_column=self.vector_column,
+                vector_expression=vector_expression,
+            )
+            connection.execute(
+                sqlalchemy.DDL(POSTGRES_TSVECTOR_COLUMN.format(**script_values))
+            )
+            connection.execute(
+                sqlalchemy.DDL(POSTGRES_TSVECTOR_INDEX.format(**script_values))
+            )
+
+    def _drop_index(
+        self, target: sqlalchemy.Table, connection: sqlalchemy.Connection, **kwargs: Any
+    ) -> None:
+        if connection.dialect.name == "sqlite":
+            connection.execute(
+                sqlalchemy.DDL(SQLITE_FTS_DROP_TABLE.format(fts_table=self.fts_table))
+            )
@@ -0,0 +1,105 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Callable, Generic, List, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.SqlAlchemyAbstractRepository import (
+    Entity,
+    SqlAlchemyAbstractRepository,
+)
+
+logger = logging.getLogger("db")
+
+
+class GroupCommitBuffer(Generic[Entity]):
+    """
+    Coalesce concurrent saves: the entities saved within `window_ms` (or until
+    `max_batch` are waiting) are written with one multi-row insert and one commit.
+
+    Every caller gets its own saved entity back. When a batch fails, its entities
+    are retried one transaction each, so a caller only sees its own error.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        repository_factory: Callable[
+            [AsyncSession], SqlAlchemyAbstractRepository[Entity, Any]
+        ],
+        window_ms: float,
+        max_batch: int,
+    ) -> None:
+        self._session_maker = session_maker
+        self._repository_factory = repository_factory
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+        self._pending: List[Tuple[Entity, asyncio.Future[Entity]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: Set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    async def save(self, entity: Entity) -> Entity:
+        if self._closed:
+            raise RuntimeError("The write buffer is stopped")
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Entity] = loop.create_future()
+        self._pending.append((entity, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            # The flush must not run in the context (query stats...) of this request
+            self._timer = loop.call_later(
+                self.window, self._flush, context=contextvars.Context()
+            )
+        # A cancelled caller doesn't cancel the write of the whole batch
+        return await asyncio.shield(future)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        # `save` only returns once the batch of the entity is committed
+        callback()
+
+    async def stop(self) -> None:
+        """
+        Write the pending entities and wait for the writes in progress.
+        """
+        self._closed = True
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        write = asyncio.create_task(self._write(batch), context=contextvars.Context())
+        self._writes.add(write)
+        write.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[Entity, asyncio.Future[Entity]]]) -> None:
+        try:
+            async with self._session_maker() as session, session.begin():
+                repository = self._repository_factory(session)
+                saved = await repository.save_many([entity for entity, _ in batch])
+        except Exception as exception:
+            if len(batch) == 1:
+                batch[0][1].set_exception(exception)
+                return
+            logger.warning(
+                "Group commit of %s entities failed, writing them one by one: %s",
+                len(batch),
+                exception,
+            )
+            for item in batch:
+                await self._write([item])
+            return
+
+        for (_, future), entity in zip(batch, saved):
+            future.set_result(entity)
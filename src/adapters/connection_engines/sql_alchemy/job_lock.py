@@ -0,0 +1,172 @@
+import asyncio
+import hashlib
+import logging
+import os
+import socket
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.models import JobLockModel
+
+logger = logging.getLogger("jobs")
+
+
+class JobLockLost(Exception):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __str__(self):
+        return f"The lease of job {self.name} could not be renewed"
+
+
+class JobLock:
+    """
+    Lock letting a single process (of all the workers and hosts sharing the
+    database) run a job at a time. Nobody waits for it: `hold` tells whether it
+    was acquired.
+    - PostgreSQL: a session advisory lock, held by a dedicated connection
+    - SQLite: a lease row in `job_locks`, which expires after `ttl` seconds so a
+      process that died holding it does not block the job forever. The holder
+      renews it every `ttl / 3` seconds while the job runs; when it can't before
+      the lease expires, another process may take the job over, so the job is
+      cancelled and `hold` raises JobLockLost.
+    """
+
+    def __init__(
+        self, session_maker: async_sessionmaker[AsyncSession | Any], ttl: float
+    ) -> None:
+        self._session_maker = session_maker
+        self.ttl = ttl
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+    @asynccontextmanager
+    async def hold(self, name: str) -> AsyncIterator[bool]:
+        engine = self._session_maker.kw["bind"]
+        if engine.dialect.name == "postgresql":
+            async with self._hold_advisory_lock(engine, name) as acquired:
+                yield acquired
+            return
+
+        if not await self._acquire_lease(name):
+            yield False
+            return
+
+        holder = asyncio.current_task()
+        assert holder is not None
+        lost: list[bool] = []
+        heartbeat = asyncio.create_task(
+            self._keep_lease(name, holder, lost), name=f"job-lock-{name}"
+        )
+        try:
+            yield True
+        except asyncio.CancelledError:
+            # Like asyncio.timeout: only the cancellation the heartbeat asked for
+            # becomes JobLockLost, a shutdown still cancels the job
+            if lost and holder.uncancel() == 0:
+                raise JobLockLost(name) from None
+            raise
+        finally:
+            heartbeat.cancel()
+            await self._release_lease(name)
+
+    @staticmethod
+    @asynccontextmanager
+    async def _hold_advisory_lock(engine: Any, name: str) -> AsyncIterator[bool]:
+        key = int.from_bytes(
+            hashlib.sha256(name.encode()).digest()[:8], "big", signed=True
+        )
+        # Autocommit: the connection holds the lock without staying in a transaction
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            acquired = bool(
+                await connection.scalar(
+                    text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+                )
+            )
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    await connection.execute(
+                        text("SELECT pg_advisory_unlock(:key)"), {"key": key}
+                    )
+
+    async def _keep_lease(
+        self, name: str, holder: asyncio.Task, lost: list[bool]
+    ) -> None:
+        """
+        Renew the lease until cancelled. A failed renewal is retried at the next
+        beat while the lease is still valid; once it is taken over or expired,
+        the holder is cancelled.
+        """
+        interval = self.ttl / 3
+        expires_at = time.monotonic() + self.ttl
+        while True:
+            await asyncio.sleep(interval)
+            renewal_start = time.monotonic()
+            try:
+                renewed: bool | None = await self._renew_lease(name)
+            except SQLAlchemyError as exception:
+                logger.warning("Job %s lease renewal failed: %s", name, exception)
+                renewed = None
+
+            if renewed:
+                expires_at = renewal_start + self.ttl
+            elif renewed is False or time.monotonic() + interval >= expires_at:
+                logger.error("Job %s lost its lease, cancel it", name)
+                lost.append(True)
+                holder.cancel()
+                return
+
+    async def _acquire_lease(self, name: str) -> bool:
+        now = datetime.now(timezone.utc)
+        values = dict(
+            name=name, owner=self.owner, expires_at=now + timedelta(seconds=self.ttl)
+        )
+        # Take the lease unless another owner holds an unexpired one
+        statement = (
+            sqlite_insert(JobLockModel)
+            .values(**values)
+            .on_conflict_do_update(
+                index_elements=[JobLockModel.name],
+                set_=dict(owner=values["owner"], expires_at=values["expires_at"]),
+                where=JobLockModel.expires_at < now,
+            )
+        )
+        async with self._session_maker() as session, session.begin():
+            await session.execute(statement)
+            owner = await session.scalar(
+                select(JobLockModel.owner).where(JobLockModel.name == name)
+            )
+        return owner == self.owner
+
+    async def _renew_lease(self, name: str) -> bool:
+        """
+        Extend the lease if this process still owns it, returns whether it does.
+        """
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        async with self._session_maker() as session, session.begin():
+            result = await session.execute(
+                update(JobLockModel)
+                .where(JobLockModel.name == name, JobLockModel.owner == self.owner)
+                .values(expires_at=expires_at)
+            )
+        return bool(result.rowcount)  # type: ignore[union-attr]
+
+    async def _release_lease(self, name: str) -> None:
+        async with self._session_maker() as session, session.begin():
+            await session.execute(
+                delete(JobLockModel).where(
+                    JobLockModel.name == name, JobLockModel.owner == self.owner
+                )
+            )
@@ -1,16 +1,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text, Uuid
+import sqlalchemy
+from sqlalchemy import DateTime, Index, Integer, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column
 
 from adapters.connection_engines.sql_alchemy.base import Base
+from adapters.connection_engines.sql_alchemy.full_text_search import FullTextSearch
 
 
-class TaskModel(Base):
-    """SQLAlchemy model for Task table."""
-
-    __tablename__ = "tasks"
+class TaskColumns:
+    """Columns of a task, shared by the hot and the archive tables."""
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -20,3 +20,70 @@ class TaskModel(Base):
     due_date: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    overdue_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class TaskModel(TaskColumns, Base):
+    """SQLAlchemy model for Task table."""
+
+    __tablename__ = "tasks"
+    __table_args__ = (
+        # Change feed: keyset pagination on the (updated_at, id) position
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        # Archival: the completed tasks last updated before a date
+        Index("ix_tasks_status_updated_at", "status", "updated_at"),
+    )
+
+
+class TaskTombstoneModel(Base):
+    """Removal of a task, reported by the change feed after the task is gone."""
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        # Change feed: keyset pagination on the (removed_at, id) position
+        Index("ix_task_tombstones_removed_at_id", "removed_at", "id"),
+    )
+
+    # A task created again with the same id can be removed twice
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+    removed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    reason: Mapped[str] = mapped_column(String(50), nullable=False)
+
+
+class TaskArchiveModel(TaskColumns, Base):
+    """Completed tasks moved out of the tasks table by the archival job."""
+
+    __tablename__ = "tasks_archive"
+
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=sqlalchemy.func.current_timestamp()
+    )
+
+
+class JobLockModel(Base):
+    """Lease of a background job, on databases without advisory locks."""
+
+    __tablename__ = "job_locks"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(200), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class IdempotencyKeyModel(Base):
+    """Response of a request sent with an Idempotency-Key (pending while it runs)."""
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+task_search = FullTextSearch(TaskModel.__table__, columns=("title", "description"))  # type: ignore[arg-type]
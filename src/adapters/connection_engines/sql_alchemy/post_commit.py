@@ -0,0 +1,28 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Key of the session info holding the callbacks waiting for the commit
+POST_COMMIT_CALLBACKS = "post_commit_callbacks"
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """
+    Run the callback once the session's transaction is committed. It is dropped
+    if the transaction is rolled back instead.
+    """
+    session.info.setdefault(POST_COMMIT_CALLBACKS, []).append(callback)
+
+
+def _run_callbacks(session: Session) -> None:
+    for callback in session.info.pop(POST_COMMIT_CALLBACKS, []):
+        callback()
+
+
+def _drop_callbacks(session: Session) -> None:
+    session.info.pop(POST_COMMIT_CALLBACKS, None)
+
+
+event.listen(Session, "after_commit", _run_callbacks)
+event.listen(Session, "after_rollback", _drop_callbacks)
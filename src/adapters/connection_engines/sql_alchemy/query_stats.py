@@ -0,0 +1,95 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+
+@dataclass
+class QueryStats:
+    """Statements executed (and time spent in the database) for one unit of work."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def repeated_statements(self, threshold: int = 2) -> dict[str, int]:
+        """
+        Statements executed at least `threshold` times, the usual sign of an N+1.
+        """
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+@contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """
+    Collect every statement executed in the current context (e.g. one HTTP request).
+    """
+    stats = QueryStats()
+    token = _current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+
+def get_current_query_stats() -> QueryStats | None:
+    return _current_query_stats.get()
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    context._query_stats_start = time.perf_counter()  # type: ignore[attr-defined]
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    stats = _current_query_stats.get()
+    if stats is None:
+        return
+    start = getattr(context, "_query_stats_start", None)
+    duration = time.perf_counter() - start if start is not None else 0.0
+    stats.record(statement, duration)
+
+
+def register_query_stats_listeners(engine: Engine) -> None:
+    """
+    Attach the accounting listeners to a (sync) engine.
+    For an AsyncEngine, pass `async_engine.sync_engine`.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
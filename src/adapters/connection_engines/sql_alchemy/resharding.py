@@ -0,0 +1,81 @@
+import logging
+from typing import Any, Callable, Sequence
+from uuid import UUID
+
+import sqlalchemy
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.models import (
+    TaskArchiveModel,
+    TaskModel,
+    TaskTombstoneModel,
+)
+
+logger = logging.getLogger("db")
+
+SessionMaker = async_sessionmaker[AsyncSession | Any]
+
+# The tables moved between shards, all sharded by the task id
+SHARDED_TABLES: tuple[sqlalchemy.Table, ...] = (
+    TaskModel.__table__,  # type: ignore[assignment]
+    TaskArchiveModel.__table__,  # type: ignore[assignment]
+    TaskTombstoneModel.__table__,  # type: ignore[assignment]
+)
+
+
+def _insert_skipping_copied(
+    table: sqlalchemy.Table, dialect_name: str
+) -> sqlalchemy.Insert:
+    """
+    An insert leaving the rows already in the table alone, so an interrupted
+    copy can run again.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    return sqlite.insert(table).on_conflict_do_nothing()
+
+
+async def copy_shard_rows(
+    sources: Sequence[SessionMaker],
+    targets: Sequence[SessionMaker],
+    shard_of: Callable[[UUID], int],
+    batch_size: int = 5000,
+) -> int:
+    """
+    Copy the rows of the sharded tables from the source databases to the target
+    shards, each row to the target `shard_of` its id, `batch_size` rows per read
+    (in primary key order) and one transaction per target and batch. The sources
+    are left untouched. Returns the number of rows read.
+    """
+    copied = 0
+    for table in SHARDED_TABLES:
+        primary_key = list(table.primary_key.columns)
+        for source in sources:
+            after: tuple[Any, ...] | None = None
+            while True:
+                query = select(table).order_by(*primary_key).limit(batch_size)
+                if after is not None:
+                    query = query.where(tuple_(*primary_key) > tuple_(*after))
+                async with source() as session:
+                    rows = [
+                        dict(row) for row in (await session.execute(query)).mappings()
+                    ]
+                if not rows:
+                    break
+
+                rows_by_shard: dict[int, list[dict[str, Any]]] = {}
+                for row in rows:
+                    rows_by_shard.setdefault(shard_of(row["id"]), []).append(row)
+                for index, shard_rows in rows_by_shard.items():
+                    async with targets[index]() as session, session.begin():
+                        insert = _insert_skipping_copied(
+                            table, session.get_bind().dialect.name
+                        )
+                        await session.execute(insert, shard_rows)
+
+                copied += len(rows)
+                after = tuple(rows[-1][column.key] for column in primary_key)
+                logger.info("Copied %s rows of %s up to %s", copied, table.name, after)
+    return copied
@@ -1,12 +1,88 @@
-from typing import Any
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Any, Mapping
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from adapters.connection_engines.sql_alchemy.deadlines import (
+    register_deadline_listeners,
+)
+from adapters.connection_engines.sql_alchemy.query_stats import (
+    register_query_stats_listeners,
+)
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from adapters.connection_engines.sql_alchemy.sqlite_profile import (
+    register_sqlite_pragmas,
+)
 from drivers.config.settings import BaseSettings
 
 
-def get_session_maker(settings: BaseSettings) -> async_sessionmaker[AsyncSession | Any]:
-    engine = create_async_engine(settings.database_url, echo=True)
+def get_session_maker(
+    settings: BaseSettings,
+    slow_query_log: SlowQueryLog | None = None,
+    database_url: str | None = None,
+) -> async_sessionmaker[AsyncSession | Any]:
+    """
+    The session maker of the application database, or of another database
+    (e.g. a shard) with the same engine settings.
+    """
+    return _create_session_maker(
+        database_url or settings.database_url,
+        slow_query_log,
+        pragmas=settings.sqlite_pragmas,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+
+
+def get_single_writer_session_makers(
+    settings: BaseSettings, slow_query_log: SlowQueryLog | None = None
+) -> tuple[
+    async_sessionmaker[AsyncSession | Any], async_sessionmaker[AsyncSession | Any]
+]:
+    """
+    The (writer, readers) session makers of the SQLite database: one read-write
+    connection, and a pool of read-only connections.
+    """
+    writer = _create_session_maker(
+        settings.database_url,
+        slow_query_log,
+        pragmas=settings.sqlite_pragmas,
+        pool_size=1,
+        max_overflow=0,
+    )
+    # A read-only connection can't change the journal mode, the writer sets it
+    reader_pragmas = dict(settings.sqlite_pragmas)
+    reader_pragmas.pop("journal_mode", None)
+    readers = _create_session_maker(
+        settings.database_read_only_url,
+        slow_query_log,
+        pragmas=reader_pragmas,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    return writer, readers
+
+
+def _create_session_maker(
+    database_url: str,
+    slow_query_log: SlowQueryLog | None,
+    pragmas: Mapping[str, Any],
+    pool_size: int,
+    max_overflow: int,
+) -> async_sessionmaker[AsyncSession | Any]:
+    engine = create_async_engine(
+        database_url,
+        echo=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+    register_sqlite_pragmas(engine.sync_engine, pragmas)
+    register_query_stats_listeners(engine.sync_engine)
+    register_deadline_listeners(engine.sync_engine)
+    if slow_query_log is not None:
+        slow_query_log.register(engine.sync_engine)
 
     return async_sessionmaker(
         bind=engine,
@@ -15,3 +91,28 @@ def get_session_maker(settings: BaseSettings) -> async_sessionmaker[AsyncSession
         autoflush=False,
         autocommit=False,
     )
+
+
+async def warm_up_pool(
+    session_maker: async_sessionmaker[AsyncSession | Any], connections: int
+) -> None:
+    """
+    Open `connections` pooled connections at once so they are established before
+    the first request, then give them back to the pool.
+    """
+    engine = session_maker.kw["bind"]
+    async with AsyncExitStack() as stack:
+        opened = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+        )
+        for connection in opened:
+            await connection.execute(text("SELECT 1"))
+
+
+async def dispose_session_maker(
+    session_maker: async_sessionmaker[AsyncSession | Any],
+) -> None:
+    """
+    Close every pooled connection of the session maker's engine.
+    """
+    await session_maker.kw["bind"].dispose()
@@ -0,0 +1,216 @@
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Iterator, List
+
+import greenlet  # type: ignore[import-untyped]
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExecutionContext
+
+logger = logging.getLogger("db.slow_queries")
+
+# Statements we know how to EXPLAIN without executing them
+EXPLAINABLE_STATEMENTS = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+# Dialects where a failed statement aborts the transaction it runs in
+SAVEPOINT_DIALECTS = ("postgresql",)
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+REDACTED = "<redacted>"
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: Any
+    duration_ms: float
+    route: str | None
+    use_case: str | None
+    plan: List[str]
+    logged_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SlowQueryLog:
+    """
+    Log the statements slower than `threshold_ms` with their plan.
+
+    At most `rate_limit` statements are logged (and explained) per `rate_window`
+    seconds, the others are only counted in `suppressed`.
+    When `buffer_size` is positive, the last logged statements are also kept in memory.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        rate_limit: int = 10,
+        rate_window: float = 60.0,
+        buffer_size: int = 0,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.buffer: deque[SlowQuery] | None = (
+            deque(maxlen=buffer_size) if buffer_size > 0 else None
+        )
+        self.suppressed = 0
+        self._window_start = 0.0
+        self._window_count = 0
+        self._lock = threading.Lock()
+
+    def register(self, engine: Engine) -> None:
+        """
+        Attach the listeners to a (sync) engine.
+        For an AsyncEngine, pass `async_engine.sync_engine`.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def recent(self) -> List[SlowQuery]:
+        return list(self.buffer) if self.buffer is not None else []
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        context._slow_query_start = time.perf_counter()  # type: ignore[attr-defined]
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        start = getattr(context, "_slow_query_start", None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < self.threshold_ms or not self._acquire():
+            return
+
+        route, use_case = _find_origin()
+        slow_query = SlowQuery(
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            duration_ms=duration_ms,
+            route=route,
+            use_case=use_case,
+            plan=[] if executemany else _explain(conn, statement, parameters),
+        )
+        if self.buffer is not None:
+            self.buffer.append(slow_query)
+
+        logger.warning(
+            "Slow query (%.2f ms) route=%s use_case=%s\n%s\nparameters=%s\nplan:\n%s",
+            slow_query.duration_ms,
+            slow_query.route,
+            slow_query.use_case,
+            slow_query.statement,
+            slow_query.parameters,
+            "\n".join(slow_query.plan),
+        )
+
+    def _acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            if self._window_count >= self.rate_limit:
+                self.suppressed += 1
+                return False
+            self._window_count += 1
+            return True
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Keep the shape and the types of the bound parameters, never their values.
+    """
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    return _redact(parameters)
+
+
+def _redact(value: Any) -> str:
+    if value is None:
+        return "None"
+    return f"{REDACTED}:{type(value).__name__}"
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> List[str]:
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith(
+        EXPLAINABLE_STATEMENTS
+    ):
+        return []
+
+    # The EXPLAIN runs in the request's transaction: in a savepoint where a failed
+    # statement would abort it, so the request's next statements still run
+    savepoint = conn.dialect.name in SAVEPOINT_DIALECTS and conn.in_transaction()
+    # Use a dedicated cursor so the result of the original statement stays untouched
+    cursor = conn.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+    try:
+        if savepoint:
+            cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = [str(row[-1]) for row in cursor.fetchall()]
+        except conn.dialect.loaded_dbapi.Error as exception:
+            if savepoint:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            plan = [f"EXPLAIN failed: {exception}"]
+        if savepoint:
+            cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        return plan
+    finally:
+        cursor.close()
+
+
+def _find_origin() -> tuple[str | None, str | None]:
+    """
+    Find the route handler and the use case that issued the current statement.
+    """
+    route = use_case = None
+    for frame in _calling_frames():
+        module = frame.f_globals.get("__name__", "")
+        if use_case is None and module.startswith("use_cases."):
+            use_case = f"{module}.{frame.f_code.co_qualname}"
+        elif route is None and module.startswith("drivers.api."):
+            route = f"{module}.{frame.f_code.co_qualname}"
+            break
+    return route, use_case
+
+
+def _calling_frames() -> Iterator[FrameType]:
+    """
+    Walk the call stack, following the greenlets SQLAlchemy uses to run the
+    sync engine under asyncio back to the awaiting coroutines.
+    """
+    frame: FrameType | None = sys._getframe(1)
+    current: greenlet.greenlet | None = greenlet.getcurrent()
+    while frame is not None or current is not None:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent if current is not None else None
+        frame = current.gr_frame if current is not None else None
@@ -0,0 +1,27 @@
+from typing import Any, Mapping
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def register_sqlite_pragmas(engine: Engine, pragmas: Mapping[str, Any]) -> None:
+    """
+    Apply the pragmas (name -> value) to each new connection of a SQLite engine.
+    They are set in the given order, before the connection runs any statement.
+    """
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    # Values come from the settings, not from requests: safe to inline (PRAGMA
+    # takes no bind parameters)
+    statements = [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+    def apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", apply_pragmas)
@@ -16,3 +16,61 @@ BEFORE UPDATE ON {table_name}
 FOR EACH ROW
 EXECUTE FUNCTION update_updated_at_column();
 """
+
+# Full-text search: SQLite FTS5 index kept in sync with triggers
+
+SQLITE_FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}
+USING fts5({columns}, content='{table_name}', content_rowid='rowid');
+"""
+
+SQLITE_FTS_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {fts_table}_after_insert AFTER INSERT ON {table_name}
+BEGIN
+    INSERT INTO {fts_table}(rowid, {columns}) VALUES (new.rowid, {new_columns});
+END;
+"""
+
+SQLITE_FTS_DELETE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {fts_table}_after_delete AFTER DELETE ON {table_name}
+BEGIN
+    INSERT INTO {fts_table}({fts_table}, rowid, {columns})
+    VALUES ('delete', old.rowid, {old_columns});
+END;
+"""
+
+SQLITE_FTS_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS {fts_table}_after_update
+AFTER UPDATE OF {columns} ON {table_name}
+BEGIN
+    INSERT INTO {fts_table}({fts_table}, rowid, {columns})
+    VALUES ('delete', old.rowid, {old_columns});
+    INSERT INTO {fts_table}(rowid, {columns}) VALUES (new.rowid, {new_columns});
+END;
+"""
+
+SQLITE_FTS_DROP_TABLE = "DROP TABLE IF EXISTS {fts_table};"
+
+# Index the rows of the content table, e.g. those written before the index existed
+SQLITE_FTS_REBUILD = "INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild');"
+
+# event: insert, delete or update
+SQLITE_FTS_DROP_TRIGGER = "DROP TRIGGER IF EXISTS {fts_table}_after_{event};"
+
+# Full-text search: PostgreSQL generated tsvector column with a GIN index
+
+POSTGRES_TSVECTOR_COLUMN = """
+ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {vector_column} tsvector
+GENERATED ALWAYS AS ({vector_expression}) STORED;
+"""
+
+POSTGRES_TSVECTOR_INDEX = """
+CREATE INDEX IF NOT EXISTS ix_{table_name}_{vector_column}
+ON {table_name} USING GIN ({vector_column});
+"""
+
+POSTGRES_TSVECTOR_DROP_INDEX = "DROP INDEX IF EXISTS ix_{table_name}_{vector_column};"
+
+POSTGRES_TSVECTOR_DROP_COLUMN = (
+    "ALTER TABLE {table_name} DROP COLUMN IF EXISTS {vector_column};"
+)
@@ -0,0 +1,100 @@
+import asyncio
+import contextvars
+import logging
+from typing import Any, Awaitable, Callable, List, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger("db")
+
+Result = TypeVar("Result")
+Write = Callable[[AsyncSession], Awaitable[Any]]
+QueuedWrite = Tuple[Write, "asyncio.Future[Any]"]
+
+
+class WriteQueue:
+    """
+    Serialize the writes of all the callers on one writer: the writes queued while
+    a transaction runs are run together in the next one, up to `max_batch` of them,
+    so concurrent callers never wait for the database lock, and share the commits.
+
+    Every caller gets the result of its own write back once it is committed. When
+    a batch fails, its writes are retried one transaction each, so a caller only
+    sees its own error.
+    """
+
+    def __init__(
+        self, session_maker: async_sessionmaker[AsyncSession], max_batch: int
+    ) -> None:
+        self._session_maker = session_maker
+        self.max_batch = max_batch
+
+        self._queue: asyncio.Queue[QueuedWrite | None] = asyncio.Queue()
+        self._writer: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def submit(
+        self, write: Callable[[AsyncSession], Awaitable[Result]]
+    ) -> Result:
+        """
+        Queue a write, given the writer's session, and return its result.
+        """
+        if self._closed:
+            raise RuntimeError("The write queue is stopped")
+        if self._writer is None:
+            # The writer must not run in the context (query stats...) of this request
+            self._writer = asyncio.create_task(
+                self._run(), context=contextvars.Context()
+            )
+
+        future: asyncio.Future[Result] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((write, future))
+        # A cancelled caller doesn't cancel the writes it is batched with
+        return await asyncio.shield(future)
+
+    async def stop(self) -> None:
+        """
+        Run the queued writes, then stop the writer.
+        """
+        self._closed = True
+        if self._writer is None:
+            return
+        self._queue.put_nowait(None)
+        await self._writer
+        self._writer = None
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[QueuedWrite] = []
+            item = await self._queue.get()
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch or self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: List[QueuedWrite]) -> None:
+        try:
+            async with self._session_maker() as session, session.begin():
+                results = [await write(session) for write, _ in batch]
+        except Exception as exception:
+            if len(batch) == 1:
+                batch[0][1].set_exception(exception)
+                return
+            logger.warning(
+                "Transaction of %s queued writes failed, running them one by one: %s",
+                len(batch),
+                exception,
+            )
+            for item in batch:
+                await self._write([item])
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Callable, Set
+
+from domain.value_objects.task_event import TaskEvent
+from ports.task_event_publisher_interface import TaskEventPublisherInterface
+
+logger = logging.getLogger("app")
+
+EventFilter = Callable[[TaskEvent], bool]
+
+
+class Subscription:
+    """
+    The events of one subscriber, buffered in a bounded queue.
+    """
+
+    def __init__(
+        self,
+        broker: "InMemoryEventBroker",
+        event_filter: EventFilter | None,
+        max_queue_size: int,
+    ) -> None:
+        self._broker = broker
+        self._filter = event_filter
+        self._queue: asyncio.Queue[TaskEvent | None] = asyncio.Queue(max_queue_size)
+        self.closed = False
+        # True when the subscriber was dropped for not keeping up
+        self.evicted = False
+
+    def matches(self, event: TaskEvent) -> bool:
+        return self._filter is None or self._filter(event)
+
+    async def get(self) -> TaskEvent | None:
+        """
+        Wait for the next event. Returns None once the subscription is closed.
+        """
+        if self.closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._broker._subscriptions.discard(self)
+        # Wake up the reader: drop the backlog if needed to make room for the end
+        if self._queue.full():
+            self._drain()
+        self._queue.put_nowait(None)
+
+    def _push(self, event: TaskEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Evicting a slow event subscriber (%s events queued)",
+                self._queue.qsize(),
+            )
+            self.evicted = True
+            self._drain()
+            self.close()
+
+    def _drain(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+
+class InMemoryEventBroker(TaskEventPublisherInterface):
+    """
+    In-process pub/sub: every event is pushed to the queue of each matching
+    subscriber. A subscriber whose queue is full is evicted rather than slowing
+    down the publisher or growing memory without bound.
+
+    Subscribers only receive the events published by their own process.
+    """
+
+    def __init__(self, max_queue_size: int = 100) -> None:
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, event_filter: EventFilter | None = None) -> Subscription:
+        subscription = Subscription(self, event_filter, self.max_queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def publish(self, event: TaskEvent) -> None:
+        # Copy: evictions change the set while iterating
+        for subscription in list(self._subscriptions):
+            if subscription.matches(event):
+                subscription._push(event)
@@ -0,0 +1,223 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.models import IdempotencyKeyModel
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    request_hash: str
+    status_code: int
+    body: str
+    expires_at: datetime
+
+
+class IdempotencyKeyReused(Exception):
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def __str__(self):
+        return f"Idempotency-Key {self.key} was already used for another request"
+
+
+class IdempotencyKeyInProgress(Exception):
+    def __init__(self, key: str, retry_after: float) -> None:
+        self.key = key
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return f"A request with Idempotency-Key {self.key} is still in progress"
+
+
+class SqlAlchemyIdempotencyStore:
+    """
+    Responses of the requests sent with an idempotency key, kept `ttl` seconds:
+    - an in-process LRU of the latest responses, replayed without a query
+    - the idempotency_keys table, shared by the workers and kept across restarts
+
+    The first request of a key reserves it (a pending row, expiring after
+    `lock_ttl` in case its worker dies). Concurrent requests with the same key wait
+    for its response instead of running again: on an in-process future, or by
+    polling the row when the first request runs on another worker.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession | Any],
+        ttl: float,
+        lock_ttl: float,
+        cache_size: int,
+        wait_timeout: float,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.session_maker = session_maker
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.cache_size = cache_size
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._cache: OrderedDict[str, StoredResponse] = OrderedDict()
+        # key -> response of the request running in this process (None if it failed)
+        self._in_flight: Dict[str, asyncio.Future[StoredResponse | None]] = {}
+
+    async def reserve(self, key: str, request_hash: str) -> StoredResponse | None:
+        """
+        Return the stored response of the key, waiting for it while the key is in
+        progress. Returns None when the key is reserved for the caller, who must
+        then `complete` or `release` it.
+        """
+        while True:
+            stored = self._cached(key)
+            if stored is not None:
+                return self._check(key, stored, request_hash)
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                # Shielded: a waiter giving up must not cancel the others
+                stored = await asyncio.shield(in_flight)
+                if stored is not None:
+                    return self._check(key, stored, request_hash)
+                # The request failed: the retries may run it again
+                continue
+
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            try:
+                stored = await self._reserve_row(key, request_hash)
+            except BaseException:
+                self._resolve(key, None)
+                raise
+            if stored is None:
+                return None
+            self._remember(key, stored)
+            self._resolve(key, stored)
+            return self._check(key, stored, request_hash)
+
+    async def complete(
+        self, key: str, request_hash: str, status_code: int, body: str
+    ) -> None:
+        stored = StoredResponse(
+            request_hash=request_hash,
+            status_code=status_code,
+            body=body,
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=self.ttl),
+        )
+        self._remember(key, stored)
+        self._resolve(key, stored)
+        async with self.session_maker() as session, session.begin():
+            await session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key)
+                .values(
+                    status_code=status_code, body=body, expires_at=stored.expires_at
+                )
+            )
+
+    async def release(self, key: str) -> None:
+        """
+        Give up a reservation: the request failed and may be retried.
+        """
+        self._resolve(key, None)
+        async with self.session_maker() as session, session.begin():
+            await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.key == key,
+                    IdempotencyKeyModel.status_code.is_(None),
+                )
+            )
+
+    async def purge_expired(self) -> int:
+        """
+        Delete the expired keys. Returns the number of keys deleted.
+        """
+        async with self.session_maker() as session, session.begin():
+            result = await session.execute(
+                delete(IdempotencyKeyModel).where(
+                    IdempotencyKeyModel.expires_at < datetime.now(timezone.utc)
+                )
+            )
+        return result.rowcount  # type: ignore[union-attr]
+
+    async def _reserve_row(self, key: str, request_hash: str) -> StoredResponse | None:
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            now = datetime.now(timezone.utc)
+            async with self.session_maker() as session, session.begin():
+                await session.execute(
+                    delete(IdempotencyKeyModel).where(
+                        IdempotencyKeyModel.key == key,
+                        IdempotencyKeyModel.expires_at < now,
+                    )
+                )
+                reserved = await session.execute(
+                    self._insert_if_absent(session).values(
+                        key=key,
+                        request_hash=request_hash,
+                        expires_at=now + timedelta(seconds=self.lock_ttl),
+                    )
+                )
+                if reserved.rowcount == 1:  # type: ignore[union-attr]
+                    return None
+                row = await session.scalar(
+                    select(IdempotencyKeyModel).where(IdempotencyKeyModel.key == key)
+                )
+
+            if row is not None and row.status_code is not None:
+                return StoredResponse(
+                    request_hash=row.request_hash,
+                    status_code=row.status_code,
+                    body=row.body or "",
+                    # SQLite returns the naive UTC datetimes it stores
+                    expires_at=(
+                        row.expires_at
+                        if row.expires_at.tzinfo is not None
+                        else row.expires_at.replace(tzinfo=timezone.utc)
+                    ),
+                )
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgress(key, retry_after=1)
+            # In progress on another worker
+            await asyncio.sleep(self.poll_interval)
+
+    @staticmethod
+    def _insert_if_absent(session: AsyncSession) -> Any:
+        dialect = session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        return insert(IdempotencyKeyModel).on_conflict_do_nothing(
+            index_elements=[IdempotencyKeyModel.key]
+        )
+
+    def _cached(self, key: str) -> StoredResponse | None:
+        stored = self._cache.get(key)
+        if stored is None:
+            return None
+        if stored.expires_at <= datetime.now(timezone.utc):
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return stored
+
+    def _remember(self, key: str, stored: StoredResponse) -> None:
+        self._cache[key] = stored
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _resolve(self, key: str, stored: StoredResponse | None) -> None:
+        future = self._in_flight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(stored)
+
+    @staticmethod
+    def _check(key: str, stored: StoredResponse, request_hash: str) -> StoredResponse:
+        if stored.request_hash != request_hash:
+            raise IdempotencyKeyReused(key)
+        return stored
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.group_commit import GroupCommitBuffer
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Task
+from ports.task_writer_interface import TaskWriterInterface
+
+
+class BufferedTaskWriter(GroupCommitBuffer[Task], TaskWriterInterface):
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        window_ms: float,
+        max_batch: int,
+    ) -> None:
+        super().__init__(
+            session_maker,
+            SqlAlchemyTaskRepository,
+            window_ms=window_ms,
+            max_batch=max_batch,
+        )
@@ -6,6 +6,8 @@ from ports.task_repository_interface import TaskRepositoryInterface
 
 
 class InMemoryTaskRepository(InMemoryAbstractRepository[Task], TaskRepositoryInterface):
+    searchable_fields = ("title", "description")
+
     def _get_filters(self, entity: Task, **filters) -> bool:
         if "id_filter" in filters and entity.id != filters["id_filter"]:
             return False
@@ -16,4 +18,30 @@ class InMemoryTaskRepository(InMemoryAbstractRepository[Task], TaskRepositoryInt
             and entity.priority != filters["priority_filter"]
         ):
             return False
+        if (
+            "status_not_filter" in filters
+            and entity.status == filters["status_not_filter"]
+        ):
+            return False
+        if "id_in_filter" in filters and entity.id not in filters["id_in_filter"]:
+            return False
+        if "id_after_filter" in filters and not entity.id > filters["id_after_filter"]:
+            return False
+        if "id_up_to_filter" in filters and not entity.id <= filters["id_up_to_filter"]:
+            return False
+        if "due_before_filter" in filters and not (
+            entity.due_date is not None
+            and entity.due_date < filters["due_before_filter"]
+        ):
+            return False
+        if (
+            "updated_before_filter" in filters
+            and not entity.updated_at < filters["updated_before_filter"]
+        ):
+            return False
+        if (
+            "flagged_overdue_filter" in filters
+            and (entity.overdue_at is not None) != filters["flagged_overdue_filter"]
+        ):
+            return False
         return True
@@ -0,0 +1,289 @@
+import asyncio
+import hashlib
+import heapq
+from itertools import chain, zip_longest
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Iterable, List, Sequence, TypeVar
+from uuid import UUID, uuid4
+
+from adapters.connection_engines.sql_alchemy.full_text_search import SEARCH_PARAMETER
+from domain.entities.task import Task
+from domain.value_objects.change_feed import ChangePosition, Removal
+from domain.value_objects.ordering import Ordering
+from domain.value_objects.projection import Projection
+from ports.task_repository_interface import TaskRepositoryInterface
+
+Result = TypeVar("Result")
+Row = TypeVar("Row", Task, Projection)
+
+
+def shard_for(task_id: UUID, shard_count: int) -> int:
+    """
+    Index of the shard holding a task. A hash of the id rather than the id itself,
+    so ids that aren't random (e.g. time-ordered) still spread evenly.
+    """
+    digest = hashlib.blake2b(task_id.bytes, digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+def _sort_key(value: Any) -> tuple[bool, Any]:
+    # NULLs sort before any value, as on SQLite
+    return value is not None, value
+
+
+class ShardedTaskRepository(TaskRepositoryInterface):
+    """
+    Tasks spread over several repositories (one database each) by a hash of their id.
+    Writes and reads by id go to one shard; the other reads and writes run on all
+    the shards at once, their results merged. Each shard commits on its own: a
+    write spanning several shards is not atomic.
+    """
+
+    def __init__(self, shards: Sequence[TaskRepositoryInterface]) -> None:
+        if not shards:
+            raise ValueError("A sharded repository needs at least one shard")
+        self._shards = list(shards)
+
+    def shard(self, task_id: UUID) -> TaskRepositoryInterface:
+        return self._shards[shard_for(task_id, len(self._shards))]
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run the callback once every shard has committed.
+        """
+        pending = len(self._shards)
+
+        def shard_committed() -> None:
+            nonlocal pending
+            pending -= 1
+            if not pending:
+                callback()
+
+        for shard in self._shards:
+            shard.after_commit(shard_committed)
+
+    async def save(self, task: Task) -> Task:
+        if task.id is None:
+            # The id picks the shard, it can't be left to the database
+            task.id = uuid4()
+        return await self.shard(task.id).save(task)
+
+    async def save_many(self, tasks: Sequence[Task]) -> List[Task]:
+        positions = self._group_by_shard(tasks)
+        saved = await self._gather(
+            self._shards[index].save_many([tasks[position] for position in group])
+            for index, group in positions.items()
+        )
+        ordered: List[Task] = [None] * len(tasks)  # type: ignore[list-item]
+        for group, shard_saved in zip(positions.values(), saved):
+            for position, task in zip(group, shard_saved):
+                ordered[position] = task
+        return ordered
+
+    async def bulk_insert(self, tasks: Sequence[Task]) -> int:
+        positions = self._group_by_shard(tasks)
+        inserted = await self._gather(
+            self._shards[index].bulk_insert([tasks[position] for position in group])
+            for index, group in positions.items()
+        )
+        return sum(inserted)
+
+    async def get(
+        self,
+        **filters,
+    ) -> Task | None:
+        found = await self._gather(
+            shard.get(**shard_filters) for shard, shard_filters in self._route(filters)
+        )
+        return next((task for task in found if task is not None), None)
+
+    async def list_all(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "created_at",
+        ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
+        **filters,
+    ) -> List[Task]:
+        """
+        Every shard lists the first `page * limit` tasks in the requested order,
+        merged into the requested page.
+        """
+        pages = await self._gather(
+            shard.list_all(
+                page=1,
+                limit=page * limit,
+                order_by=order_by,
+                ordering=ordering,
+                include_archived=include_archived,
+                **shard_filters,
+            )
+            for shard, shard_filters in self._route(filters)
+        )
+        return self._merge_page(
+            pages, attrgetter(order_by), ordering, page, limit, filters
+        )
+
+    async def list_projected(
+        self,
+        fields: Sequence[str],
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "created_at",
+        ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
+        **filters,
+    ) -> List[Projection]:
+        # The sort key is needed to merge, even when it isn't requested
+        pages = await self._gather(
+            shard.list_projected(
+                [*fields, order_by],
+                page=1,
+                limit=page * limit,
+                order_by=order_by,
+                ordering=ordering,
+                include_archived=include_archived,
+                **shard_filters,
+            )
+            for shard, shard_filters in self._route(filters)
+        )
+        projections = self._merge_page(
+            pages, attrgetter(order_by), ordering, page, limit, filters
+        )
+        if order_by in fields or order_by == "id":
+            return projections
+        return [
+            Projection(
+                id=projection.id,
+                values={
+                    field: value
+                    for field, value in projection.values.items()
+                    if field != order_by
+                },
+            )
+            for projection in projections
+        ]
+
+    async def list_changes(
+        self,
+        since: ChangePosition | None = None,
+        limit: int = 100,
+    ) -> List[Task | Removal]:
+        changes = await self._gather(
+            shard.list_changes(since=since, limit=limit) for shard in self._shards
+        )
+        merged = heapq.merge(*changes, key=ChangePosition.of)
+        return list(merged)[:limit]
+
+    async def count(
+        self,
+        include_archived: bool = False,
+        **filters,
+    ) -> int:
+        counts = await self._gather(
+            shard.count(include_archived=include_archived, **shard_filters)
+            for shard, shard_filters in self._route(filters)
+        )
+        return sum(counts)
+
+    async def delete(
+        self,
+        **filters,
+    ) -> int:
+        deleted = await self._gather(
+            shard.delete(**shard_filters)
+            for shard, shard_filters in self._route(filters)
+        )
+        return sum(deleted)
+
+    async def archive(
+        self,
+        **filters,
+    ) -> int:
+        archived = await self._gather(
+            shard.archive(**shard_filters)
+            for shard, shard_filters in self._route(filters)
+        )
+        return sum(archived)
+
+    async def update(
+        self,
+        fields_to_update: dict[str, Any],
+        **filters,
+    ) -> int:
+        updated = await self._gather(
+            shard.update(fields_to_update, **shard_filters)
+            for shard, shard_filters in self._route(filters)
+        )
+        return sum(updated)
+
+    def _group_by_shard(self, tasks: Sequence[Task]) -> dict[int, List[int]]:
+        """
+        Positions of the tasks, by index of their shard.
+        """
+        positions: dict[int, List[int]] = {}
+        for position, task in enumerate(tasks):
+            if task.id is None:
+                task.id = uuid4()
+            index = shard_for(task.id, len(self._shards))
+            positions.setdefault(index, []).append(position)
+        return positions
+
+    def _route(
+        self, filters: dict[str, Any]
+    ) -> List[tuple[TaskRepositoryInterface, dict[str, Any]]]:
+        """
+        The shards that can hold tasks matching the filters, each with its filters:
+        one shard for an id, the shards of the ids for a list of ids, all otherwise.
+        """
+        if "id_filter" in filters:
+            return [(self.shard(filters["id_filter"]), filters)]
+        if "id_in_filter" in filters:
+            ids_by_shard: dict[int, List[UUID]] = {}
+            for task_id in filters["id_in_filter"]:
+                index = shard_for(task_id, len(self._shards))
+                ids_by_shard.setdefault(index, []).append(task_id)
+            return [
+                (self._shards[index], {**filters, "id_in_filter": ids})
+                for index, ids in ids_by_shard.items()
+            ]
+        return [(shard, filters) for shard in self._shards]
+
+    @staticmethod
+    def _merge_page(
+        pages: List[List[Row]],
+        key: Callable[[Row], Any],
+        ordering: Ordering,
+        page: int,
+        limit: int,
+        filters: dict[str, Any],
+    ) -> List[Row]:
+        """
+        The requested page of the shards' sorted results, merged k-way. Search
+        results are sorted by a rank the shards don't return: they are interleaved
+        by their position in each shard instead.
+        """
+        if filters.get(SEARCH_PARAMETER):
+            interleaved = chain.from_iterable(zip_longest(*pages))
+            merged: Iterable[Row] = (row for row in interleaved if row is not None)
+        else:
+            merged = heapq.merge(
+                *pages,
+                key=lambda row: _sort_key(key(row)),
+                reverse=ordering == Ordering.DESC,
+            )
+        start = (page - 1) * limit
+        return list(merged)[start : start + limit]
+
+    @staticmethod
+    async def _gather(calls: Iterable[Awaitable[Result]]) -> List[Result]:
+        """
+        Run the calls on their shards at once. All of them finish before the first
+        failure is raised, so no shard is still working when its session closes.
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results  # type: ignore[return-value]
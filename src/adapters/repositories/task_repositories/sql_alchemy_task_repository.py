@@ -1,17 +1,31 @@
-from typing import Any, List
+from typing import Any, List, Mapping
 
-from adapters.connection_engines.sql_alchemy.models import TaskModel
+from sqlalchemy import RowMapping
+
+from adapters.connection_engines.sql_alchemy.models import (
+    TaskArchiveModel,
+    TaskModel,
+    TaskTombstoneModel,
+    task_search,
+)
 from adapters.connection_engines.sql_alchemy.SqlAlchemyAbstractRepository import (
     SqlAlchemyAbstractRepository,
 )
 from domain.entities.task import Priority, Task, TaskStatus
 from ports.task_repository_interface import TaskRepositoryInterface
 
+# Enum members by stored value: a dict lookup per row instead of an Enum call
+_STATUSES = {status.value: status for status in TaskStatus}
+_PRIORITIES = {priority.value: priority for priority in Priority}
+
 
 class SqlAlchemyTaskRepository(
     SqlAlchemyAbstractRepository[Task, TaskModel], TaskRepositoryInterface
 ):
     model = TaskModel
+    full_text_search = task_search
+    archive_model = TaskArchiveModel
+    tombstone_model = TaskTombstoneModel
 
     def _get_filters(self, **filters) -> List[Any]:
         conditions = []
@@ -21,6 +35,22 @@ class SqlAlchemyTaskRepository(
             conditions.append(TaskModel.status == filters["status_filter"])
         if "priority_filter" in filters:
             conditions.append(TaskModel.priority == filters["priority_filter"])
+        if "status_not_filter" in filters:
+            conditions.append(TaskModel.status != filters["status_not_filter"])
+        if "id_in_filter" in filters:
+            conditions.append(TaskModel.id.in_(filters["id_in_filter"]))
+        if "id_after_filter" in filters:
+            conditions.append(TaskModel.id > filters["id_after_filter"])
+        if "id_up_to_filter" in filters:
+            conditions.append(TaskModel.id <= filters["id_up_to_filter"])
+        if "due_before_filter" in filters:
+            conditions.append(TaskModel.due_date < filters["due_before_filter"])
+        if "updated_before_filter" in filters:
+            conditions.append(TaskModel.updated_at < filters["updated_before_filter"])
+        if "flagged_overdue_filter" in filters:
+            conditions.append(
+                TaskModel.overdue_at.is_not(None) == filters["flagged_overdue_filter"]
+            )
 
         return conditions
 
@@ -33,10 +63,38 @@ class SqlAlchemyTaskRepository(
             status=TaskStatus(task_model.status),
             priority=Priority(task_model.priority),
             due_date=task_model.due_date,
+            overdue_at=task_model.overdue_at,
             created_at=task_model.created_at,
             updated_at=task_model.updated_at,
         )
 
+    @staticmethod
+    def _row_to_entity(row: RowMapping) -> Task:
+        return Task(
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            status=_STATUSES[row["status"]],
+            priority=_PRIORITIES[row["priority"]],
+            due_date=row["due_date"],
+            overdue_at=row["overdue_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def _entity_to_row(self, entity: Task) -> Mapping[str, Any]:
+        return dict(
+            id=entity.id,
+            title=entity.title,
+            description=entity.description,
+            status=TaskStatus(entity.status),
+            priority=Priority(entity.priority),
+            due_date=entity.due_date,
+            overdue_at=entity.overdue_at,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
     @staticmethod
     def _entity_to_model(entity: Task) -> TaskModel:
         return TaskModel(
@@ -46,6 +104,7 @@ class SqlAlchemyTaskRepository(
             status=TaskStatus(entity.status),
             priority=Priority(entity.priority),
             due_date=entity.due_date,
+            overdue_at=entity.overdue_at,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
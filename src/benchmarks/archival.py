@@ -0,0 +1,121 @@
+"""
+Listing latency on the hot tasks table with a large history of completed tasks,
+before and after the archival job moved that history to tasks_archive.
+
+Usage (from src/): python -m benchmarks.archival [--history 200000] [--hot 2000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import uuid4
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import BaseSettings
+from drivers.jobs.archival import archive_completed_tasks
+from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+
+LISTINGS = {
+    "all tasks": {},
+    "pending tasks": {"status_filter": TaskStatus.PENDING},
+    "completed tasks": {"status_filter": TaskStatus.COMPLETED},
+}
+
+
+def new_task(index: int, status: TaskStatus, age: timedelta) -> Task:
+    timestamp = datetime.now(timezone.utc) - age
+    return Task(
+        id=uuid4(),
+        title=f"Task {index}",
+        description="Benchmark task",
+        status=status,
+        priority=list(Priority)[index % 3],
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+async def insert_tasks(session_maker, tasks: List[Task]) -> None:
+    for start in range(0, len(tasks), 5000):
+        async with session_maker() as session, session.begin():
+            await SqlAlchemyTaskRepository(session).save_many(tasks[start : start + 5000])
+
+
+async def listing_latency(session_maker, params: dict, calls: int) -> float:
+    """
+    Return the mean duration of a task listing (page and count) in milliseconds.
+    """
+    async with session_maker() as session:
+        use_case = ListAllTasksUseCase(SqlAlchemyTaskRepository(session))
+        await use_case.execute(dict(params))
+        start = time.perf_counter()
+        for _ in range(calls):
+            await use_case.execute(dict(params))
+        return (time.perf_counter() - start) / calls * 1000
+
+
+async def run(history: int, hot: int, calls: int, db_name: str) -> None:
+    session_maker = get_session_maker(BaseSettings(db_name=db_name))
+    engine = session_maker.kw["bind"]
+    engine.echo = False
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    await insert_tasks(
+        session_maker,
+        [
+            new_task(index, TaskStatus.COMPLETED, timedelta(days=90))
+            for index in range(history)
+        ]
+        + [
+            new_task(index, list(TaskStatus)[index % 3], timedelta(hours=1))
+            for index in range(hot)
+        ],
+    )
+
+    before = {
+        name: await listing_latency(session_maker, params, calls)
+        for name, params in LISTINGS.items()
+    }
+
+    start = time.perf_counter()
+    archived = await archive_completed_tasks(
+        session_maker, older_than=timedelta(days=30), batch_size=5000
+    )
+    duration = time.perf_counter() - start
+    print(
+        f"Archived {archived} tasks in {duration:.1f}s "
+        f"({archived / duration:.0f} tasks/s, batches of 5000)"
+    )
+
+    for name, params in LISTINGS.items():
+        after = await listing_latency(session_maker, params, calls)
+        print(
+            f"{name:<16} before={before[name]:8.2f} ms  after={after:8.2f} ms  "
+            f"({before[name] / after:5.1f}x)"
+        )
+
+    await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--history", type=int, default=200_000)
+    parser.add_argument("--hot", type=int, default=2000)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.history, args.hot, args.calls, f"{directory}/benchmark"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Per-request framework overhead of the task listing dependencies: the former chain
+of `Depends` (settings, session maker, session, repository, use case and a second
+parse of the listing parameters, mostly run in the threadpool) against the
+application-scoped container. The endpoints resolve their dependencies and return
+an empty page without running a statement, so only the wiring is measured.
+
+Usage (from src/): python -m benchmarks.di_overhead [--requests 5000] [--concurrency 1,50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from functools import partial
+from typing import AsyncGenerator, List
+
+import httpx
+from fastapi import Depends, FastAPI, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from drivers.api.v1.tasks.schema import TaskListParams
+from drivers.config.settings import get_settings
+from drivers.dependencies.database import (
+    get_db_session,
+    sqlAlchemySessionMaker,
+    sqlAlchemyShardSessionMakers,
+)
+from drivers.dependencies.hateoas import hateoas_dependency
+from drivers.dependencies.single_writer import sqliteSingleWriter
+from drivers.dependencies.use_cases import get_get_all_tasks_usecase
+from drivers.helpers.hetoas import ListingParams, create_hateoas_response
+from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+
+
+def legacy_hateoas_dependency(
+    request: Request, listing_params: ListingParams = Depends()
+):
+    return partial(
+        create_hateoas_response, request=request, listing_params=listing_params
+    )
+
+
+async def legacy_task_repository(
+    db_session: AsyncSession = Depends(get_db_session),
+    shard_engines=Depends(sqlAlchemyShardSessionMakers),
+    single_writer=Depends(sqliteSingleWriter),
+) -> AsyncGenerator[SqlAlchemyTaskRepository, None]:
+    yield SqlAlchemyTaskRepository(db_session)
+
+
+def legacy_get_all_tasks_usecase(
+    repository: SqlAlchemyTaskRepository = Depends(legacy_task_repository),
+) -> ListAllTasksUseCase:
+    return ListAllTasksUseCase(repository)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/bare")
+    async def bare(params: TaskListParams = Query()):
+        return {"items": [], "total_count": 0, "page": params.page}
+
+    @app.get("/legacy")
+    async def legacy(
+        params: TaskListParams = Query(),
+        hateoas=Depends(legacy_hateoas_dependency),
+        use_case: ListAllTasksUseCase = Depends(legacy_get_all_tasks_usecase),
+    ):
+        return hateoas(items=[], total_count=0)
+
+    @app.get("/container")
+    async def container(
+        params: TaskListParams = Query(),
+        hateoas=Depends(hateoas_dependency),
+        use_case: ListAllTasksUseCase = Depends(get_get_all_tasks_usecase),
+    ):
+        return hateoas(listing_params=params, items=[], total_count=0)
+
+    return app
+
+
+async def measure(
+    client: httpx.AsyncClient, path: str, requests: int, concurrency: int
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    url = f"{path}?page=2&limit=20&order_by=title&status=pending"
+
+    async def request() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(url)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+            response.raise_for_status()
+
+    for _ in range(min(requests, 200)):
+        await request()
+    latencies.clear()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    duration = time.perf_counter() - start
+
+    print(
+        f"  {path:<11} {requests / duration:8.0f} req/s  "
+        f"p50={statistics.median(latencies):7.0f} us"
+    )
+
+
+async def run(requests: int, concurrencies: List[int], db_name: str) -> None:
+    # Both wirings read the settings of the application
+    os.environ["DB_NAME"] = db_name
+    settings = get_settings()
+    await sqlAlchemySessionMaker.start(settings)
+    await sqlAlchemyShardSessionMakers.start(settings)
+    sqlAlchemySessionMaker().kw["bind"].echo = False
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        for concurrency in concurrencies:
+            print(f"concurrency {concurrency}:")
+            for path in ("/bare", "/legacy", "/container"):
+                await measure(client, path, requests, concurrency)
+
+    await sqlAlchemyShardSessionMakers.stop()
+    await sqlAlchemySessionMaker.stop()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", default="1,50")
+    args = parser.parse_args(argv)
+    concurrencies = [int(value) for value in args.concurrency.split(",")]
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.requests, concurrencies, f"{directory}/benchmark"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Throughput of concurrent task creations: one transaction and commit per creation
+(the default request path) against the group-commit write buffer.
+
+Usage (from src/): python -m benchmarks.group_commit [--creates 2000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.buffered_task_writer import (
+    BufferedTaskWriter,
+)
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import BaseSettings
+
+
+def new_task(index: int) -> Task:
+    return Task(
+        id=uuid4(),
+        title=f"Task {index}",
+        description="Benchmark task",
+        status=TaskStatus.PENDING,
+        priority=list(Priority)[index % 3],
+    )
+
+
+async def creates_per_second(
+    create: Callable[[Task], Awaitable[Task]], creates: int, concurrency: int
+) -> float:
+    """
+    Run `creates` creations with at most `concurrency` in flight at a time.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(index: int) -> None:
+        async with semaphore:
+            await create(new_task(index))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(index) for index in range(creates)))
+    return creates / (time.perf_counter() - start)
+
+
+async def run(
+    creates: int, concurrency: int, window_ms: float, max_batch: int, db_name: str
+) -> None:
+    session_maker = get_session_maker(BaseSettings(db_name=db_name))
+    engine = session_maker.kw["bind"]
+    engine.echo = False
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async def per_request(task: Task) -> Task:
+        async with session_maker() as session, session.begin():
+            return await SqlAlchemyTaskRepository(session).save(task)
+
+    writer = BufferedTaskWriter(session_maker, window_ms=window_ms, max_batch=max_batch)
+
+    direct = await creates_per_second(per_request, creates, concurrency)
+    buffered = await creates_per_second(writer.save, creates, concurrency)
+    await writer.stop()
+
+    print(f"per-request commit  {direct:9.0f} creates/s")
+    print(
+        f"group commit        {buffered:9.0f} creates/s  "
+        f"(window={window_ms}ms, max_batch={max_batch}, x{buffered / direct:.1f})"
+    )
+    await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--creates", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(
+            run(
+                args.creates,
+                args.concurrency,
+                args.window_ms,
+                args.max_batch,
+                f"{directory}/benchmark",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
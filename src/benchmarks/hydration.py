@@ -0,0 +1,104 @@
+"""
+Cost of turning 1,000 task rows into Task entities: ORM models copied into entities
+(the former read path) against rows mapped directly by the repository.
+
+Usage (from src/): python -m benchmarks.hydration [--rows 1000] [--calls 200]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, List
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from adapters.connection_engines.sql_alchemy.models import Base, TaskModel
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import BaseSettings
+
+
+async def time_calls(call: Callable[[], Awaitable[Any]], calls: int) -> float:
+    """
+    Return the mean duration of `call` in microseconds.
+    """
+    for _ in range(min(calls, 20)):
+        await call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+async def run(rows: int, calls: int, db_name: str) -> None:
+    session_maker = get_session_maker(BaseSettings(db_name=db_name))
+    engine = session_maker.kw["bind"]
+    engine.echo = False
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        repository = SqlAlchemyTaskRepository(session)
+        await repository.bulk_insert(
+            [
+                Task(
+                    id=uuid4(),
+                    title=f"Task {index}",
+                    description="Benchmark task",
+                    status=list(TaskStatus)[index % 3],
+                    priority=list(Priority)[index % 3],
+                )
+                for index in range(rows)
+            ]
+        )
+        await session.commit()
+
+        columns = select(*TaskModel.__table__.columns).limit(rows)
+        models = select(TaskModel).limit(rows)
+
+        async def fetch_only() -> Any:
+            return (await session.execute(columns)).all()
+
+        async def orm_models() -> Any:
+            result = await session.execute(models)
+            entities = [
+                repository._model_to_entity(model) for model in result.scalars().all()
+            ]
+            # The identity map would otherwise keep the models between calls
+            session.expunge_all()
+            return entities
+
+        async def direct_rows() -> Any:
+            return await repository.list_all(limit=rows)
+
+        fetch = await time_calls(fetch_only, calls)
+        orm = await time_calls(orm_models, calls)
+        direct = await time_calls(direct_rows, calls)
+
+    per_thousand = 1000 / rows
+    print(f"fetch only      {fetch * per_thousand:9.0f} us per 1,000 rows")
+    for name, total in (("ORM models", orm), ("direct rows", direct)):
+        print(
+            f"{name:<15} {total * per_thousand:9.0f} us per 1,000 rows  "
+            f"(hydration {(total - fetch) * per_thousand:7.0f} us)"
+        )
+    await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.rows, args.calls, f"{directory}/benchmark"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Per-call overhead of the repository read queries: the cached statements used by
+SqlAlchemyAbstractRepository against statements rebuilt on every call.
+
+Usage (from src/): python -m benchmarks.repository_queries [--calls 2000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, List
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from adapters.connection_engines.sql_alchemy.models import Base, TaskModel
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from domain.value_objects.ordering import Ordering
+from drivers.config.settings import BaseSettings
+
+
+async def time_calls(call: Callable[[], Awaitable[Any]], calls: int) -> float:
+    """
+    Return the mean duration of `call` in microseconds.
+    """
+    for _ in range(min(calls, 100)):
+        await call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def report(name: str, cached: float, rebuilt: float) -> None:
+    print(
+        f"{name:<24} cached={cached:8.1f} us  rebuilt={rebuilt:8.1f} us  "
+        f"saved={rebuilt - cached:6.1f} us/call"
+    )
+
+
+async def run(calls: int, rows: int, db_name: str) -> None:
+    session_maker = get_session_maker(BaseSettings(db_name=db_name))
+    engine = session_maker.kw["bind"]
+    engine.echo = False
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with session_maker() as session:
+        repository = SqlAlchemyTaskRepository(session)
+        ids: List[Any] = []
+        for index in range(rows):
+            task = await repository.save(
+                Task(
+                    id=uuid4(),
+                    title=f"Task {index}",
+                    description="Benchmark task",
+                    status=list(TaskStatus)[index % 3],
+                    priority=list(Priority)[index % 3],
+                )
+            )
+            ids.append(task.id)
+        await session.commit()
+
+        task_id = ids[len(ids) // 2]
+
+        async def rebuilt_get() -> Any:
+            model = await session.scalar(
+                select(TaskModel).where(*repository._get_filters(id_filter=task_id))
+            )
+            return repository._model_to_entity(model) if model else None
+
+        async def rebuilt_list_all() -> Any:
+            query = (
+                select(TaskModel)
+                .where(
+                    *repository._get_filters(
+                        status_filter=TaskStatus.PENDING,
+                        priority_filter=Priority.LOW,
+                    )
+                )
+                .order_by(repository._get_order_expression("created_at", Ordering.ASC))
+                .offset(0)
+                .limit(10)
+            )
+            result = await session.execute(query)
+            return [repository._model_to_entity(m) for m in result.scalars().all()]
+
+        report(
+            "get(id_filter=...)",
+            await time_calls(lambda: repository.get(id_filter=task_id), calls),
+            await time_calls(rebuilt_get, calls),
+        )
+        report(
+            "list_all(filtered)",
+            await time_calls(
+                lambda: repository.list_all(
+                    status_filter=TaskStatus.PENDING, priority_filter=Priority.LOW
+                ),
+                calls,
+            ),
+            await time_calls(rebuilt_list_all, calls),
+        )
+
+    await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.calls, args.rows, f"{directory}/benchmark"))
+
+
+if __name__ == "__main__":
+    main()
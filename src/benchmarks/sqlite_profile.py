@@ -0,0 +1,130 @@
+"""
+Read and write throughput on SQLite with the connection profile (WAL, synchronous
+NORMAL, page cache, mmap, ...) against SQLite's defaults.
+
+Usage (from src/): python -m benchmarks.sqlite_profile [--operations 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from typing import Awaitable, Callable, List
+from uuid import UUID, uuid4
+
+from sqlalchemy.exc import OperationalError
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import BaseSettings
+
+
+def new_task(index: int) -> Task:
+    return Task(
+        id=uuid4(),
+        title=f"Task {index}",
+        description="Benchmark task",
+        status=list(TaskStatus)[index % 3],
+        priority=list(Priority)[index % 3],
+    )
+
+
+async def throughput(
+    operation: Callable[[int], Awaitable[object]], operations: int, concurrency: int
+) -> tuple[float, int]:
+    """
+    Run `operations` operations with at most `concurrency` in flight at a time.
+    Returns the operations per second and the number of "database is locked" errors.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def limited(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            try:
+                await operation(index)
+            except OperationalError:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(index) for index in range(operations)))
+    return operations / (time.perf_counter() - start), errors
+
+
+async def run_profile(
+    settings: BaseSettings, operations: int, concurrency: int
+) -> dict[str, tuple[float, int]]:
+    session_maker = get_session_maker(settings)
+    engine = session_maker.kw["bind"]
+    engine.echo = False
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    ids: List[UUID] = []
+
+    async def write(index: int) -> None:
+        async with session_maker() as session, session.begin():
+            task = await SqlAlchemyTaskRepository(session).save(new_task(index))
+        ids.append(task.id)  # type: ignore[arg-type]
+
+    async def read(index: int) -> None:
+        async with session_maker() as session:
+            repository = SqlAlchemyTaskRepository(session)
+            await repository.get(id_filter=random.choice(ids))
+            await repository.list_all(status_filter=list(TaskStatus)[index % 3])
+
+    async def mixed(index: int) -> None:
+        # One write for four reads
+        await (write(index) if index % 5 == 0 else read(index))
+
+    results = {
+        "writes": await throughput(write, operations, concurrency),
+        "reads": await throughput(read, operations, concurrency),
+        "mixed": await throughput(mixed, operations, concurrency),
+    }
+    await engine.dispose()
+    return results
+
+
+async def run(operations: int, concurrency: int, directory: str) -> None:
+    profiles = {
+        "defaults": BaseSettings(
+            db_name=f"{directory}/defaults", sqlite_profile_enabled=False
+        ),
+        "profile": BaseSettings(db_name=f"{directory}/profile"),
+    }
+    results = {
+        name: await run_profile(settings, operations, concurrency)
+        for name, settings in profiles.items()
+    }
+
+    for workload in ("writes", "reads", "mixed"):
+        (before, before_errors), (after, after_errors) = (
+            results["defaults"][workload],
+            results["profile"][workload],
+        )
+        print(
+            f"{workload:<7} defaults={before:8.0f} ops/s ({before_errors} locked)  "
+            f"profile={after:8.0f} ops/s ({after_errors} locked)  "
+            f"x{after / before:.1f}"
+        )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.operations, args.concurrency, directory))
+
+
+if __name__ == "__main__":
+    main()
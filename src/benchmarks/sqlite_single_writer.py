@@ -0,0 +1,156 @@
+"""
+Throughput and latency of a mixed read/write load on SQLite: pooled read-write
+connections (each request writes in its own transaction) against the single
+writer mode (writes queued to one connection, reads on read-only connections).
+
+Usage (from src/): python -m benchmarks.sqlite_single_writer [--operations 4000] [--concurrency 50] [--write-ratio 0.2]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, List
+from uuid import uuid4
+
+from sqlalchemy.exc import OperationalError
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import BaseSettings
+from drivers.dependencies.database import session_scope
+from drivers.dependencies.repositories import single_writer_repository_scope
+from drivers.dependencies.single_writer import SqliteSingleWriter
+
+RepositoryScope = Callable[[], AsyncContextManager[SqlAlchemyTaskRepository]]
+
+
+def new_task(index: int) -> Task:
+    return Task(
+        id=uuid4(),
+        title=f"Task {index}",
+        description="Benchmark task",
+        status=list(TaskStatus)[index % 3],
+        priority=list(Priority)[index % 3],
+    )
+
+
+async def mixed_load(
+    scope: RepositoryScope, operations: int, concurrency: int, write_ratio: float
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: Dict[str, List[float]] = {"write": [], "read": []}
+    errors = 0
+    ids = [(await save(scope, new_task(index))).id for index in range(100)]
+
+    async def operation(index: int) -> None:
+        nonlocal errors
+        kind = "write" if random.random() < write_ratio else "read"
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                if kind == "write":
+                    ids.append((await save(scope, new_task(index))).id)
+                else:
+                    async with scope() as repository:
+                        await repository.get(id_filter=random.choice(ids))
+                        await repository.list_all(
+                            status_filter=list(TaskStatus)[index % 3]
+                        )
+            except OperationalError:
+                errors += 1
+                return
+            latencies[kind].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(operation(index) for index in range(operations)))
+    duration = time.perf_counter() - start
+
+    print(f"  {operations / duration:8.0f} ops/s, {errors} 'database is locked'")
+    for kind, values in latencies.items():
+        if len(values) > 1:
+            p99 = statistics.quantiles(values, n=100)[98]
+            print(
+                f"  {kind:<5} p50={statistics.median(values):7.1f} ms  p99={p99:7.1f} ms"
+            )
+
+
+def pooled_repository_scope(session_maker) -> RepositoryScope:
+    """
+    Repositories in transactions of their own, on the pooled connections.
+    """
+
+    @asynccontextmanager
+    async def scope() -> AsyncIterator[SqlAlchemyTaskRepository]:
+        async with session_scope(session_maker) as session:
+            yield SqlAlchemyTaskRepository(session)
+
+    return scope
+
+
+async def save(scope: RepositoryScope, task: Task) -> Task:
+    async with scope() as repository:
+        return await repository.save(task)
+
+
+async def run(
+    operations: int, concurrency: int, write_ratio: float, directory: str
+) -> None:
+    for single_writer_enabled in (False, True):
+        settings = BaseSettings(
+            db_name=f"{directory}/benchmark_{single_writer_enabled}",
+            sqlite_single_writer_enabled=single_writer_enabled,
+        )
+        pooled = get_session_maker(settings)
+        engine = pooled.kw["bind"]
+        engine.echo = False
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+        if single_writer_enabled:
+            connections = SqliteSingleWriter()
+            await connections.start(settings)
+            single_writer = connections()
+            assert single_writer is not None
+            for session_maker in (single_writer.writer, single_writer.readers):
+                session_maker.kw["bind"].echo = False
+            print("single writer and read-only connections:")
+            await mixed_load(
+                partial(single_writer_repository_scope, single_writer),
+                operations,
+                concurrency,
+                write_ratio,
+            )
+            await connections.stop()
+        else:
+            print("pooled read-write connections:")
+            await mixed_load(
+                pooled_repository_scope(pooled),
+                operations,
+                concurrency,
+                write_ratio,
+            )
+        await engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args.operations, args.concurrency, args.write_ratio, directory))
+
+
+if __name__ == "__main__":
+    main()
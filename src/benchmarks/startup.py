@@ -0,0 +1,88 @@
+"""
+Startup benchmark: time to import the application module, to build the app and to
+serve the first response, each measured in a fresh interpreter.
+
+Usage (from src/): python -m benchmarks.startup [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+SRC_DIR = pathlib.Path(__file__).parent.parent.resolve()
+
+MEASURE_SCRIPT = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+import drivers.main
+imported = time.perf_counter()
+import_modules = sorted(sys.modules)
+
+application = drivers.main.create_app()
+created = time.perf_counter()
+create_app_modules = sorted(sys.modules)
+
+from httpx import ASGITransport, AsyncClient
+
+
+async def first_response():
+    async with AsyncClient(
+        transport=ASGITransport(app=application), base_url="http://test"
+    ) as client:
+        return (await client.get("/")).status_code
+
+
+status_code = asyncio.run(first_response())
+responded = time.perf_counter()
+
+print(json.dumps({
+    "import_seconds": imported - start,
+    "create_app_seconds": created - imported,
+    "first_response_seconds": responded - start,
+    "status_code": status_code,
+    "import_modules": import_modules,
+    "create_app_modules": create_app_modules,
+}))
+"""
+
+
+def measure_startup() -> Dict[str, Any]:
+    """
+    Measure one cold start in a new interpreter.
+    """
+    env = {**os.environ, "DB_NAME": os.environ.get("DB_NAME", "benchmark")}
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    # The last line is the measurement, anything before is application logging
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    runs = [measure_startup() for _ in range(args.runs)]
+    for key in ("import_seconds", "create_app_seconds", "first_response_seconds"):
+        values = [run[key] * 1000 for run in runs]
+        print(
+            f"{key.removesuffix('_seconds'):<16} "
+            f"median={statistics.median(values):8.1f} ms  "
+            f"min={min(values):8.1f} ms  max={max(values):8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,8 @@ class Task(EntityBase):
     status: TaskStatus
     priority: Priority
     due_date: datetime | None = None
+    # Set by the overdue sweep when the task was found past its due date
+    overdue_at: datetime | None = None
 
     def mark_as_completed(self) -> None:
         self.status = TaskStatus.COMPLETED
@@ -35,3 +35,9 @@ class InvalidEntityReference(Exception):
 
     def __str__(self):
         return f"Invalid {self.entity_name} reference: {self.reference_type} with id={self.reference_id} does not exist"
+
+
+class InvalidImportFile(Exception):
+    """Raised when an imported file can't be read any further"""
+
+    pass
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Generic, List, TypeVar
+from uuid import UUID
+
+from domain.entities.base import EntityBase
+
+T = TypeVar("T", bound=EntityBase)
+
+
+class RemovalReason(str, Enum):
+    DELETED = "deleted"
+    ARCHIVED = "archived"
+
+
+@dataclass(frozen=True)
+class Removal:
+    """
+    Tombstone of an entity removed from the storage, kept for the change feed.
+    """
+
+    id: UUID
+    reason: RemovalReason
+    removed_at: datetime
+
+
+@dataclass(frozen=True, order=True)
+class ChangePosition:
+    """
+    Position in the change feed: entities are ordered by (updated_at, id), and
+    removals by (removed_at, id) among them.
+    """
+
+    updated_at: datetime
+    id: UUID
+
+    @classmethod
+    def of(cls, change: "EntityBase | Removal") -> "ChangePosition":
+        if isinstance(change, Removal):
+            return cls(updated_at=change.removed_at, id=change.id)
+        return cls(updated_at=change.updated_at, id=change.id)  # type: ignore[arg-type]
+
+
+@dataclass
+class ChangeFeed(Generic[T]):
+    # Changed entities and removals, in position order
+    items: List[T | Removal]
+    # Position to resume from, the same as the requested one when nothing changed
+    position: ChangePosition | None
+    has_more: bool
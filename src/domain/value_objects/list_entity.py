@@ -1,9 +1,10 @@
 from dataclasses import asdict, dataclass
-from typing import Any, Generic, List, TypeVar
+from typing import Any, Generic, List, Sequence, TypeVar
 
 from domain.entities.base import EntityBase
+from domain.value_objects.projection import Projection
 
-T = TypeVar("T", bound=EntityBase)
+T = TypeVar("T", bound=EntityBase | Projection)
 
 
 @dataclass
@@ -11,5 +12,11 @@ class ListEntity(Generic[T]):
     items: List[T]
     count: int
 
-    def get_items_as_dict(self) -> List[dict[str, Any]]:
+    def get_items_as_dict(
+        self, fields: Sequence[str] | None = None
+    ) -> List[dict[str, Any]]:
+        if fields:
+            return [
+                {field: getattr(item, field) for field in fields} for item in self.items
+            ]
         return [asdict(client) for client in self.items]
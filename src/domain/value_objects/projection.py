@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Any, Mapping
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Some of the fields of an entity, read without loading the others.
+    The id is always read; the other fields are attributes too.
+    """
+
+    id: UUID
+    values: Mapping[str, Any]
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "values":
+            raise AttributeError(name)
+        try:
+            return self.values[name]
+        except KeyError:
+            raise AttributeError(f"{name} is not part of the projection") from None
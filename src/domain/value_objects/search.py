@@ -0,0 +1,13 @@
+import re
+from typing import List
+
+# A search term: a run of letters, digits or underscores
+SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    The lowercase terms of a text, both when indexing and when searching:
+    punctuation and search syntax never reach the indexes.
+    """
+    return SEARCH_TOKEN.findall(text.lower())
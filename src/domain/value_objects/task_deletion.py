@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TaskDeletionProgress:
+    deleted: int
+    # Tasks matching the filters when the deletion started
+    total: int
+    done: bool = False
+    # Why the deletion stopped before the end, if it did
+    failure: Exception | None = None
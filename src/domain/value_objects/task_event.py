@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from domain.entities.task import Task
+
+
+class TaskEventType(str, Enum):
+    CREATED = "task.created"
+    COMPLETED = "task.completed"
+
+
+# eq=False: events are compared (and hashed) by identity
+@dataclass(frozen=True, eq=False)
+class TaskEvent:
+    type: TaskEventType
+    task: Task
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class ImportRowError:
+    # Number of the rejected row, from 1
+    row: int
+    errors: List[str]
+
+
+@dataclass
+class TaskImportResult:
+    inserted: int = 0
+    rejected: int = 0
+    # Errors of the first rejected rows only
+    errors: List[ImportRowError] = field(default_factory=list)
+    duration: float = 0.0
+    # Why the import stopped before the end of the file, if it did
+    failure: Exception | None = None
+
+    @property
+    def rows_per_second(self) -> int:
+        if not self.duration:
+            return 0
+        return round((self.inserted + self.rejected) / self.duration)
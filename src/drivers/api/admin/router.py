@@ -0,0 +1,60 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from drivers.api.admin.schema import (
+    AdmissionStateResponse,
+    SlowQueryListResponse,
+    SlowQueryResponse,
+)
+from drivers.dependencies.admin import require_admin
+from drivers.dependencies.admission import get_admission_controller
+from drivers.dependencies.slow_query_log import get_slow_query_log
+from drivers.helpers.admission import AdmissionController
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)]
+)
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="List recent slow queries",
+    description="Return the last statements caught by the slow query log, with their plan.",
+)
+async def list_slow_queries(
+    slow_query_log: SlowQueryLog | None = Depends(get_slow_query_log),
+) -> SlowQueryListResponse:
+    if slow_query_log is None or slow_query_log.buffer is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Slow query buffer is disabled",
+        )
+    return SlowQueryListResponse(
+        items=[
+            SlowQueryResponse(**asdict(slow_query))
+            for slow_query in slow_query_log.recent()
+        ],
+        suppressed=slow_query_log.suppressed,
+    )
+
+
+@router.get(
+    "/admission",
+    response_model=AdmissionStateResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Admission control state",
+    description="Return the running and queued requests, and the requests shed, per route class.",
+)
+async def get_admission_state(
+    controller: AdmissionController | None = Depends(get_admission_controller),
+) -> AdmissionStateResponse:
+    if controller is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Admission control is disabled",
+        )
+    return AdmissionStateResponse(**controller.snapshot())
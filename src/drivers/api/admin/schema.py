@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryResponse(BaseModel):
+    """Response model for a statement caught by the slow query log."""
+
+    statement: str = Field(..., description="SQL statement")
+    parameters: Any = Field(None, description="Bound parameters, values redacted")
+    duration_ms: float = Field(..., description="Execution time in milliseconds")
+    route: str | None = Field(None, description="Route handler that issued it")
+    use_case: str | None = Field(None, description="Use case that issued it")
+    plan: List[str] = Field(..., description="Query plan captured with EXPLAIN")
+    logged_at: datetime = Field(..., description="When the statement was logged")
+
+
+class SlowQueryListResponse(BaseModel):
+    items: List[SlowQueryResponse] = Field(..., description="Recent slow statements")
+    suppressed: int = Field(..., description="Slow statements dropped by rate limiting")
+
+
+class RouteClassStateResponse(BaseModel):
+    """Admission control state of a route class."""
+
+    limit: int = Field(..., description="Requests allowed to run at once")
+    active: int = Field(..., description="Requests running")
+    queued: int = Field(..., description="Requests waiting for a slot")
+    queue_size: int = Field(..., description="Requests allowed to wait")
+    admitted: int = Field(..., description="Requests admitted since startup")
+    rejected: int = Field(..., description="Requests shed without waiting")
+    timed_out: int = Field(..., description="Requests shed after waiting")
+    service_time_ms: float = Field(..., description="Average time holding a slot")
+    estimated_wait_ms: float = Field(..., description="Wait of a new request")
+
+
+class AdmissionStateResponse(BaseModel):
+    capacity: int = Field(..., description="Requests allowed to run at once overall")
+    active: int = Field(..., description="Requests running")
+    max_wait_ms: float = Field(..., description="Longest wait before shedding")
+    route_classes: Dict[str, RouteClassStateResponse] = Field(
+        ..., description="State per route class"
+    )
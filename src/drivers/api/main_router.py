@@ -1,8 +1,10 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 
 from drivers.config.settings import BaseSettings, get_settings
+from drivers.dependencies.database import sqlAlchemySessionMaker
 
 router = APIRouter()
 
@@ -10,3 +12,14 @@ router = APIRouter()
 @router.get("/")
 async def home(settings: Annotated[BaseSettings, Depends(get_settings)]):
     return {"message": f"Hello from {settings.app_name}"}
+
+
+@router.get("/health/ready")
+async def readiness() -> JSONResponse:
+    # Only ready once the lifespan has created and warmed up the database pool
+    if not sqlAlchemySessionMaker.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting"},
+        )
+    return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ready"})
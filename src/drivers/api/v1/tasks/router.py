@@ -1,42 +1,81 @@
+from dataclasses import asdict
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
 from domain.entities.task import Task
+from domain.value_objects.change_feed import Removal
 from domain.value_objects.create_task_data import CreateTaskData
 from drivers.api.v1.tasks.schema import (
     CreateTaskRequest,
     ErrorResponse,
+    TaskChangesParams,
+    TaskChangesResponse,
+    TaskDeleteParams,
+    TaskEventParams,
+    TaskImportResponse,
     TaskListParams,
     TaskListResponse,
+    TaskRemovalResponse,
     TaskResponse,
 )
+from drivers.config.settings import BaseSettings, get_settings
+from drivers.dependencies.admission import admission
+from drivers.dependencies.events import get_task_event_broker
 from drivers.dependencies.hateoas import hateoas_dependency
+from drivers.dependencies.idempotency import IdempotentRequest, idempotent_request
+from drivers.dependencies.route_class import route_class_dependencies
 from drivers.dependencies.use_cases import (
     get_complete_task_usecase,
     get_create_task_usecase,
+    get_delete_task_usecase,
+    get_delete_tasks_usecase,
     get_get_all_tasks_usecase,
+    get_import_tasks_usecase,
+    get_list_task_changes_usecase,
 )
+from drivers.helpers.admission import RouteClass
+from drivers.helpers.bulk_delete import stream_bulk_delete
+from drivers.helpers.change_token import encode_change_token
+from drivers.helpers.sse import stream_task_events
+from drivers.helpers.task_import import build_import_response, parse_import
 from use_cases.tasks.complete_task_usecase import CompleteTaskUseCase
 from use_cases.tasks.create_task_usecase import CreateTaskUseCase
+from use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
+from use_cases.tasks.delete_tasks_usecase import DeleteTasksUseCase
 from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+from use_cases.tasks.import_tasks_usecase import ImportTasksUseCase
+from use_cases.tasks.list_task_changes_usecase import ListTaskChangesUseCase
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 
 
 @router.post(
     "",
+    dependencies=route_class_dependencies(RouteClass.WRITE),
     response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request data"},
+        409: {
+            "model": ErrorResponse,
+            "description": "A request with this Idempotency-Key is in progress",
+        },
         422: {"model": ErrorResponse, "description": "Validation error"},
     },
     summary="Create a new task",
-    description="Create a new task with the specified title, description, priority, and optional due date.",
+    description=(
+        "Create a new task with the specified title, description, priority, and "
+        "optional due date. Retries sent with the same `Idempotency-Key` header get "
+        "the response of the first request instead of creating another task."
+    ),
 )
 async def create_task(
     request: CreateTaskRequest,
+    # Before the use case: a replayed request doesn't open a session
+    idempotency: IdempotentRequest | None = Depends(idempotent_request),
     create_task_usecase: CreateTaskUseCase = Depends(get_create_task_usecase),
 ) -> Task:
     data = CreateTaskData(
@@ -45,29 +84,168 @@ async def create_task(
         priority=request.priority,
         due_date=request.due_date,
     )
-    return await create_task_usecase.execute(data)
+    task = await create_task_usecase.execute(data)
+    if idempotency is not None:
+        idempotency.set_response(
+            status.HTTP_201_CREATED,
+            TaskResponse.model_validate(asdict(task)).model_dump_json(),
+        )
+    return task
+
+
+@router.post(
+    "/import",
+    # Runs as long as the upload: no request deadline
+    dependencies=[Depends(admission(RouteClass.EXPORT))],
+    response_model=TaskImportResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        207: {
+            "model": TaskImportResponse,
+            "description": "The import stopped before the end of the file",
+        },
+        415: {"model": ErrorResponse, "description": "Unsupported file format"},
+        422: {"model": ErrorResponse, "description": "Invalid file"},
+    },
+    summary="Import tasks",
+    description=(
+        "Create tasks from a CSV file (`text/csv`, with a header line naming the "
+        "`title`, `description`, `priority` and optional `due_date` columns) or a "
+        "newline-delimited JSON file (`application/x-ndjson`) of task objects. "
+        "Rows are validated like single creations; the valid ones are created in "
+        "chunks as the upload is read, the others are reported by row number. "
+        "When the import stops midway (unreadable file, database error), the "
+        "chunks already created stay created: the response is a 207 whose "
+        "`error` tells why, `inserted` counting the tasks created."
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_task_file(
+    request: Request,
+    response: Response,
+    settings: BaseSettings = Depends(get_settings),
+    import_tasks_usecase: ImportTasksUseCase = Depends(get_import_tasks_usecase),
+) -> TaskImportResponse:
+    rows = parse_import(request.headers.get("content-type"), request.stream())
+    result = await import_tasks_usecase.execute(
+        rows,
+        chunk_size=settings.import_chunk_size,
+        max_reported_errors=settings.import_max_reported_errors,
+    )
+    if result.failure is not None:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    return build_import_response(result)
 
 
 @router.get(
     "",
+    dependencies=route_class_dependencies(RouteClass.LIST),
     response_model=TaskListResponse,
+    # Fields left out by a sparse fieldset are omitted rather than returned as null
+    response_model_exclude_unset=True,
     status_code=status.HTTP_200_OK,
     summary="Get all tasks",
-    description="Retrieve all tasks.",
+    description=(
+        "Retrieve all tasks. Use `fields` to only return some of their fields. "
+        "When the archival job is enabled (`ARCHIVE_AFTER_DAYS`), the tasks "
+        "completed before that are archived: they are only listed and counted "
+        "with `include_archived`, and the change feed reports them as removed."
+    ),
 )
 async def list_all_tasks(
-    params: TaskListParams = Depends(),
+    params: TaskListParams = Query(),
     hateoas=Depends(hateoas_dependency),
     get_all_tasks_usecase: ListAllTasksUseCase = Depends(get_get_all_tasks_usecase),
 ) -> TaskListResponse:
-    result = await get_all_tasks_usecase.execute(
-        params=params.model_dump(exclude_none=True, exclude_unset=True)
+    listing_params = params.model_dump(
+        exclude_none=True, exclude_unset=True, exclude={"fields"}
+    )
+    if params.field_names:
+        listing_params["fields"] = params.field_names
+
+    result = await get_all_tasks_usecase.execute(params=listing_params)
+    return hateoas(
+        listing_params=params,
+        items=result.get_items_as_dict(fields=params.field_names),
+        total_count=result.count,
+    )
+
+
+@router.get(
+    "/changes",
+    # A seek on the (updated_at, id) index
+    dependencies=route_class_dependencies(RouteClass.POINT_READ),
+    response_model=TaskChangesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get the task changes",
+    description=(
+        "Retrieve the tasks created or updated since `since`, the `next_token` "
+        "of the previous call, and in `removed` the tasks deleted or archived "
+        "since then (archived tasks are still listed with `include_archived`). "
+        "Call again with `next_token` while `has_more` is true."
+    ),
+)
+async def list_task_changes(
+    params: TaskChangesParams = Query(),
+    list_task_changes_usecase: ListTaskChangesUseCase = Depends(
+        get_list_task_changes_usecase
+    ),
+) -> TaskChangesResponse:
+    feed = await list_task_changes_usecase.execute(
+        since=params.position, limit=params.limit
+    )
+    return TaskChangesResponse(
+        items=[
+            TaskResponse.model_validate(asdict(change))
+            for change in feed.items
+            if not isinstance(change, Removal)
+        ],
+        removed=[
+            TaskRemovalResponse.model_validate(asdict(change))
+            for change in feed.items
+            if isinstance(change, Removal)
+        ],
+        next_token=encode_change_token(feed.position) if feed.position else None,
+        has_more=feed.has_more,
+    )
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Subscribe to the task events",
+    description=(
+        "Server-sent events pushed when a task is created (`task.created`) or "
+        "completed (`task.completed`), optionally filtered by status or priority. "
+        "A client that does not keep up receives an `evicted` event and is "
+        "disconnected; the event ids can be used as `since` of the change feed."
+    ),
+)
+async def subscribe_to_task_events(
+    params: TaskEventParams = Query(),
+    broker: InMemoryEventBroker = Depends(get_task_event_broker),
+    settings: BaseSettings = Depends(get_settings),
+) -> StreamingResponse:
+    subscription = broker.subscribe(params.matches)
+    return StreamingResponse(
+        stream_task_events(subscription, settings.event_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return hateoas(items=result.get_items_as_dict(), total_count=result.count)
 
 
 @router.patch(
     "/{task_id}/complete",
+    dependencies=route_class_dependencies(RouteClass.WRITE),
     response_model=TaskResponse,
     status_code=status.HTTP_200_OK,
     responses={
@@ -82,3 +260,51 @@ async def complete_task(
     complete_task_usecase: CompleteTaskUseCase = Depends(get_complete_task_usecase),
 ) -> Task:
     return await complete_task_usecase.execute(task_id=task_id)
+
+
+@router.delete(
+    "/{task_id}",
+    dependencies=route_class_dependencies(RouteClass.WRITE),
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        404: {"model": ErrorResponse, "description": "Task not found"},
+        400: {"model": ErrorResponse, "description": "Task cannot be deleted"},
+    },
+    summary="Delete a task",
+    description="Delete a task.",
+)
+async def delete_task(
+    task_id: UUID,
+    delete_task_usecase: DeleteTaskUseCase = Depends(get_delete_task_usecase),
+) -> None:
+    await delete_task_usecase.execute(task_id=task_id)
+
+
+@router.delete(
+    "",
+    # The chunks run after the response started: no request deadline, but the
+    # admission slot is held until the deletion is over
+    dependencies=[Depends(admission(RouteClass.EXPORT))],
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Delete the tasks matching filters",
+    description=(
+        "Delete the tasks matching `status_filter` and/or `priority_filter`, in "
+        "chunks of one transaction each. The progress is streamed as "
+        "newline-delimited JSON, one line per chunk, the last one with `done` set "
+        "(or an `error`). Archived tasks are not deleted."
+    ),
+)
+async def delete_tasks(
+    params: TaskDeleteParams = Query(),
+    use_case: DeleteTasksUseCase = Depends(get_delete_tasks_usecase),
+    settings: BaseSettings = Depends(get_settings),
+) -> StreamingResponse:
+    progress = use_case.execute(
+        chunk_size=settings.bulk_delete_chunk_size,
+        pause=settings.bulk_delete_pause_ms / 1000,
+        **params.model_dump(exclude_none=True),
+    )
+    return StreamingResponse(
+        stream_bulk_delete(progress), media_type="application/x-ndjson"
+    )
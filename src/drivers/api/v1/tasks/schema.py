@@ -1,10 +1,14 @@
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt, field_validator, model_validator
 
 from domain.entities.task import Priority, TaskStatus
+from domain.value_objects.change_feed import ChangePosition, RemovalReason
+from domain.value_objects.search import tokenize
+from domain.value_objects.task_event import TaskEvent
+from drivers.helpers.change_token import decode_change_token
 from drivers.helpers.hetoas import ListingParams
 
 
@@ -60,6 +64,9 @@ class TaskResponse(BaseModel):
     status: TaskStatus = Field(..., description="Task status")
     priority: Priority = Field(..., description="Task priority")
     due_date: datetime | None = Field(None, description="Task due date")
+    overdue_at: datetime | None = Field(
+        None, description="When the task was found overdue"
+    )
     created_at: datetime = Field(..., description="Task creation timestamp")
     updated_at: datetime = Field(..., description="Task last update timestamp")
 
@@ -88,11 +95,165 @@ class ErrorResponse(BaseModel):
 class TaskListParams(ListingParams):
     status_filter: TaskStatus | None = None
     priority_filter: Priority | None = None
+    # Full-text search on the title and description, results ranked by relevance
+    q: str | None = Field(None, max_length=200)
+    # Sparse fieldset, e.g. "id,title,status" (the id is always returned)
+    fields: str | None = None
+    # Also list the archived (long completed) tasks
+    include_archived: bool = False
+
+    @model_validator(mode="after")
+    def validate_archived_search(self) -> "TaskListParams":
+        # The full-text index only covers the tasks that are not archived
+        if self.include_archived and self.q:
+            raise ValueError("q can't be combined with include_archived")
+        return self
+
+    @field_validator("q")
+    @classmethod
+    def validate_search(cls, q: str | None) -> str | None:
+        # Punctuation and search syntax are dropped, a search needs a word to look for
+        if q is not None and not tokenize(q):
+            raise ValueError("q must contain at least one word or number")
+        return q
+
+    @field_validator("order_by")
+    @classmethod
+    def validate_order_by(cls, order_by: str) -> str:
+        # The task fields are the columns of the task table
+        if order_by not in TaskResponse.model_fields:
+            raise ValueError(f"Can't order by {order_by}, not a task field")
+        return order_by
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, fields: str | None) -> str | None:
+        if fields is None:
+            return None
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = set(names) - set(TaskResponse.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        # Keep the requested order, without duplicates, starting with the id
+        return ",".join(dict.fromkeys(["id", *names]))
+
+    @property
+    def field_names(self) -> List[str] | None:
+        return self.fields.split(",") if self.fields else None
+
+
+class TaskListItemResponse(BaseModel):
+    """Response model for a task in a list, restricted to the requested fields."""
+
+    id: UUID = Field(..., description="Task identifier")
+    title: str | None = Field(None, description="Task title")
+    description: str | None = Field(None, description="Task description")
+    status: TaskStatus | None = Field(None, description="Task status")
+    priority: Priority | None = Field(None, description="Task priority")
+    due_date: datetime | None = Field(None, description="Task due date")
+    overdue_at: datetime | None = Field(
+        None, description="When the task was found overdue"
+    )
+    created_at: datetime | None = Field(None, description="Task creation timestamp")
+    updated_at: datetime | None = Field(None, description="Task last update timestamp")
 
 
 class TaskListResponse(BaseModel):
-    items: list[TaskResponse] = Field(..., description="List of tasks")
+    items: list[TaskListItemResponse] = Field(..., description="List of tasks")
     total_count: int = Field(..., description="Total number of tasks")
     page: int = Field(..., description="Current page number")
     limit: int = Field(..., description="Number of items per page")
     links: Dict[str, Any] = Field(..., description="HATEOAS pagination links")
+
+
+class TaskChangesParams(BaseModel):
+    # Continuation token of the previous call (None = from the beginning)
+    since: str | None = None
+    limit: PositiveInt = Field(100, le=1000)
+
+    @field_validator("since")
+    @classmethod
+    def validate_since(cls, since: str | None) -> str | None:
+        if since is not None:
+            decode_change_token(since)
+        return since
+
+    @property
+    def position(self) -> ChangePosition | None:
+        return decode_change_token(self.since) if self.since else None
+
+
+class TaskRemovalResponse(BaseModel):
+    id: UUID = Field(..., description="Id of the removed task")
+    reason: RemovalReason = Field(..., description="Why the task was removed")
+    removed_at: datetime = Field(..., description="When the task was removed")
+
+
+class TaskChangesResponse(BaseModel):
+    items: list[TaskResponse] = Field(
+        ..., description="Tasks created or updated since the token, oldest first"
+    )
+    removed: list[TaskRemovalResponse] = Field(
+        ..., description="Tasks removed since the token, oldest first"
+    )
+    next_token: str | None = Field(
+        ..., description="Token of the next call (unchanged when nothing changed)"
+    )
+    has_more: bool = Field(..., description="Whether more changes are available now")
+
+
+class TaskDeleteParams(BaseModel):
+    status_filter: TaskStatus | None = None
+    priority_filter: Priority | None = None
+
+    @model_validator(mode="after")
+    def validate_filters(self) -> "TaskDeleteParams":
+        # Deleting every task takes more than a missing query parameter
+        if self.status_filter is None and self.priority_filter is None:
+            raise ValueError("At least one filter is required to delete tasks")
+        return self
+
+
+class TaskBulkDeleteProgress(BaseModel):
+    deleted: int = Field(..., description="Tasks deleted so far")
+    total: int = Field(..., description="Tasks matching the filters at the start")
+    done: bool = Field(..., description="Whether the deletion is over")
+    error: str | None = Field(
+        None, description="Why the deletion stopped before the end"
+    )
+
+
+class TaskImportRowError(BaseModel):
+    row: int = Field(..., description="Number of the rejected row, from 1")
+    errors: list[str] = Field(..., description="Why the row was rejected")
+
+
+class TaskImportResponse(BaseModel):
+    inserted: int = Field(..., description="Tasks created")
+    rejected: int = Field(..., description="Rows rejected")
+    errors: list[TaskImportRowError] = Field(
+        ..., description="Errors of the rejected rows, the first ones only"
+    )
+    errors_truncated: bool = Field(
+        ..., description="Whether errors only lists some of the rejected rows"
+    )
+    duration_ms: float = Field(..., description="Duration of the import")
+    rows_per_second: int = Field(..., description="Rows processed per second")
+    error: str | None = Field(
+        None, description="Why the import stopped before the end of the file"
+    )
+
+
+class TaskEventParams(BaseModel):
+    status_filter: TaskStatus | None = None
+    priority_filter: Priority | None = None
+
+    def matches(self, event: TaskEvent) -> bool:
+        if self.status_filter is not None and event.task.status != self.status_filter:
+            return False
+        if (
+            self.priority_filter is not None
+            and event.task.priority != self.priority_filter
+        ):
+            return False
+        return True
@@ -16,20 +16,171 @@ class BaseSettings(PydanticBaseSettings):
     env: Environment = Environment.prod
 
     db_name: str
+    # Databases the tasks are spread over by a hash of their id (empty = the tasks
+    # stay in db_name, which keeps the job locks and idempotency keys either way)
+    db_shard_names: list[str] = []
     enable_sql_alchemy_logs: bool = False
     cors_url: str = "http://localhost:3000"
 
+    # Connection pool: persistent connections, extra connections under load and
+    # connections opened (and warmed up) at startup
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_warmup_connections: int = 1
+    # Connections the database accepts from this host, shared by all the workers
+    # (None = no limit)
+    db_max_connections: int | None = None
+
+    # SQLite profile, applied to each new connection: write-ahead log (readers don't
+    # block the writer), fsync at checkpoints only, page cache (KiB), memory-mapped
+    # reads (bytes), temporary tables in memory, and how long a statement waits for
+    # a locked database before failing
+    sqlite_profile_enabled: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size: int = 268435456
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_busy_timeout_ms: int = 5000
+    # SQLite single writer: the task writes of the requests are queued to one writer
+    # connection, those queued meanwhile (up to sqlite_write_batch_size) sharing a
+    # transaction, and their reads run on a pool of read-only connections
+    sqlite_single_writer_enabled: bool = False
+    sqlite_write_batch_size: int = 100
+
+    # Production server (python -m drivers.server)
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    # Number of worker processes (None = one per CPU)
+    workers: int | None = None
+
+    # Group commit of task creations: the creations received within the window
+    # (or until the batch is full) share one insert and one commit
+    write_buffer_enabled: bool = False
+    write_buffer_window_ms: float = 5.0
+    write_buffer_max_batch: int = 100
+
+    # Admission control: requests running at once per route class ("point_read",
+    # "write", "list", "export"; by default a share of the connection pool), requests
+    # waiting per class, and longest wait before answering 503
+    admission_enabled: bool = True
+    admission_limits: dict[str, int] = {}
+    admission_queue_size: int = 100
+    admission_max_wait_ms: float = 2000.0
+
+    # Time allowed to each request, per route class, in milliseconds; it also bounds
+    # the database statements (a route class left out has no deadline)
+    request_deadlines_ms: dict[str, float] = {
+        "point_read": 2000,
+        "write": 5000,
+        "list": 10000,
+        "export": 120000,
+    }
+
+    # Background jobs, run by one worker at a time. A worker that died holding a job
+    # lock (SQLite lease) loses it after job_lock_ttl_seconds; a running job renews
+    # its lease every job_lock_ttl_seconds / 3 and is aborted when it can't
+    jobs_enabled: bool = True
+    job_lock_ttl_seconds: float = 300.0
+    # Overdue sweep: flags the overdue tasks, batch_size at a time with a pause
+    # between two batches
+    overdue_sweep_interval_seconds: float = 60.0
+    overdue_sweep_jitter_seconds: float = 10.0
+    overdue_sweep_batch_size: int = 500
+    overdue_sweep_pause_ms: float = 50.0
+    # Archival: moves the tasks completed more than archive_after_days ago to the
+    # tasks_archive table, batch_size at a time with a pause between two batches.
+    # Off unless archive_after_days is set: archived tasks leave the listings
+    archive_after_days: float | None = None
+    archive_interval_seconds: float = 3600.0
+    archive_jitter_seconds: float = 60.0
+    archive_batch_size: int = 500
+    archive_pause_ms: float = 50.0
+
+    # Bulk deletion: tasks deleted per transaction, and pause between two chunks
+    bulk_delete_chunk_size: int = 5000
+    bulk_delete_pause_ms: float = 10.0
+
+    # Idempotency-Key of the task creations: responses replayed for
+    # idempotency_ttl_seconds, the latest idempotency_cache_size ones from memory.
+    # A retry waits up to idempotency_wait_seconds for the first request, whose key
+    # is freed after idempotency_lock_seconds if its worker died
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_lock_seconds: float = 60.0
+    idempotency_cache_size: int = 10000
+    idempotency_wait_seconds: float = 10.0
+    idempotency_purge_interval_seconds: float = 3600.0
+
+    # Task import: tasks created per transaction, rejected rows listed in the report
+    import_chunk_size: int = 5000
+    import_max_reported_errors: int = 1000
+
+    # Task event stream: events buffered per subscriber before it is evicted,
+    # and seconds between two keep-alive messages
+    event_queue_size: int = 100
+    event_heartbeat_seconds: float = 15.0
+
+    # Maximum number of SQL statements a single request may execute (None = no limit)
+    query_budget: int | None = None
+    # Fail the request instead of logging a warning when the budget is exceeded
+    query_budget_strict: bool = False
+
+    # Statements slower than this are logged with their plan (None = disabled)
+    slow_query_threshold_ms: float | None = None
+    # Maximum number of slow statements logged per minute
+    slow_query_rate_limit: int = 10
+    # Last slow statements kept in memory for the admin endpoint (0 = disabled)
+    slow_query_buffer_size: int = 0
+    # Token the admin endpoints require in production, in the X-Admin-Token header
+    # (None = the admin endpoints are disabled in production)
+    admin_token: str | None = None
+
+    # Secret used to sign the X-Profile header (None = signed profiling disabled)
+    profiling_secret: str | None = None
+    # Fraction of the requests profiled automatically, outside production (0 = disabled)
+    profiling_sample_rate: float = 0.0
+    # Directory where the request profiles are written
+    profiling_output_dir: str = "profiles"
+
     @property
     def database_url(self) -> str:
         return f"sqlite+aiosqlite:///{self.db_name}.db"
 
+    @property
+    def database_read_only_url(self) -> str:
+        return f"sqlite+aiosqlite:///file:{self.db_name}.db?mode=ro&uri=true"
+
+    @property
+    def sqlite_pragmas(self) -> dict[str, str | int]:
+        """
+        The pragmas of the SQLite profile, none when it is disabled.
+        """
+        if not self.sqlite_profile_enabled:
+            return {}
+        return {
+            "journal_mode": self.sqlite_journal_mode,
+            "synchronous": self.sqlite_synchronous,
+            # Negative: in KiB rather than pages
+            "cache_size": -self.sqlite_cache_size_kib,
+            "mmap_size": self.sqlite_mmap_size,
+            "temp_store": self.sqlite_temp_store,
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+        }
+
+    @property
+    def shard_database_urls(self) -> list[str]:
+        return [f"sqlite+aiosqlite:///{name}.db" for name in self.db_shard_names]
+
 
 class DevSettings(BaseSettings):
     debug: bool = True
+    query_budget: int | None = 10
 
 
 class TestSettings(BaseSettings):
     debug: bool = True
+    query_budget: int | None = 10
+    query_budget_strict: bool = True
 
 
 class ProdSettings(BaseSettings):
@@ -0,0 +1,79 @@
+"""Task full-text search index
+
+Revision ID: 4b1e9c2d7a10
+Revises: cfca03967ac5
+Create Date: 2026-10-19 09:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from adapters.connection_engines.sql_alchemy.utils.scripts import (
+    POSTGRES_TSVECTOR_COLUMN,
+    POSTGRES_TSVECTOR_DROP_COLUMN,
+    POSTGRES_TSVECTOR_DROP_INDEX,
+    POSTGRES_TSVECTOR_INDEX,
+    SQLITE_FTS_DELETE_TRIGGER,
+    SQLITE_FTS_DROP_TABLE,
+    SQLITE_FTS_DROP_TRIGGER,
+    SQLITE_FTS_INSERT_TRIGGER,
+    SQLITE_FTS_REBUILD,
+    SQLITE_FTS_TABLE,
+    SQLITE_FTS_UPDATE_TRIGGER,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "4b1e9c2d7a10"
+down_revision: Union[str, Sequence[str], None] = "cfca03967ac5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The index as of this revision, whatever FullTextSearch becomes later
+SQLITE_VALUES = dict(
+    fts_table="tasks_fts",
+    table_name="tasks",
+    columns="title, description",
+    new_columns="new.title, new.description",
+    old_columns="old.title, old.description",
+)
+POSTGRES_VALUES = dict(
+    table_name="tasks",
+    vector_column="search_vector",
+    vector_expression=(
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A')"
+        " || setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        for script in (
+            SQLITE_FTS_TABLE,
+            SQLITE_FTS_INSERT_TRIGGER,
+            SQLITE_FTS_DELETE_TRIGGER,
+            SQLITE_FTS_UPDATE_TRIGGER,
+            # The tasks created before the index
+            SQLITE_FTS_REBUILD,
+        ):
+            op.execute(script.format(**SQLITE_VALUES))
+    elif dialect_name == "postgresql":
+        # A stored generated column: computed for the existing rows as it is added
+        op.execute(POSTGRES_TSVECTOR_COLUMN.format(**POSTGRES_VALUES))
+        op.execute(POSTGRES_TSVECTOR_INDEX.format(**POSTGRES_VALUES))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect_name = op.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        for event in ("insert", "delete", "update"):
+            op.execute(SQLITE_FTS_DROP_TRIGGER.format(event=event, **SQLITE_VALUES))
+        op.execute(SQLITE_FTS_DROP_TABLE.format(**SQLITE_VALUES))
+    elif dialect_name == "postgresql":
+        op.execute(POSTGRES_TSVECTOR_DROP_INDEX.format(**POSTGRES_VALUES))
+        op.execute(POSTGRES_TSVECTOR_DROP_COLUMN.format(**POSTGRES_VALUES))
@@ -0,0 +1,53 @@
+"""Task change feed index and tombstones
+
+Revision ID: 7c3a5f0e2b91
+Revises: 4b1e9c2d7a10
+Create Date: 2026-10-19 09:31:05.642910
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3a5f0e2b91"
+down_revision: Union[str, Sequence[str], None] = "4b1e9c2d7a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_tasks_updated_at_id", "tasks", ["updated_at", "id"])
+    op.create_table(
+        "task_tombstones",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("removed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reason", sa.String(length=50), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", "removed_at"),
+    )
+    # Change feed: keyset pagination on the (removed_at, id) position
+    op.create_index(
+        "ix_task_tombstones_removed_at_id", "task_tombstones", ["removed_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_task_tombstones_removed_at_id", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_index("ix_tasks_updated_at_id", table_name="tasks")
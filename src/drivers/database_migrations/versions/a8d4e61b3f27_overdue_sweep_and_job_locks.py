@@ -0,0 +1,50 @@
+"""Overdue sweep and job locks
+
+Revision ID: a8d4e61b3f27
+Revises: 7c3a5f0e2b91
+Create Date: 2026-10-19 09:44:27.905316
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d4e61b3f27"
+down_revision: Union[str, Sequence[str], None] = "7c3a5f0e2b91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "tasks", sa.Column("overdue_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_table(
+        "job_locks",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("owner", sa.String(length=200), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("job_locks")
+    op.drop_column("tasks", "overdue_at")
@@ -0,0 +1,33 @@
+from typing import Any, Callable, Dict
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp
+
+
+class DeferredApp(FastAPI):
+    """
+    A FastAPI application whose middlewares, routes and exception handlers are
+    registered by `setup` when it first runs (lifespan startup or first request),
+    or when its OpenAPI schema is first asked for, rather than when it is built:
+    the routers pull in every use case, repository and SQLAlchemy model.
+    """
+
+    def __init__(self, setup: Callable[[FastAPI], None], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._setup: Callable[[FastAPI], None] | None = setup
+
+    def load(self) -> None:
+        """
+        Register everything now, e.g. before forking the workers of a preloaded app.
+        """
+        if self._setup is not None:
+            setup, self._setup = self._setup, None
+            setup(self)
+
+    def build_middleware_stack(self) -> ASGIApp:
+        self.load()
+        return super().build_middleware_stack()
+
+    def openapi(self) -> Dict[str, Any]:
+        self.load()
+        return super().openapi()
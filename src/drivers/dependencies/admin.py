@@ -0,0 +1,24 @@
+import hmac
+
+from fastapi import Depends, Header, HTTPException, status
+
+from drivers.config.settings import BaseSettings, Environment, get_settings
+
+
+async def require_admin(
+    x_admin_token: str | None = Header(None),
+    settings: BaseSettings = Depends(get_settings),
+) -> None:
+    """
+    Router dependency of the admin endpoints, which expose SQL text, plans and load
+    data: in production they answer 404 unless the X-Admin-Token header carries the
+    `admin_token`, and always do when it isn't set.
+    """
+    if settings.env != Environment.prod:
+        return
+    if (
+        settings.admin_token is None
+        or x_admin_token is None
+        or not hmac.compare_digest(x_admin_token, settings.admin_token)
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
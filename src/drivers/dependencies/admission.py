@@ -0,0 +1,48 @@
+from functools import lru_cache
+from typing import AsyncIterator, Callable
+
+from fastapi import Depends
+
+from drivers.config.settings import get_settings
+from drivers.helpers.admission import AdmissionController, RouteClass
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController | None:
+    settings = get_settings()
+    if not settings.admission_enabled:
+        return None
+
+    # As many requests as the pool has connections, the heavy ones get a share
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    limits = {
+        RouteClass.LIST: capacity // 2,
+        RouteClass.EXPORT: capacity // 4,
+    }
+    limits.update(
+        {RouteClass(name): limit for name, limit in settings.admission_limits.items()}
+    )
+    return AdmissionController(
+        capacity=capacity,
+        limits=limits,
+        queue_size=settings.admission_queue_size,
+        max_wait=settings.admission_max_wait_ms / 1000,
+    )
+
+
+def admission(route_class: RouteClass) -> Callable[..., AsyncIterator[None]]:
+    """
+    Route dependency holding an admission slot of `route_class` for the request.
+    Declare it in the route `dependencies` so it runs before the session is opened.
+    """
+
+    async def admit(
+        controller: AdmissionController | None = Depends(get_admission_controller),
+    ) -> AsyncIterator[None]:
+        if controller is None:
+            yield
+            return
+        async with controller.admit(route_class):
+            yield
+
+    return admit
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import Any, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
+from adapters.repositories.task_repositories.buffered_task_writer import (
+    BufferedTaskWriter,
+)
+from drivers.config.settings import BaseSettings, get_settings
+from drivers.dependencies.database import (
+    sqlAlchemySessionMaker,
+    sqlAlchemyShardSessionMakers,
+)
+from drivers.dependencies.events import get_task_event_broker
+from drivers.dependencies.single_writer import SingleWriter, sqliteSingleWriter
+from drivers.dependencies.slow_query_log import get_slow_query_log
+from drivers.dependencies.write_buffer import taskWriteBuffer
+
+
+class Container:
+    """
+    The application-scoped components, resolved once instead of through a chain of
+    `Depends` on every request. The session-bound objects (repositories and use
+    cases) are still built per request, by their `Depends` providers, from the
+    container.
+
+    The engines are read from their holders on each access: the lifespan replaces
+    them, and a forked worker forgets them.
+    """
+
+    @cached_property
+    def settings(self) -> BaseSettings:
+        return get_settings()
+
+    @cached_property
+    def slow_query_log(self) -> SlowQueryLog | None:
+        return get_slow_query_log()
+
+    @cached_property
+    def event_broker(self) -> InMemoryEventBroker:
+        return get_task_event_broker()
+
+    @property
+    def session_maker(self) -> async_sessionmaker[AsyncSession | Any]:
+        return sqlAlchemySessionMaker(self.settings, self.slow_query_log)
+
+    @property
+    def shard_session_makers(self) -> List[async_sessionmaker[AsyncSession | Any]]:
+        return sqlAlchemyShardSessionMakers(self.settings, self.slow_query_log)
+
+    @property
+    def single_writer(self) -> SingleWriter | None:
+        return sqliteSingleWriter()
+
+    @property
+    def write_buffer(self) -> BufferedTaskWriter | None:
+        return taskWriteBuffer()
+
+    def reset(self) -> None:
+        """
+        Forget the components resolved so far, e.g. once the settings changed.
+        """
+        self.__dict__.clear()
+
+
+container = Container()
+
+
+async def get_container() -> Container:
+    return container
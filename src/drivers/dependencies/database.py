@@ -1,34 +1,173 @@
 import logging
-from typing import Any, AsyncGenerator
+import os
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Sequence,
+)
 
 from fastapi import Depends
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from adapters.connection_engines.sql_alchemy.session import get_session_maker
-from drivers.config.settings import get_settings
+from adapters.connection_engines.sql_alchemy.session import (
+    dispose_session_maker,
+    get_session_maker,
+    warm_up_pool,
+)
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from drivers.config.settings import BaseSettings, get_settings
+from drivers.dependencies.slow_query_log import get_slow_query_log
 
 logger = logging.getLogger("db")
 
 
+WarmUpQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
 class SqlAlchemySessionMaker:
     def __init__(self) -> None:
         self._engine: async_sessionmaker[AsyncSession | Any] | None = None
+        # True once the engine is created and warmed up by the application lifespan
+        self.ready = False
+
+    async def start(
+        self,
+        settings: BaseSettings,
+        slow_query_log: SlowQueryLog | None = None,
+        warm_up_queries: Sequence[WarmUpQuery] = (),
+    ) -> None:
+        """
+        Create the engine, open the warm-up connections and run the warm-up queries
+        so the first requests find an established pool and a primed statement cache.
+        """
+        # Replace any engine created lazily before the lifespan started
+        await self.stop()
+
+        logger.info("Create SQLAlchemy engine")
+        self._engine = get_session_maker(settings, slow_query_log=slow_query_log)
+
+        connections = min(settings.db_pool_warmup_connections, settings.db_pool_size)
+        if connections > 0:
+            await warm_up_pool(self._engine, connections)
+
+        for query in warm_up_queries:
+            async with self._engine() as session:
+                try:
+                    await query(session)
+                except SQLAlchemyError as exception:
+                    logger.warning("Warm-up query failed: %s", exception)
+                finally:
+                    await session.rollback()
 
-    def __call__(self, settings=Depends(get_settings)):
+        self.ready = True
+
+    def reset_after_fork(self) -> None:
+        """
+        Forget an engine inherited from the parent process without closing its
+        connections (they still belong to the parent), so the worker creates its own.
+        """
+        if self._engine is not None:
+            self._engine.kw["bind"].sync_engine.dispose(close=False)
+        self._engine = None
+        self.ready = False
+
+    async def stop(self) -> None:
+        self.ready = False
+        if self._engine is None:
+            return
+
+        logger.info("Dispose SQLAlchemy engine")
+        await dispose_session_maker(self._engine)
+        self._engine = None
+
+    def __call__(
+        self,
+        settings=Depends(get_settings),
+        slow_query_log=Depends(get_slow_query_log),
+    ):
         if self._engine is not None:
             logger.info("Get the engine from the cache")
             return self._engine
 
+        # Outside of the application lifespan (e.g. test clients), create it lazily
         logger.info("Create SQLAlchemy engine")
-        self._engine = get_session_maker(settings)
+        self._engine = get_session_maker(settings, slow_query_log=slow_query_log)
         return self._engine
 
 
 sqlAlchemySessionMaker = SqlAlchemySessionMaker()
+os.register_at_fork(after_in_child=sqlAlchemySessionMaker.reset_after_fork)
+
+
+class SqlAlchemyShardSessionMakers:
+    """
+    One engine per task shard (`db_shard_names`), none when the tasks aren't sharded.
+    """
+
+    def __init__(self) -> None:
+        self._engines: List[async_sessionmaker[AsyncSession | Any]] | None = None
+
+    async def start(
+        self, settings: BaseSettings, slow_query_log: SlowQueryLog | None = None
+    ) -> None:
+        await self.stop()
+        if settings.db_shard_names:
+            logger.info("Create %s shard engines", len(settings.db_shard_names))
+        self._engines = self._create(settings, slow_query_log)
+
+    def reset_after_fork(self) -> None:
+        for engine in self._engines or []:
+            engine.kw["bind"].sync_engine.dispose(close=False)
+        self._engines = None
+
+    async def stop(self) -> None:
+        engines, self._engines = self._engines or [], None
+        for engine in engines:
+            await dispose_session_maker(engine)
+
+    def __call__(
+        self,
+        settings=Depends(get_settings),
+        slow_query_log=Depends(get_slow_query_log),
+    ) -> List[async_sessionmaker[AsyncSession | Any]]:
+        if self._engines is None:
+            # Outside of the application lifespan (e.g. test clients)
+            self._engines = self._create(settings, slow_query_log)
+        return self._engines
+
+    @staticmethod
+    def _create(
+        settings: BaseSettings, slow_query_log: SlowQueryLog | None
+    ) -> List[async_sessionmaker[AsyncSession | Any]]:
+        return [
+            get_session_maker(settings, slow_query_log=slow_query_log, database_url=url)
+            for url in settings.shard_database_urls
+        ]
+
+
+sqlAlchemyShardSessionMakers = SqlAlchemyShardSessionMakers()
+os.register_at_fork(after_in_child=sqlAlchemyShardSessionMakers.reset_after_fork)
+
+
+@asynccontextmanager
+async def session_scope(
+    engine: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncSession]:
+    """
+    One session and transaction per request, committed when the request succeeds.
+    """
+    async with engine() as session, session.begin():
+        yield session
 
 
 async def get_db_session(
     engine: SqlAlchemySessionMaker = Depends(sqlAlchemySessionMaker),
 ) -> AsyncGenerator[AsyncSession, None]:
-    async with engine() as session, session.begin():
+    async with session_scope(engine) as session:  # type: ignore[arg-type]
         yield session
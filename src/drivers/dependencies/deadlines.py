@@ -0,0 +1,52 @@
+import asyncio
+from typing import AsyncIterator, Callable
+
+from fastapi import Depends, Request
+
+from adapters.connection_engines.sql_alchemy.deadlines import Deadline, deadline_scope
+from drivers.config.settings import BaseSettings, get_settings
+from drivers.helpers.admission import RouteClass
+from drivers.helpers.deadlines import (
+    ClientDisconnected,
+    DeadlineExceeded,
+    cancel_on_disconnect,
+)
+
+
+def deadline(route_class: RouteClass) -> Callable[..., AsyncIterator[Deadline | None]]:
+    """
+    Route dependency bounding the request by the deadline of `route_class`: the
+    use case is cancelled, and its statements interrupted, when the deadline passes
+    or the client disconnects.
+    Declare it with scope="function" so it ends with the endpoint, before the response.
+    """
+
+    async def enforce_deadline(
+        request: Request,
+        settings: BaseSettings = Depends(get_settings),
+    ) -> AsyncIterator[Deadline | None]:
+        deadline_ms = settings.request_deadlines_ms.get(route_class.value)
+        if deadline_ms is None:
+            yield None
+            return
+
+        with deadline_scope(deadline_ms / 1000) as request_deadline:
+            watcher = None
+            try:
+                async with asyncio.timeout(deadline_ms / 1000) as timeout:
+                    watcher = asyncio.create_task(
+                        cancel_on_disconnect(request, request_deadline, timeout)
+                    )
+                    yield request_deadline
+            except Exception as exception:
+                # Cancelled by the timeout, or a statement interrupted by the database
+                if request_deadline.cancelled:
+                    raise ClientDisconnected() from exception
+                if request_deadline.expired():
+                    raise DeadlineExceeded(deadline_ms) from exception
+                raise
+            finally:
+                if watcher is not None:
+                    watcher.cancel()
+
+    return enforce_deadline
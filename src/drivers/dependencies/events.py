@@ -0,0 +1,9 @@
+from functools import lru_cache
+
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
+from drivers.config.settings import get_settings
+
+
+@lru_cache()
+def get_task_event_broker() -> InMemoryEventBroker:
+    return InMemoryEventBroker(max_queue_size=get_settings().event_queue_size)
@@ -1,11 +1,13 @@
 from functools import partial
 
-from fastapi import Depends, Request
+from fastapi import Request
 
-from drivers.helpers.hetoas import ListingParams, create_hateoas_response
+from drivers.helpers.hetoas import create_hateoas_response
 
 
-def hateoas_dependency(request: Request, listing_params: ListingParams = Depends()):
-    return partial(
-        create_hateoas_response, request=request, listing_params=listing_params
-    )
+async def hateoas_dependency(request: Request):
+    """
+    The HATEOAS response builder of the request, given the listing parameters the
+    route parsed already.
+    """
+    return partial(create_hateoas_response, request=request)
@@ -0,0 +1,89 @@
+import hashlib
+from typing import Any, AsyncIterator
+
+from fastapi import Depends, Header, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.idempotency_stores.sql_alchemy_idempotency_store import (
+    SqlAlchemyIdempotencyStore,
+)
+from drivers.config.settings import BaseSettings, get_settings
+from drivers.dependencies.database import SqlAlchemySessionMaker, sqlAlchemySessionMaker
+from drivers.helpers.idempotency import IdempotentReplay
+
+
+class IdempotencyStore:
+    """
+    The idempotency store of the application's engine, created on first use.
+    """
+
+    def __init__(self) -> None:
+        self._store: SqlAlchemyIdempotencyStore | None = None
+
+    def __call__(
+        self,
+        settings: BaseSettings = Depends(get_settings),
+        engine: SqlAlchemySessionMaker = Depends(sqlAlchemySessionMaker),
+    ) -> SqlAlchemyIdempotencyStore:
+        session_maker: async_sessionmaker[AsyncSession | Any] = engine  # type: ignore[assignment]
+        if self._store is None or self._store.session_maker is not session_maker:
+            self._store = SqlAlchemyIdempotencyStore(
+                session_maker,
+                ttl=settings.idempotency_ttl_seconds,
+                lock_ttl=settings.idempotency_lock_seconds,
+                cache_size=settings.idempotency_cache_size,
+                wait_timeout=settings.idempotency_wait_seconds,
+            )
+        return self._store
+
+
+idempotencyStore = IdempotencyStore()
+
+
+class IdempotentRequest:
+    """
+    A request holding its idempotency key: the endpoint sets the response to store.
+    """
+
+    def __init__(self) -> None:
+        self.response: tuple[int, str] | None = None
+
+    def set_response(self, status_code: int, body: str) -> None:
+        self.response = (status_code, body)
+
+
+async def idempotent_request(
+    request: Request,
+    idempotency_key: str | None = Header(
+        None, alias="Idempotency-Key", min_length=1, max_length=255
+    ),
+    store: SqlAlchemyIdempotencyStore = Depends(idempotencyStore),
+) -> AsyncIterator[IdempotentRequest | None]:
+    """
+    Replay the stored response of a known Idempotency-Key (IdempotentReplay), or
+    reserve the key and store the response set by the endpoint once the request
+    (and its transaction) succeeded. Declare it before the dependencies opening a
+    session: a replay never touches them.
+    """
+    if idempotency_key is None:
+        yield None
+        return
+
+    body = await request.body()
+    request_hash = hashlib.sha256(
+        f"{request.method} {request.url.path}\n".encode() + body
+    ).hexdigest()
+    stored = await store.reserve(idempotency_key, request_hash)
+    if stored is not None:
+        raise IdempotentReplay(stored)
+
+    idempotent = IdempotentRequest()
+    try:
+        yield idempotent
+    except BaseException:
+        await store.release(idempotency_key)
+        raise
+    if idempotent.response is None:
+        await store.release(idempotency_key)
+    else:
+        await store.complete(idempotency_key, request_hash, *idempotent.response)
@@ -1,13 +1,123 @@
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Sequence
+
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from adapters.repositories.task_repositories.sharded_task_repository import (
+    ShardedTaskRepository,
+)
 from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
     SqlAlchemyTaskRepository,
 )
-from drivers.dependencies.database import get_db_session
+from domain.exceptions.common import DatabaseException
+from drivers.dependencies.container import Container, get_container
+from drivers.dependencies.database import session_scope
+from drivers.dependencies.single_writer import SingleWriter
+from ports.task_repository_interface import (
+    TaskRepositoryInterface,
+    TaskRepositoryScope,
+)
+from ports.task_writer_interface import TaskWriterInterface
+
+
+@asynccontextmanager
+async def sharded_repository_scope(
+    shard_engines: Sequence[async_sessionmaker[AsyncSession | Any]],
+) -> AsyncIterator[ShardedTaskRepository]:
+    """
+    A repository over one transaction per shard, each committed when the scope
+    exits without error.
+    """
+    async with AsyncExitStack() as stack:
+        sessions = [
+            await stack.enter_async_context(session_scope(engine))
+            for engine in shard_engines
+        ]
+        yield ShardedTaskRepository(
+            [SqlAlchemyTaskRepository(session) for session in sessions]
+        )
+
+
+@asynccontextmanager
+async def single_writer_repository_scope(
+    single_writer: SingleWriter,
+) -> AsyncIterator[SqlAlchemyTaskRepository]:
+    """
+    A repository reading on a read-only connection, its writes queued to the writer.
+    """
+    async with session_scope(single_writer.readers) as session:  # type: ignore[arg-type]
+        yield SqlAlchemyTaskRepository(session, write_queue=single_writer.write_queue)
+
+
+def task_repository_scope(container: Container) -> TaskRepositoryScope:
+    """
+    Repositories in transactions of their own, on the shards, through the single
+    writer or on the application database.
+    """
+
+    @asynccontextmanager
+    async def repository_scope() -> AsyncIterator[TaskRepositoryInterface]:
+        shard_engines = container.shard_session_makers
+        if shard_engines:
+            async with sharded_repository_scope(shard_engines) as repository:
+                yield repository
+            return
+
+        single_writer = container.single_writer
+        if single_writer is not None:
+            async with single_writer_repository_scope(single_writer) as repository:
+                yield repository
+            return
+
+        async with session_scope(container.session_maker) as session:  # type: ignore[arg-type]
+            yield SqlAlchemyTaskRepository(session)
+
+    return repository_scope
+
+
+async def get_task_repository(
+    container: Container = Depends(get_container),
+) -> AsyncGenerator[TaskRepositoryInterface, None]:
+    async with task_repository_scope(container)() as repository:
+        yield repository
+
+
+async def get_task_writer(
+    container: Container = Depends(get_container),
+) -> AsyncGenerator[TaskWriterInterface, None]:
+    write_buffer = container.write_buffer
+    # The write buffer only writes to the application database, and the write
+    # queue of the single writer batches the creations already
+    if (
+        write_buffer is not None
+        and not container.shard_session_makers
+        and container.single_writer is None
+    ):
+        # Group commit: the buffer runs its own transactions
+        yield write_buffer
+        return
+
+    async with task_repository_scope(container)() as repository:
+        yield repository
+
+
+async def get_task_repository_scope(
+    container: Container = Depends(get_container),
+) -> TaskRepositoryScope:
+    """
+    Repositories in transactions of their own, for the work committed in steps.
+    """
+    scope = task_repository_scope(container)
 
+    @asynccontextmanager
+    async def repository_scope() -> AsyncIterator[TaskRepositoryInterface]:
+        try:
+            async with scope() as repository:
+                yield repository
+        except SQLAlchemyError as exception:
+            # Failed commits included
+            raise DatabaseException from exception
 
-def get_task_repository(
-    db_session: AsyncSession = Depends(get_db_session),
-) -> SqlAlchemyTaskRepository:
-    return SqlAlchemyTaskRepository(db_session)
+    return repository_scope
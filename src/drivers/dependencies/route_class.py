@@ -0,0 +1,18 @@
+from typing import Any, List
+
+from fastapi import Depends
+
+from drivers.dependencies.admission import admission
+from drivers.dependencies.deadlines import deadline
+from drivers.helpers.admission import RouteClass
+
+
+def route_class_dependencies(route_class: RouteClass) -> List[Any]:
+    """
+    Route `dependencies` of the routes of a cost class: an admission slot, held until
+    the response is sent, then the deadline, which ends with the endpoint.
+    """
+    return [
+        Depends(admission(route_class)),
+        Depends(deadline(route_class), scope="function"),
+    ]
@@ -0,0 +1,77 @@
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.connection_engines.sql_alchemy.session import (
+    dispose_session_maker,
+    get_single_writer_session_makers,
+)
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from adapters.connection_engines.sql_alchemy.write_queue import WriteQueue
+from drivers.config.settings import BaseSettings
+
+logger = logging.getLogger("db")
+
+
+@dataclass
+class SingleWriter:
+    # The one read-write connection, and the queue of the writes it runs
+    writer: async_sessionmaker[AsyncSession | Any]
+    write_queue: WriteQueue
+    # Read-only connections
+    readers: async_sessionmaker[AsyncSession | Any]
+
+
+class SqliteSingleWriter:
+    """
+    The SQLite writer connection with its write queue and the read-only connections,
+    started by the application lifespan when `sqlite_single_writer_enabled` is set.
+    """
+
+    def __init__(self) -> None:
+        self._single_writer: SingleWriter | None = None
+
+    async def start(
+        self, settings: BaseSettings, slow_query_log: SlowQueryLog | None = None
+    ) -> None:
+        if not settings.sqlite_single_writer_enabled:
+            return
+        if not settings.database_url.startswith("sqlite"):
+            logger.warning("The single writer mode only applies to SQLite")
+            return
+
+        logger.info(
+            "SQLite single writer (write batches of up to %s)",
+            settings.sqlite_write_batch_size,
+        )
+        writer, readers = get_single_writer_session_makers(settings, slow_query_log)
+        # The writer connects first: it switches the database to WAL, which the
+        # read-only connections need to open it
+        async with writer() as session:
+            await session.execute(text("SELECT 1"))
+        self._single_writer = SingleWriter(
+            writer=writer,
+            write_queue=WriteQueue(
+                writer,  # type: ignore[arg-type]
+                max_batch=settings.sqlite_write_batch_size,
+            ),
+            readers=readers,
+        )
+
+    async def stop(self) -> None:
+        single_writer, self._single_writer = self._single_writer, None
+        if single_writer is None:
+            return
+
+        await single_writer.write_queue.stop()
+        await dispose_session_maker(single_writer.readers)
+        await dispose_session_maker(single_writer.writer)
+
+    def __call__(self) -> SingleWriter | None:
+        return self._single_writer
+
+
+sqliteSingleWriter = SqliteSingleWriter()
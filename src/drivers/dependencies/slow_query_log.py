@@ -0,0 +1,17 @@
+from functools import lru_cache
+
+from adapters.connection_engines.sql_alchemy.slow_query_log import SlowQueryLog
+from drivers.config.settings import get_settings
+
+
+@lru_cache()
+def get_slow_query_log() -> SlowQueryLog | None:
+    settings = get_settings()
+    if settings.slow_query_threshold_ms is None:
+        return None
+
+    return SlowQueryLog(
+        threshold_ms=settings.slow_query_threshold_ms,
+        rate_limit=settings.slow_query_rate_limit,
+        buffer_size=settings.slow_query_buffer_size,
+    )
@@ -1,25 +1,64 @@
 from fastapi import Depends
 
-from drivers.dependencies.repositories import get_task_repository
-from ports.task_repository_interface import TaskRepositoryInterface
+from drivers.dependencies.container import Container, get_container
+from drivers.dependencies.repositories import (
+    get_task_repository,
+    get_task_repository_scope,
+    get_task_writer,
+)
+from ports.task_repository_interface import (
+    TaskRepositoryInterface,
+    TaskRepositoryScope,
+)
+from ports.task_writer_interface import TaskWriterInterface
 from use_cases.tasks.complete_task_usecase import CompleteTaskUseCase
 from use_cases.tasks.create_task_usecase import CreateTaskUseCase
+from use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
+from use_cases.tasks.delete_tasks_usecase import DeleteTasksUseCase
 from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+from use_cases.tasks.import_tasks_usecase import ImportTasksUseCase
+from use_cases.tasks.list_task_changes_usecase import ListTaskChangesUseCase
 
 
-def get_create_task_usecase(
-    repository: TaskRepositoryInterface = Depends(get_task_repository),
+async def get_create_task_usecase(
+    repository: TaskWriterInterface = Depends(get_task_writer),
+    container: Container = Depends(get_container),
 ) -> CreateTaskUseCase:
-    return CreateTaskUseCase(repository)
+    return CreateTaskUseCase(repository, container.event_broker)
 
 
-def get_complete_task_usecase(
+async def get_complete_task_usecase(
     repository: TaskRepositoryInterface = Depends(get_task_repository),
+    container: Container = Depends(get_container),
 ) -> CompleteTaskUseCase:
-    return CompleteTaskUseCase(repository)
+    return CompleteTaskUseCase(repository, container.event_broker)
 
 
-def get_get_all_tasks_usecase(
+async def get_delete_task_usecase(
+    repository: TaskRepositoryInterface = Depends(get_task_repository),
+) -> DeleteTaskUseCase:
+    return DeleteTaskUseCase(repository)
+
+
+async def get_delete_tasks_usecase(
+    repository_scope: TaskRepositoryScope = Depends(get_task_repository_scope),
+) -> DeleteTasksUseCase:
+    return DeleteTasksUseCase(repository_scope)
+
+
+async def get_import_tasks_usecase(
+    repository_scope: TaskRepositoryScope = Depends(get_task_repository_scope),
+) -> ImportTasksUseCase:
+    return ImportTasksUseCase(repository_scope)
+
+
+async def get_get_all_tasks_usecase(
     repository: TaskRepositoryInterface = Depends(get_task_repository),
 ) -> ListAllTasksUseCase:
     return ListAllTasksUseCase(repository)
+
+
+async def get_list_task_changes_usecase(
+    repository: TaskRepositoryInterface = Depends(get_task_repository),
+) -> ListTaskChangesUseCase:
+    return ListTaskChangesUseCase(repository)
@@ -0,0 +1,53 @@
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.repositories.task_repositories.buffered_task_writer import (
+    BufferedTaskWriter,
+)
+from drivers.config.settings import BaseSettings
+
+logger = logging.getLogger("db")
+
+
+class TaskWriteBuffer:
+    """
+    The group-commit buffer of task creations, started by the application lifespan
+    when `write_buffer_enabled` is set.
+    """
+
+    def __init__(self) -> None:
+        self._writer: BufferedTaskWriter | None = None
+
+    def start(
+        self,
+        settings: BaseSettings,
+        session_maker: async_sessionmaker[AsyncSession | Any],
+    ) -> None:
+        if not settings.write_buffer_enabled:
+            return
+
+        logger.info(
+            "Group commit of task creations (window=%sms, max_batch=%s)",
+            settings.write_buffer_window_ms,
+            settings.write_buffer_max_batch,
+        )
+        self._writer = BufferedTaskWriter(
+            session_maker,
+            window_ms=settings.write_buffer_window_ms,
+            max_batch=settings.write_buffer_max_batch,
+        )
+
+    async def stop(self) -> None:
+        if self._writer is None:
+            return
+
+        writer, self._writer = self._writer, None
+        await writer.stop()
+
+    def __call__(self) -> BufferedTaskWriter | None:
+        return self._writer
+
+
+taskWriteBuffer = TaskWriteBuffer()
@@ -1,14 +1,27 @@
 from fastapi import FastAPI, Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from adapters.idempotency_stores.sql_alchemy_idempotency_store import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
 from domain.exceptions.common import (
     EntityAlreadyExists,
     EntityNotFound,
     InvalidEntityReference,
+    InvalidImportFile,
+)
+from domain.exceptions.task_exception import (
+    TaskCannotBeCompleted,
+    TaskCannotBeDeleted,
+    TaskUpdateFailed,
 )
-from domain.exceptions.task_exception import TaskCannotBeCompleted, TaskCannotBeDeleted, TaskUpdateFailed
+from drivers.helpers.admission import AdmissionRejected
+from drivers.helpers.deadlines import ClientDisconnected, DeadlineExceeded
+from drivers.helpers.idempotency import REPLAYED_HEADER, IdempotentReplay
+from drivers.helpers.task_import import UnsupportedImportFormat
 
 
 def add_handlers(app: FastAPI) -> None:
@@ -21,6 +34,16 @@ def add_handlers(app: FastAPI) -> None:
     app.add_exception_handler(TaskCannotBeCompleted, http_400_exception_handler)
     app.add_exception_handler(TaskCannotBeDeleted, http_400_exception_handler)
     app.add_exception_handler(TaskUpdateFailed, http_409_exception_handler)
+    app.add_exception_handler(AdmissionRejected, http_503_exception_handler)
+    app.add_exception_handler(DeadlineExceeded, http_504_exception_handler)
+    app.add_exception_handler(ClientDisconnected, http_499_exception_handler)
+    app.add_exception_handler(InvalidImportFile, http_422_exception_handler)
+    app.add_exception_handler(UnsupportedImportFormat, http_415_exception_handler)
+    app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
+    app.add_exception_handler(IdempotencyKeyReused, http_422_exception_handler)
+    app.add_exception_handler(
+        IdempotencyKeyInProgress, http_409_retry_exception_handler
+    )
 
 
 async def pydantic_validation_exception_handler(
@@ -74,8 +97,58 @@ async def http_413_exception_handler(request: Request, exc: Exception) -> JSONRe
     )
 
 
+async def http_415_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=415,
+        content=jsonable_encoder({"detail": str(exc)}),
+    )
+
+
 async def http_500_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     return JSONResponse(
         status_code=500,
         content=jsonable_encoder({"detail": str(exc)}),
     )
+
+
+async def http_503_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content=jsonable_encoder({"detail": str(exc)}),
+        headers={"Retry-After": str(exc.retry_after)},  # type: ignore[attr-defined]
+    )
+
+
+async def http_504_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(
+        status_code=504,
+        content=jsonable_encoder({"detail": str(exc)}),
+    )
+
+
+async def http_499_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    # Nobody reads it: the status is for the access logs
+    return JSONResponse(
+        status_code=499,
+        content=jsonable_encoder({"detail": str(exc)}),
+    )
+
+
+async def http_409_retry_exception_handler(
+    request: Request, exc: Exception
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=409,
+        content=jsonable_encoder({"detail": str(exc)}),
+        headers={"Retry-After": str(exc.retry_after)},  # type: ignore[attr-defined]
+    )
+
+
+async def idempotent_replay_handler(request: Request, exc: Exception) -> Response:
+    stored = exc.response  # type: ignore[attr-defined]
+    return Response(
+        content=stored.body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"},
+    )
@@ -0,0 +1,192 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, AsyncIterator, Deque, Dict, Mapping
+
+# Service time assumed for a route class until one of its requests completed
+DEFAULT_SERVICE_TIME = 0.05
+# Weight of the last request in the moving average of the service time
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class RouteClass(str, Enum):
+    """
+    Cost classes of the routes, from the cheapest to the heaviest.
+    When requests wait for a slot, the cheaper classes are served first.
+    """
+
+    POINT_READ = "point_read"
+    WRITE = "write"
+    LIST = "list"
+    EXPORT = "export"
+
+
+PRIORITIES = {route_class: index for index, route_class in enumerate(RouteClass)}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is shed instead of waiting for a slot."""
+
+    def __init__(self, route_class: RouteClass, reason: str, retry_after: float):
+        self.route_class = route_class
+        self.reason = reason
+        # Whole seconds, as sent in the Retry-After header
+        self.retry_after = max(1, math.ceil(retry_after))
+
+    def __str__(self):
+        return f"Server overloaded ({self.route_class.value}: {self.reason})"
+
+
+@dataclass
+class RouteClassState:
+    limit: int
+    queue_size: int
+    active: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    # Moving average of the time a request holds its slot, in seconds
+    service_time: float = DEFAULT_SERVICE_TIME
+    waiters: Deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+class AdmissionController:
+    """
+    Bound the requests running at once, overall (`capacity`, the database
+    connections) and per route class (`limits`).
+
+    A request that can't start waits in the bounded queue of its class. It is
+    rejected right away when that queue is full or when its estimated wait is over
+    `max_wait`, and when it is still waiting after `max_wait`: the client retries
+    later instead of piling up on the connection pool.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        limits: Mapping[RouteClass, int],
+        queue_size: int,
+        max_wait: float,
+    ) -> None:
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.active = 0
+        self._states = {
+            route_class: RouteClassState(
+                limit=max(1, min(limits.get(route_class, capacity), capacity)),
+                queue_size=queue_size,
+            )
+            for route_class in RouteClass
+        }
+
+    @asynccontextmanager
+    async def admit(self, route_class: RouteClass) -> AsyncIterator[None]:
+        state = self._states[route_class]
+        await self._acquire(route_class, state)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release(state, time.perf_counter() - start)
+
+    def estimated_wait(self, route_class: RouteClass) -> float:
+        """
+        Seconds a new request of the class would wait for a slot.
+        """
+        state = self._states[route_class]
+        if self._can_start(route_class, state):
+            return 0.0
+        return (len(state.waiters) + 1) / state.limit * state.service_time
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "active": self.active,
+            "max_wait_ms": self.max_wait * 1000,
+            "route_classes": {
+                route_class.value: {
+                    "limit": state.limit,
+                    "active": state.active,
+                    "queued": len(state.waiters),
+                    "queue_size": state.queue_size,
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "timed_out": state.timed_out,
+                    "service_time_ms": state.service_time * 1000,
+                    "estimated_wait_ms": self.estimated_wait(route_class) * 1000,
+                }
+                for route_class, state in self._states.items()
+            },
+        }
+
+    def _can_start(self, route_class: RouteClass, state: RouteClassState) -> bool:
+        if state.waiters or state.active >= state.limit or self.active >= self.capacity:
+            return False
+        # Don't take a slot that a cheaper request is waiting for
+        return not any(
+            other.waiters and other.active < other.limit
+            for other_class, other in self._states.items()
+            if PRIORITIES[other_class] < PRIORITIES[route_class]
+        )
+
+    async def _acquire(self, route_class: RouteClass, state: RouteClassState) -> None:
+        if self._can_start(route_class, state):
+            self._start(state)
+            return
+
+        if len(state.waiters) >= state.queue_size:
+            state.rejected += 1
+            raise AdmissionRejected(route_class, "queue full", self.max_wait)
+        wait = self.estimated_wait(route_class)
+        if wait > self.max_wait:
+            state.rejected += 1
+            raise AdmissionRejected(route_class, "estimated wait too long", wait)
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.max_wait)
+        except (TimeoutError, asyncio.CancelledError) as exception:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the request gave up
+                self._release(state, None)
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+            if isinstance(exception, TimeoutError):
+                state.timed_out += 1
+                raise AdmissionRejected(
+                    route_class, "waited too long", self.max_wait
+                ) from None
+            raise
+
+    def _start(self, state: RouteClassState) -> None:
+        state.active += 1
+        state.admitted += 1
+        self.active += 1
+
+    def _release(self, state: RouteClassState, duration: float | None) -> None:
+        state.active -= 1
+        self.active -= 1
+        if duration is not None:
+            state.service_time += SERVICE_TIME_SMOOTHING * (
+                duration - state.service_time
+            )
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # Hand the free slots over, cheapest route classes first
+        for state in self._states.values():
+            while (
+                state.waiters
+                and state.active < state.limit
+                and self.active < self.capacity
+            ):
+                waiter = state.waiters.popleft()
+                if waiter.done():
+                    continue
+                self._start(state)
+                waiter.set_result(None)
@@ -0,0 +1,24 @@
+import logging
+from typing import AsyncIterator
+
+from domain.value_objects.task_deletion import TaskDeletionProgress
+from drivers.api.v1.tasks.schema import TaskBulkDeleteProgress
+
+logger = logging.getLogger("db")
+
+
+async def stream_bulk_delete(
+    progress: AsyncIterator[TaskDeletionProgress],
+) -> AsyncIterator[str]:
+    """
+    The progress as newline-delimited JSON.
+    """
+    async for step in progress:
+        error = None
+        if step.failure is not None:
+            logger.error("Bulk deletion of tasks failed: %s", step.failure.__cause__)
+            error = "Database error"
+        line = TaskBulkDeleteProgress(
+            deleted=step.deleted, total=step.total, done=step.done, error=error
+        )
+        yield line.model_dump_json(exclude_none=True) + "\n"
@@ -0,0 +1,28 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from domain.value_objects.change_feed import ChangePosition
+
+
+def encode_change_token(position: ChangePosition) -> str:
+    """
+    Opaque continuation token of a change feed position.
+    """
+    raw = f"{position.updated_at.isoformat()}|{position.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_change_token(token: str) -> ChangePosition:
+    """
+    Raises ValueError when the token was not built by encode_change_token.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        updated_at, _, entity_id = raw.partition("|")
+        return ChangePosition(
+            updated_at=datetime.fromisoformat(updated_at), id=UUID(entity_id)
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exception:
+        raise ValueError("Invalid change token") from exception
@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import Request
+
+from adapters.connection_engines.sql_alchemy.deadlines import Deadline
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request runs past the deadline of its route."""
+
+    def __init__(self, deadline_ms: float) -> None:
+        self.deadline_ms = deadline_ms
+
+    def __str__(self):
+        return f"Request took longer than {self.deadline_ms:g} ms"
+
+
+class ClientDisconnected(Exception):
+    """Raised when the client went away before the response was ready."""
+
+    def __str__(self):
+        return "Client disconnected"
+
+
+async def cancel_on_disconnect(
+    request: Request, deadline: Deadline, timeout: asyncio.Timeout
+) -> None:
+    """
+    Wait for the client to disconnect, then expire the deadline at once:
+    the running statement is interrupted and the request task cancelled.
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            break
+    deadline.cancel()
+    timeout.reschedule(asyncio.get_running_loop().time())
@@ -1,4 +1,5 @@
 from typing import Any, Dict, List
+from urllib.parse import urlencode
 
 from fastapi import Request
 from pydantic import BaseModel, PositiveInt
@@ -47,7 +48,7 @@ def build_pagination_links(
     query_params.pop("limit", None)
 
     # Build query string from remaining params
-    extra_params = "&".join(f"{k}={v}" for k, v in query_params.items())
+    extra_params = urlencode(query_params, safe=",")
     separator = "&" if extra_params else ""
 
     # Calculate total pages
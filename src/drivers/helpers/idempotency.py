@@ -0,0 +1,11 @@
+from adapters.idempotency_stores.sql_alchemy_idempotency_store import StoredResponse
+
+# Header set on the responses replayed from the idempotency store
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotentReplay(Exception):
+    """Raised to answer a request with the stored response of its idempotency key."""
+
+    def __init__(self, response: StoredResponse) -> None:
+        self.response = response
@@ -0,0 +1,49 @@
+import asyncio
+from dataclasses import asdict
+from functools import lru_cache
+from typing import AsyncIterator
+
+from adapters.event_brokers.in_memory_event_broker import Subscription
+from domain.value_objects.change_feed import ChangePosition
+from domain.value_objects.task_event import TaskEvent
+from drivers.api.v1.tasks.schema import TaskResponse
+from drivers.helpers.change_token import encode_change_token
+
+KEEP_ALIVE = ": keep-alive\n\n"
+
+
+@lru_cache(maxsize=256)
+def encode_task_event(event: TaskEvent) -> str:
+    """
+    Server-sent event message of a task event, encoded once for all subscribers.
+    The id is a change feed token: after a reconnection, GET /api/v1/tasks/changes
+    with `since=<Last-Event-ID>` returns what was missed.
+    """
+    data = TaskResponse.model_validate(asdict(event.task)).model_dump_json()
+    event_id = encode_change_token(ChangePosition.of(event.task))
+    return f"id: {event_id}\nevent: {event.type.value}\ndata: {data}\n\n"
+
+
+async def stream_task_events(
+    subscription: Subscription, heartbeat_seconds: float
+) -> AsyncIterator[str]:
+    """
+    Server-sent events of a subscription, with keep-alive comments while idle.
+    The subscription is closed when the client disconnects.
+    """
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except TimeoutError:
+                yield KEEP_ALIVE
+                continue
+
+            if event is None:
+                if subscription.evicted:
+                    # The client should resync from the change feed, then reconnect
+                    yield "event: evicted\ndata: {}\n\n"
+                return
+            yield encode_task_event(event)
+    finally:
+        subscription.close()
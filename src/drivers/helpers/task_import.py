@@ -0,0 +1,246 @@
+import codecs
+import csv
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List
+
+from pydantic import ValidationError
+
+from domain.exceptions.common import DatabaseException, InvalidImportFile
+from domain.value_objects.create_task_data import CreateTaskData
+from domain.value_objects.task_import import ImportRowError, TaskImportResult
+from drivers.api.v1.tasks.schema import (
+    CreateTaskRequest,
+    TaskImportResponse,
+    TaskImportRowError,
+)
+
+logger = logging.getLogger("db")
+
+# Media type -> format of the uploaded file
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# Longest line (or CSV record) accepted, in characters
+MAX_RECORD_LENGTH = 1_000_000
+
+REQUIRED_CSV_COLUMNS = ("title", "description", "priority")
+
+
+class UnsupportedImportFormat(Exception):
+    def __init__(self, media_type: str | None) -> None:
+        self.media_type = media_type
+
+    def __str__(self):
+        formats = ", ".join(IMPORT_FORMATS)
+        return f"Unsupported import format {self.media_type}, expected one of {formats}"
+
+
+class _Lines:
+    """
+    An iterator over lines that remembers whether it ran out.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines = iter(lines)
+        self.exhausted = False
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        try:
+            return next(self._lines)
+        except StopIteration:
+            self.exhausted = True
+            raise
+
+
+def get_import_format(content_type: str | None) -> str:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_FORMATS:
+        raise UnsupportedImportFormat(media_type or None)
+    return IMPORT_FORMATS[media_type]
+
+
+async def iter_line_blocks(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[str]]:
+    """
+    The complete lines of an UTF-8 body, line endings included, decoded as its
+    chunks arrive: one block per chunk.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+            if lines:
+                yield [line + "\n" for line in lines]
+            if len(pending) > MAX_RECORD_LENGTH:
+                raise InvalidImportFile(
+                    f"Lines are limited to {MAX_RECORD_LENGTH} characters"
+                )
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exception:
+        raise InvalidImportFile(f"The file is not valid UTF-8: {exception}")
+    if pending:
+        yield [pending]
+
+
+async def iter_csv_rows(
+    blocks: AsyncIterator[List[str]],
+) -> AsyncIterator[tuple[int, Dict[str, Any] | ImportRowError]]:
+    """
+    The records of a CSV file with a header line, numbered from 1 (header
+    excluded). A quoted field may span several lines, and so several blocks:
+    the lines of a record still open at the end of a block are parsed again
+    with the next one.
+    """
+    header: List[str] | None = None
+    row = 0
+    pending: List[str] = []
+    done = False
+    while not done:
+        try:
+            lines = pending + await anext(blocks)
+        except StopAsyncIteration:
+            lines, done = pending, True
+        if not lines:
+            continue
+
+        source = _Lines(lines)
+        reader = csv.reader(source)
+        consumed = 0
+        try:
+            for values in reader:
+                if source.exhausted and not done:
+                    # The record continues in the next block
+                    break
+                if source.exhausted:
+                    row += 1
+                    yield row, ImportRowError(row, ["Unterminated quoted field"])
+                    break
+                consumed = reader.line_num
+                if not values:
+                    continue
+
+                if header is None:
+                    header = [name.strip() for name in values]
+                    missing = [
+                        name for name in REQUIRED_CSV_COLUMNS if name not in header
+                    ]
+                    if missing:
+                        raise InvalidImportFile(
+                            f"Missing CSV columns: {', '.join(missing)}"
+                        )
+                    continue
+
+                row += 1
+                if len(values) != len(header):
+                    yield (
+                        row,
+                        ImportRowError(
+                            row, [f"Expected {len(header)} values, got {len(values)}"]
+                        ),
+                    )
+                    continue
+                # Empty values are missing values
+                yield (
+                    row,
+                    {name: value for name, value in zip(header, values) if value != ""},
+                )
+        except csv.Error as exception:
+            raise InvalidImportFile(f"Invalid CSV after row {row}: {exception}")
+
+        pending = lines[consumed:]
+        if sum(map(len, pending)) > MAX_RECORD_LENGTH:
+            raise InvalidImportFile(
+                f"Records are limited to {MAX_RECORD_LENGTH} characters"
+            )
+
+
+async def iter_ndjson_rows(
+    blocks: AsyncIterator[List[str]],
+) -> AsyncIterator[tuple[int, Dict[str, Any] | ImportRowError]]:
+    """
+    The objects of a newline-delimited JSON file, numbered from 1.
+    """
+    row = 0
+    async for lines in blocks:
+        for line in lines:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                values = json.loads(line)
+            except json.JSONDecodeError as exception:
+                yield row, ImportRowError(row, [f"Invalid JSON: {exception.msg}"])
+                continue
+            if not isinstance(values, dict):
+                yield row, ImportRowError(row, ["Expected a JSON object"])
+                continue
+            yield row, values
+
+
+def validate_row(row: int, values: Dict[str, Any]) -> CreateTaskData | ImportRowError:
+    try:
+        request = CreateTaskRequest.model_validate(values)
+    except ValidationError as exception:
+        return ImportRowError(
+            row,
+            [
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in exception.errors(include_url=False)
+            ],
+        )
+    return CreateTaskData(
+        title=request.title,
+        description=request.description,
+        priority=request.priority,
+        due_date=request.due_date,
+    )
+
+
+def parse_import(
+    content_type: str | None, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[CreateTaskData | ImportRowError]:
+    """
+    The tasks of an uploaded file, validated like single creations, or the
+    errors of the rows that aren't valid tasks.
+    """
+    if get_import_format(content_type) == "csv":
+        return validate_rows(iter_csv_rows(iter_line_blocks(chunks)))
+    return validate_rows(iter_ndjson_rows(iter_line_blocks(chunks)))
+
+
+async def validate_rows(
+    rows: AsyncIterator[tuple[int, Dict[str, Any] | ImportRowError]],
+) -> AsyncIterator[CreateTaskData | ImportRowError]:
+    async for row, values in rows:
+        if isinstance(values, ImportRowError):
+            yield values
+        else:
+            yield validate_row(row, values)
+
+
+def build_import_response(result: TaskImportResult) -> TaskImportResponse:
+    error = None
+    if isinstance(result.failure, InvalidImportFile):
+        error = f"{result.failure}, the import stopped after {result.inserted} tasks"
+    elif isinstance(result.failure, DatabaseException):
+        logger.error("Task import failed: %s", result.failure.__cause__)
+        error = f"Database error, the import stopped after {result.inserted} tasks"
+    return TaskImportResponse(
+        inserted=result.inserted,
+        rejected=result.rejected,
+        errors=[
+            TaskImportRowError(row=row_error.row, errors=row_error.errors)
+            for row_error in result.errors
+        ],
+        errors_truncated=result.rejected > len(result.errors),
+        duration_ms=round(result.duration * 1000, 1),
+        rows_per_second=result.rows_per_second,
+        error=error,
+    )
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from drivers.config.settings import BaseSettings
+from drivers.dependencies.admission import get_admission_controller
+from drivers.helpers.admission import AdmissionController
+from drivers.jobs.runner import Job, run_batches
+from use_cases.tasks.archive_completed_tasks_usecase import (
+    ArchiveCompletedTasksUseCase,
+)
+
+ARCHIVAL_JOB = "task-archival"
+
+
+async def archive_completed_tasks(
+    session_maker: async_sessionmaker[AsyncSession | Any],
+    older_than: timedelta,
+    batch_size: int,
+    pause: float = 0.0,
+    admission_controller: AdmissionController | None = None,
+) -> int:
+    """
+    Move the tasks completed more than `older_than` ago to the archive table,
+    one batch per short transaction. Returns the number of tasks archived.
+    """
+    completed_before = datetime.now(timezone.utc) - older_than
+
+    async def archive_batch() -> int:
+        async with session_maker() as session, session.begin():
+            use_case = ArchiveCompletedTasksUseCase(SqlAlchemyTaskRepository(session))
+            return await use_case.execute(
+                completed_before=completed_before, batch_size=batch_size
+            )
+
+    return await run_batches(archive_batch, pause, admission_controller)
+
+
+def archival_job(
+    settings: BaseSettings, session_maker: async_sessionmaker[AsyncSession | Any]
+) -> Job:
+    if settings.archive_after_days is None:
+        raise ValueError("The archival job needs archive_after_days")
+    older_than = timedelta(days=settings.archive_after_days)
+
+    async def run() -> str:
+        archived = await archive_completed_tasks(
+            session_maker,
+            older_than=older_than,
+            batch_size=settings.archive_batch_size,
+            pause=settings.archive_pause_ms / 1000,
+            admission_controller=get_admission_controller(),
+        )
+        return f"{archived} completed tasks archived"
+
+    return Job(
+        name=ARCHIVAL_JOB,
+        interval=settings.archive_interval_seconds,
+        jitter=settings.archive_jitter_seconds,
+        run=run,
+    )
@@ -0,0 +1,24 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from drivers.config.settings import BaseSettings
+from drivers.dependencies.idempotency import idempotencyStore
+from drivers.jobs.runner import Job
+
+IDEMPOTENCY_PURGE_JOB = "idempotency-purge"
+
+
+def idempotency_purge_job(
+    settings: BaseSettings, session_maker: async_sessionmaker[AsyncSession | Any]
+) -> Job:
+    async def run() -> str:
+        store = idempotencyStore(settings, session_maker)  # type: ignore[arg-type]
+        purged = await store.purge_expired()
+        return f"{purged} expired idempotency keys deleted"
+
+    return Job(
+        name=IDEMPOTENCY_PURGE_JOB,
+        interval=settings.idempotency_purge_interval_seconds,
+        run=run,
+    )
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from drivers.config.settings import BaseSettings
+from drivers.dependencies.admission import get_admission_controller
+from drivers.helpers.admission import AdmissionController
+from drivers.jobs.runner import Job, run_batches
+from use_cases.tasks.flag_overdue_tasks_usecase import FlagOverdueTasksUseCase
+
+OVERDUE_SWEEP_JOB = "overdue-sweep"
+
+
+async def sweep_overdue_tasks(
+    session_maker: async_sessionmaker[AsyncSession | Any],
+    batch_size: int,
+    pause: float = 0.0,
+    admission_controller: AdmissionController | None = None,
+) -> int:
+    """
+    Flag all the overdue tasks, one batch per short transaction so the sweep
+    never holds locks for long. Returns the number of tasks flagged.
+    """
+    now = datetime.now(timezone.utc)
+    after = None
+
+    async def flag_batch() -> int:
+        nonlocal after
+        async with session_maker() as session, session.begin():
+            use_case = FlagOverdueTasksUseCase(SqlAlchemyTaskRepository(session))
+            flagged, after = await use_case.execute(
+                now=now, batch_size=batch_size, after=after
+            )
+        return flagged
+
+    return await run_batches(flag_batch, pause, admission_controller)
+
+
+def overdue_sweep_job(
+    settings: BaseSettings, session_maker: async_sessionmaker[AsyncSession | Any]
+) -> Job:
+    async def run() -> str:
+        flagged = await sweep_overdue_tasks(
+            session_maker,
+            batch_size=settings.overdue_sweep_batch_size,
+            pause=settings.overdue_sweep_pause_ms / 1000,
+            admission_controller=get_admission_controller(),
+        )
+        return f"{flagged} tasks flagged overdue"
+
+    return Job(
+        name=OVERDUE_SWEEP_JOB,
+        interval=settings.overdue_sweep_interval_seconds,
+        jitter=settings.overdue_sweep_jitter_seconds,
+        run=run,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from adapters.connection_engines.sql_alchemy.job_lock import JobLock, JobLockLost
+from drivers.helpers.admission import AdmissionController, AdmissionRejected, RouteClass
+
+logger = logging.getLogger("jobs")
+
+
+@dataclass
+class Job:
+    name: str
+    # Seconds between two runs, plus a random delay of up to `jitter` seconds so
+    # the workers started together don't all wake up at the same time
+    interval: float
+    run: Callable[[], Awaitable[Any]]
+    jitter: float = 0.0
+
+
+async def run_batches(
+    run_batch: Callable[[], Awaitable[int]],
+    pause: float = 0.0,
+    admission_controller: AdmissionController | None = None,
+) -> int:
+    """
+    Call `run_batch` until it processes nothing, pausing `pause` seconds between
+    two batches. With an admission controller, each batch waits for a slot of the
+    lowest priority class: the API requests are served first.
+    Returns the number of items processed.
+    """
+    total = 0
+    while True:
+        try:
+            if admission_controller is None:
+                processed = await run_batch()
+            else:
+                async with admission_controller.admit(RouteClass.EXPORT):
+                    processed = await run_batch()
+        except AdmissionRejected as exception:
+            await asyncio.sleep(exception.retry_after)
+            continue
+
+        if not processed:
+            return total
+        total += processed
+        await asyncio.sleep(pause)
+
+
+class JobRunner:
+    """
+    Runs background jobs periodically in the application's event loop.
+    Every worker runs the loop, the job lock lets one of them do the work.
+    """
+
+    def __init__(self, lock: JobLock) -> None:
+        self._lock = lock
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self, jobs: Sequence[Job]) -> None:
+        for job in jobs:
+            logger.info("Schedule job %s every %ss", job.name, job.interval)
+            self._tasks.append(
+                asyncio.create_task(self._loop(job), name=f"job-{job.name}")
+            )
+
+    async def stop(self) -> None:
+        """
+        Cancel the jobs: a running job stops at its next await and rolls back
+        its current transaction.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_once(self, job: Job) -> bool:
+        """
+        Run the job unless another process holds its lock. The job is aborted
+        (its current transaction rolled back) if it loses the lock.
+        Returns whether the job ran.
+        """
+        try:
+            async with self._lock.hold(job.name) as acquired:
+                if not acquired:
+                    logger.debug("Job %s is running elsewhere, skip it", job.name)
+                    return False
+
+                start = time.perf_counter()
+                try:
+                    result = await job.run()
+                except Exception:
+                    logger.exception("Job %s failed", job.name)
+                else:
+                    logger.info(
+                        "Job %s done in %.1fms: %s",
+                        job.name,
+                        (time.perf_counter() - start) * 1000,
+                        result,
+                    )
+                return True
+        except JobLockLost as exception:
+            logger.error("Job %s aborted: %s", job.name, exception)
+            return True
+
+    async def _loop(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(job.interval + random.uniform(0, job.jitter))
+            try:
+                await self.run_once(job)
+            except Exception:
+                # e.g. the database is unreachable: try again at the next run
+                logger.exception("Job %s could not be run", job.name)
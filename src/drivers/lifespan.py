@@ -0,0 +1,79 @@
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from typing import AsyncIterator, List
+from uuid import uuid4
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.connection_engines.sql_alchemy.job_lock import JobLock
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from drivers.config.settings import get_settings
+from drivers.dependencies.database import (
+    sqlAlchemySessionMaker,
+    sqlAlchemyShardSessionMakers,
+)
+from drivers.dependencies.single_writer import sqliteSingleWriter
+from drivers.dependencies.slow_query_log import get_slow_query_log
+from drivers.dependencies.write_buffer import taskWriteBuffer
+from drivers.helpers.hetoas import ListingParams
+from drivers.jobs.archival import archival_job
+from drivers.jobs.idempotency_purge import idempotency_purge_job
+from drivers.jobs.overdue_sweep import overdue_sweep_job
+from drivers.jobs.runner import Job, JobRunner
+
+
+async def warm_up_task_queries(session: AsyncSession) -> None:
+    """
+    Run the hot task queries once so SQLAlchemy compiles and caches them at startup.
+    """
+    repository = SqlAlchemyTaskRepository(session)
+    listing_params = ListingParams().model_dump()
+    await repository.list_all(**listing_params)
+    await repository.count()
+    await repository.get(id_filter=uuid4())
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    slow_query_log = get_slow_query_log()
+    await sqlAlchemySessionMaker.start(
+        settings,
+        slow_query_log=slow_query_log,
+        warm_up_queries=[warm_up_task_queries],
+    )
+    await sqlAlchemyShardSessionMakers.start(settings, slow_query_log=slow_query_log)
+    await sqliteSingleWriter.start(settings, slow_query_log=slow_query_log)
+    session_maker = sqlAlchemySessionMaker(settings, slow_query_log)
+    taskWriteBuffer.start(settings, session_maker)
+    job_runner = JobRunner(JobLock(session_maker, ttl=settings.job_lock_ttl_seconds))
+    if settings.jobs_enabled:
+        jobs: List[Job] = []
+        shard_session_makers = sqlAlchemyShardSessionMakers(settings, slow_query_log)
+        for index, task_session_maker in enumerate(
+            shard_session_makers or [session_maker]
+        ):
+            task_jobs = [overdue_sweep_job(settings, task_session_maker)]
+            if settings.archive_after_days is not None:
+                task_jobs.append(archival_job(settings, task_session_maker))
+            for job in task_jobs:
+                # One job (and job lock) per shard
+                jobs.append(
+                    replace(job, name=f"{job.name}-shard-{index}")
+                    if shard_session_makers
+                    else job
+                )
+        jobs.append(idempotency_purge_job(settings, session_maker))
+        job_runner.start(jobs)
+    try:
+        yield
+    finally:
+        await job_runner.stop()
+        # Write the buffered creations before closing the engine
+        await taskWriteBuffer.stop()
+        await sqliteSingleWriter.stop()
+        await sqlAlchemyShardSessionMakers.stop()
+        await sqlAlchemySessionMaker.stop()
@@ -1,17 +1,44 @@
 import logging.config
 import pathlib
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
-from drivers.api.main_router import router as main_router
-from drivers.api.v1.tasks.router import router as tasks_router
-from drivers.config.settings import get_settings
-from drivers.exceptions_handlers.handlers import add_handlers
 
+def create_app() -> "FastAPI":
+    """
+    Application factory, used by the servers (`uvicorn --factory drivers.main:create_app`).
 
-def create_app() -> FastAPI:
-    application = FastAPI(title="Clean Architecture FastAPI")
+    FastAPI is imported here rather than at module level, so importing this module
+    stays cheap for test collection, Alembic and tooling. The middlewares, routers
+    and everything they pull in (use cases, repositories, SQLAlchemy) are only
+    imported when the application first runs: see `setup_app`.
+    """
+    from drivers.deferred_app import DeferredApp
+
+    application = DeferredApp(
+        setup_app, title="Clean Architecture FastAPI", lifespan=lifespan
+    )
+
+    parent_folder = pathlib.Path(__file__).parent.parent.resolve()
+    logging.config.fileConfig(
+        f"{parent_folder}/logging.ini", disable_existing_loggers=False
+    )
+    return application
+
+
+def setup_app(application: "FastAPI") -> None:
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from drivers.api.admin.router import router as admin_router
+    from drivers.api.main_router import router as main_router
+    from drivers.api.v1.tasks.router import router as tasks_router
+    from drivers.config.settings import get_settings
+    from drivers.exceptions_handlers.handlers import add_handlers
+    from drivers.middlewares.profiling import ProfilingMiddleware
+    from drivers.middlewares.query_stats import QueryStatsMiddleware
 
     settings = get_settings()
 
@@ -23,16 +50,28 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    application.add_middleware(QueryStatsMiddleware, settings=settings)
+    # Added last so the profile covers the whole middleware stack
+    application.add_middleware(ProfilingMiddleware, settings=settings)
 
     application.include_router(main_router)
     application.include_router(tasks_router)
+    application.include_router(admin_router)
     add_handlers(application)
 
-    parent_folder = pathlib.Path(__file__).parent.parent.resolve()
-    logging.config.fileConfig(
-        f"{parent_folder}/logging.ini", disable_existing_loggers=False
-    )
-    return application
+
+@asynccontextmanager
+async def lifespan(application: "FastAPI") -> AsyncIterator[None]:
+    from drivers.lifespan import lifespan as application_lifespan
+
+    async with application_lifespan(application):
+        yield
 
 
-app = create_app()
+def __getattr__(name: str) -> Any:
+    # Keep `drivers.main:app` working, but only build the application on first access
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
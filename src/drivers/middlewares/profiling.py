@@ -0,0 +1,189 @@
+import asyncio
+import cProfile
+import hashlib
+import hmac
+import logging
+import marshal
+import pathlib
+import random
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+from drivers.config.settings import BaseSettings, Environment
+
+logger = logging.getLogger("app")
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_FLAG = "profile"
+# Value of the query flag (or of the X-Profile-Output header) to download the profile
+DOWNLOAD = "download"
+# Maximum age of a signed X-Profile header, in seconds
+SIGNATURE_MAX_AGE = 300
+# Seconds a profiled request waits for the requests in flight to finish
+DRAIN_TIMEOUT = 5.0
+# "request" when nothing else ran during the profile, "loop" otherwise
+PROFILE_SCOPE_HEADER = "X-Profile-Scope"
+# Status of the response replaced by a downloaded profile
+PROFILE_STATUS_HEADER = "X-Profile-Response-Status"
+
+
+def sign_profile_request(
+    secret: str, method: str, path: str, timestamp: int | None = None
+) -> str:
+    """
+    Build the value of the X-Profile header for a request: "<timestamp>:<signature>".
+    """
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    message = f"{timestamp}:{method.upper()}:{path}".encode()
+    signature = hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+    return f"{timestamp}:{signature}"
+
+
+def is_valid_profile_signature(
+    secret: str, method: str, path: str, header_value: str
+) -> bool:
+    timestamp, _, _ = header_value.partition(":")
+    if not timestamp.isdigit() or time.time() - int(timestamp) > SIGNATURE_MAX_AGE:
+        return False
+    expected = sign_profile_request(secret, method, path, int(timestamp))
+    return hmac.compare_digest(expected, header_value)
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Profile single requests with cProfile, from the first middleware to the serialized
+    response (dependencies, use case, repository and serialization included).
+
+    A request is profiled when it carries a valid signed X-Profile header, or, outside
+    production, when it has the `?profile` query flag or is sampled.
+    The profile is written to `profiling_output_dir`, or returned instead of the
+    response when `?profile=download` (or `X-Profile-Output: download`) is used.
+
+    cProfile records everything running on the event loop, so a profiled request
+    runs alone: the requests arriving meanwhile wait for it, and it waits for those
+    in flight (up to DRAIN_TIMEOUT). When they don't finish in time, or when response
+    bodies keep streaming, the profile is a sample of the whole loop and is labelled
+    as such (X-Profile-Scope: loop). Background jobs may always show up.
+    """
+
+    def __init__(self, app: ASGIApp, settings: BaseSettings) -> None:
+        super().__init__(app)
+        self.settings = settings
+        self.output_dir = pathlib.Path(settings.profiling_output_dir)
+        # cProfile can only profile one request at a time per thread
+        self._busy = False
+        # Cleared while a request is profiled: the others wait
+        self._admitted = asyncio.Event()
+        self._admitted.set()
+        # Requests in flight, not profiled
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if self._busy or not self._should_profile(request):
+            await self._admitted.wait()
+            self._in_flight += 1
+            self._idle.clear()
+            try:
+                return await call_next(request)
+            finally:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._idle.set()
+
+        self._busy = True
+        self._admitted.clear()
+        profiler = cProfile.Profile()
+        try:
+            alone = await self._drain()
+            profiler.enable()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.disable()
+        finally:
+            self._busy = False
+            self._admitted.set()
+        profiler.create_stats()
+        profile = marshal.dumps(profiler.stats)  # type: ignore[attr-defined]
+        scope = "request" if alone else "loop"
+
+        filename = self._filename(request)
+        if self._wants_download(request):
+            return Response(
+                content=profile,
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{filename}"',
+                    PROFILE_SCOPE_HEADER: scope,
+                    PROFILE_STATUS_HEADER: str(response.status_code),
+                },
+            )
+
+        path = self.output_dir / filename
+        await run_in_threadpool(self._write, path, profile)
+        logger.info("Request profile (%s scope) written to %s", scope, path)
+        response.headers["X-Profile-Path"] = str(path)
+        response.headers[PROFILE_SCOPE_HEADER] = scope
+        return response
+
+    async def _drain(self) -> bool:
+        """
+        Wait for the requests in flight to finish. Returns whether they did.
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Requests still in flight after %ss, profiling the whole loop",
+                DRAIN_TIMEOUT,
+            )
+            return False
+        return True
+
+    def _should_profile(self, request: Request) -> bool:
+        header_value = request.headers.get(PROFILE_HEADER)
+        if header_value and self.settings.profiling_secret:
+            return is_valid_profile_signature(
+                self.settings.profiling_secret,
+                request.method,
+                request.url.path,
+                header_value,
+            )
+
+        # A profiled request stalls the whole worker: never on unsigned requests
+        # in production
+        if self.settings.env == Environment.prod:
+            return False
+
+        if PROFILE_QUERY_FLAG in request.query_params:
+            return True
+
+        return random.random() < self.settings.profiling_sample_rate
+
+    @staticmethod
+    def _wants_download(request: Request) -> bool:
+        return (
+            request.query_params.get(PROFILE_QUERY_FLAG) == DOWNLOAD
+            or request.headers.get("X-Profile-Output") == DOWNLOAD
+        )
+
+    @staticmethod
+    def _filename(request: Request) -> str:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        route = request.url.path.strip("/").replace("/", "_") or "root"
+        return f"{timestamp}-{request.method}-{route}-{uuid4().hex[:8]}.prof"
+
+    @staticmethod
+    def _write(path: pathlib.Path, profile: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(profile)
@@ -0,0 +1,65 @@
+import logging
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
+
+from adapters.connection_engines.sql_alchemy.query_stats import (
+    QueryStats,
+    collect_query_stats,
+)
+from drivers.config.settings import BaseSettings
+
+logger = logging.getLogger("app")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a request executes more SQL statements than allowed."""
+
+    pass
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Count the statements executed by each request and the time spent in the database,
+    expose them through `Server-Timing` headers and enforce the configured query budget.
+    """
+
+    def __init__(self, app: ASGIApp, settings: BaseSettings) -> None:
+        super().__init__(app)
+        self.settings = settings
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        with collect_query_stats() as stats:
+            response = await call_next(request)
+
+        response.headers.append(
+            "Server-Timing", f'db;desc="Database";dur={stats.duration_ms:.2f}'
+        )
+        response.headers.append(
+            "Server-Timing", f'db-queries;desc="{stats.count} statements"'
+        )
+
+        self._check_budget(request, stats)
+        return response
+
+    def _check_budget(self, request: Request, stats: QueryStats) -> None:
+        budget = self.settings.query_budget
+        if budget is None or stats.count <= budget:
+            return
+
+        message = (
+            f"{request.method} {request.url.path} executed {stats.count} "
+            f"statements (budget: {budget})"
+        )
+        repeated = stats.repeated_statements()
+        if repeated:
+            message += ". Repeated statements (possible N+1): " + "; ".join(
+                f"{count}x {statement}" for statement, count in repeated.items()
+            )
+
+        if self.settings.query_budget_strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
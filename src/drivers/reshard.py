@@ -0,0 +1,76 @@
+"""
+Copy the tasks of one or more databases to a set of shards, each task to the shard
+of its id, in batches. The target databases must be migrated first; the copy
+skips the tasks they already hold, so an interrupted run can be started again.
+
+Usage (from src/):
+    python -m drivers.reshard --source app --target tasks_0 tasks_1 [--batch-size 5000]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import List
+
+from adapters.connection_engines.sql_alchemy.resharding import copy_shard_rows
+from adapters.connection_engines.sql_alchemy.session import (
+    dispose_session_maker,
+    get_session_maker,
+)
+from adapters.repositories.task_repositories.sharded_task_repository import shard_for
+from drivers.config.settings import get_settings
+
+logger = logging.getLogger("db")
+
+
+async def reshard(sources: List[str], targets: List[str], batch_size: int) -> int:
+    settings = get_settings()
+    source_urls = [
+        settings.model_copy(update={"db_name": name}).database_url for name in sources
+    ]
+    target_urls = settings.model_copy(
+        update={"db_shard_names": targets}
+    ).shard_database_urls
+    source_makers = [
+        get_session_maker(settings, database_url=url) for url in source_urls
+    ]
+    target_makers = [
+        get_session_maker(settings, database_url=url) for url in target_urls
+    ]
+    for session_maker in source_makers + target_makers:
+        # One statement per batch, not worth logging
+        session_maker.kw["bind"].echo = False
+    try:
+        return await copy_shard_rows(
+            source_makers,
+            target_makers,
+            partial(shard_for, shard_count=len(target_makers)),
+            batch_size=batch_size,
+        )
+    finally:
+        for session_maker in source_makers + target_makers:
+            await dispose_session_maker(session_maker)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", nargs="+", required=True)
+    parser.add_argument("--target", nargs="+", required=True)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    copied = asyncio.run(reshard(args.source, args.target, args.batch_size))
+    logger.info(
+        "Copied %s rows to %s shards in %.1fs",
+        copied,
+        len(args.target),
+        time.perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Production server: one preloaded application shared by N forked uvicorn workers.
+
+Usage (from src/): python -m drivers.server
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict
+
+from drivers.config.settings import BaseSettings, get_settings
+
+logger = logging.getLogger("app")
+
+# Seconds to wait for the workers to stop gracefully before killing them
+SHUTDOWN_TIMEOUT = 30
+# A worker exiting within this many seconds of its start failed fast: it is
+# restarted after a backoff doubling from RESTART_BACKOFF up to MAX_RESTART_BACKOFF
+WORKER_MIN_UPTIME = 10.0
+RESTART_BACKOFF = 1.0
+MAX_RESTART_BACKOFF = 30.0
+# Consecutive fast failures of a worker after which the server stops
+MAX_FAST_FAILURES = 5
+# Seconds between two checks of the workers while a restart is pending
+RESTART_POLL_INTERVAL = 0.1
+
+
+def get_worker_count(settings: BaseSettings) -> int:
+    return settings.workers or os.cpu_count() or 1
+
+
+def get_pooled_engine_count(settings: BaseSettings) -> int:
+    """
+    Number of engines each worker opens with a pool of `db_pool_size` connections
+    (plus `db_max_overflow`): the primary one, one per task shard and the read-only
+    connections of the SQLite single writer.
+    """
+    return 1 + len(settings.db_shard_names) + int(settings.sqlite_single_writer_enabled)
+
+
+def size_worker_pool(settings: BaseSettings, workers: int) -> tuple[int, int]:
+    """
+    Return the (pool_size, max_overflow) of each engine of a worker so that the
+    connections of all the engines of all the workers stay under `db_max_connections`.
+    """
+    if settings.db_max_connections is None:
+        return settings.db_pool_size, settings.db_max_overflow
+
+    engines = get_pooled_engine_count(settings)
+    per_worker = settings.db_max_connections // workers
+    # The connection of the SQLite single writer comes out of the worker's share
+    per_worker -= int(settings.sqlite_single_writer_enabled)
+    per_engine = per_worker // engines
+    if per_engine < 1:
+        raise ValueError(
+            f"db_max_connections={settings.db_max_connections} is too low "
+            f"for {workers} workers with {engines} engines each"
+        )
+    pool_size = min(settings.db_pool_size, per_engine)
+    max_overflow = min(settings.db_max_overflow, per_engine - pool_size)
+    return pool_size, max_overflow
+
+
+class Server:
+    def __init__(self, settings: BaseSettings) -> None:
+        self.settings = settings
+        self.workers = get_worker_count(settings)
+        self.children: Dict[int, int] = {}  # pid -> worker index
+        self.started_at: Dict[int, float] = {}  # worker index -> start time
+        self.fast_failures: Dict[int, int] = {}  # worker index -> consecutive count
+        self.restarts: Dict[int, float] = {}  # worker index -> time of the restart
+        self.exit_code = 0
+        self.stopping = False
+        self.application: Any = None
+        self.socket: socket.socket | None = None
+
+    def run(self) -> None:
+        self.settings.db_pool_size, self.settings.db_max_overflow = size_worker_pool(
+            self.settings, self.workers
+        )
+        self._preload()
+        self.socket = self._bind()
+        logger.info(
+            "Starting %s workers on %s:%s (pool_size=%s, max_overflow=%s per engine)",
+            self.workers,
+            self.settings.server_host,
+            self.settings.server_port,
+            self.settings.db_pool_size,
+            self.settings.db_max_overflow,
+        )
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        for index in range(self.workers):
+            self._spawn(index)
+        self._supervise()
+        if self.exit_code:
+            sys.exit(self.exit_code)
+
+    def _preload(self) -> None:
+        from drivers.main import create_app
+
+        self.application = create_app()
+        # Import the routers and everything they use once, in the parent
+        self.application.load()
+        # Move everything allocated so far out of the GC's reach: the collector would
+        # otherwise touch (and copy) the shared pages in every worker
+        gc.collect()
+        gc.freeze()
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.settings.server_host, self.settings.server_port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            # The engine is created by the lifespan, i.e. after the fork
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            self._serve()
+            os._exit(0)
+        self.children[pid] = index
+        self.started_at[index] = time.monotonic()
+
+    def _serve(self) -> None:
+        import uvicorn
+
+        config = uvicorn.Config(
+            self.application,
+            lifespan="on",
+            log_config=None,
+            proxy_headers=True,
+        )
+        uvicorn.Server(config).run(sockets=[self.socket])  # type: ignore[list-item]
+
+    def _supervise(self) -> None:
+        while self.children or self.restarts:
+            self._restart_due_workers()
+            try:
+                if self.restarts:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                else:
+                    pid, status = os.wait()
+            except ChildProcessError:
+                if not self.restarts:
+                    break
+                pid, status = 0, 0
+            except InterruptedError:
+                continue
+            if pid == 0:
+                time.sleep(RESTART_POLL_INTERVAL)
+                continue
+            index = self.children.pop(pid, None)
+            if index is not None and not self.stopping:
+                self._schedule_restart(index, pid, status)
+
+    def _schedule_restart(self, index: int, pid: int, status: int) -> None:
+        uptime = time.monotonic() - self.started_at.pop(index)
+        if uptime >= WORKER_MIN_UPTIME:
+            self.fast_failures.pop(index, None)
+            delay = 0.0
+        else:
+            failures = self.fast_failures.get(index, 0) + 1
+            if failures >= MAX_FAST_FAILURES:
+                logger.error(
+                    "Worker %s exited with status %s, %s times in a row within %ss "
+                    "of its start: stopping the server",
+                    pid,
+                    status,
+                    failures,
+                    WORKER_MIN_UPTIME,
+                )
+                self.exit_code = 1
+                self._handle_stop(signal.SIGTERM, None)
+                return
+            self.fast_failures[index] = failures
+            delay = min(RESTART_BACKOFF * 2 ** (failures - 1), MAX_RESTART_BACKOFF)
+
+        logger.warning(
+            "Worker %s exited with status %s, restarting it in %ss", pid, status, delay
+        )
+        self.restarts[index] = time.monotonic() + delay
+
+    def _restart_due_workers(self) -> None:
+        now = time.monotonic()
+        for index, restart_at in list(self.restarts.items()):
+            if restart_at <= now:
+                del self.restarts[index]
+                self._spawn(index)
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        self.restarts.clear()
+        logger.info("Stopping %s workers", len(self.children))
+        for pid in self.children:
+            os.kill(pid, signal.SIGTERM)
+        signal.signal(signal.SIGALRM, self._kill_children)
+        signal.alarm(SHUTDOWN_TIMEOUT)
+
+    def _kill_children(self, signum: int, frame: Any) -> None:
+        for pid in list(self.children):
+            os.kill(pid, signal.SIGKILL)
+
+
+def main() -> None:
+    if not hasattr(os, "fork"):
+        sys.exit("The production server requires a platform with os.fork")
+    Server(get_settings()).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from domain.value_objects.task_event import TaskEvent
+
+
+class TaskEventPublisherInterface(ABC):
+    @abstractmethod
+    def publish(self, event: TaskEvent) -> None:
+        """
+        Hand the event to the subscribers without waiting for them.
+        """
+        pass
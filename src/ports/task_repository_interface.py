@@ -1,15 +1,32 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import abstractmethod
+from typing import Any, AsyncContextManager, Callable, Sequence
 
 from domain.entities.task import Task
+from domain.value_objects.change_feed import ChangePosition, Removal
 from domain.value_objects.ordering import Ordering
+from domain.value_objects.projection import Projection
+from ports.task_writer_interface import TaskWriterInterface
 
 
-class TaskRepositoryInterface(ABC):
+class TaskRepositoryInterface(TaskWriterInterface):
     @abstractmethod
     async def save(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def save_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """
+        Save the tasks in one go, returning them in the same order.
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_insert(self, tasks: Sequence[Task]) -> int:
+        """
+        Insert the tasks without returning them. Returns the number inserted.
+        """
+        pass
+
     async def get(
         self,
         **filters,
@@ -23,15 +40,71 @@ class TaskRepositoryInterface(ABC):
         limit: int = 10,
         order_by: str = "created_at",
         ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
         **filters,
     ) -> list[Task]:
+        """
+        The archived tasks are only listed with `include_archived`.
+        """
+        pass
+
+    @abstractmethod
+    async def list_projected(
+        self,
+        fields: Sequence[str],
+        page: int = 1,
+        limit: int = 10,
+        order_by: str = "created_at",
+        ordering: Ordering = Ordering.ASC,
+        include_archived: bool = False,
+        **filters,
+    ) -> list[Projection]:
+        """
+        Like list_all, but only the given fields (and the id) of the tasks are read.
+        """
+        pass
+
+    @abstractmethod
+    async def list_changes(
+        self,
+        since: ChangePosition | None = None,
+        limit: int = 100,
+    ) -> list[Task | Removal]:
+        """
+        Tasks created or updated after `since`, ordered by (updated_at, id), with
+        the removals of tasks since then among them.
+        """
         pass
 
     @abstractmethod
     async def count(
+        self,
+        include_archived: bool = False,
+        **filters,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def delete(
         self,
         **filters,
     ) -> int:
+        """
+        Delete the tasks matching the filters, leaving a removal in the change feed.
+        Returns the number of tasks deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def archive(
+        self,
+        **filters,
+    ) -> int:
+        """
+        Move the tasks matching the filters out of the hot storage, where only
+        `include_archived` listings see them, leaving a removal in the change feed.
+        Returns the number of tasks moved.
+        """
         pass
 
     @abstractmethod
@@ -41,3 +114,8 @@ class TaskRepositoryInterface(ABC):
         **filters,
     ) -> int:
         pass
+
+
+# Opens a repository in a transaction of its own, committed when the context exits
+# without error: for the use cases committing their work in several steps
+TaskRepositoryScope = Callable[[], AsyncContextManager[TaskRepositoryInterface]]
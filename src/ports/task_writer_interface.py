@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from domain.entities.task import Task
+
+
+class TaskWriterInterface(ABC):
+    """
+    The write side of the task repository, all that creating a task needs.
+    Implemented by the repositories and by the group-commit write buffer.
+    """
+
+    @abstractmethod
+    async def save(self, task: Task) -> Task:
+        pass
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Run the callback once the writes made so far are committed, never if
+        they are rolled back.
+        """
+        pass
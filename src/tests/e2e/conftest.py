@@ -5,7 +5,8 @@ from adapters.repositories.task_repositories.sql_alchemy_task_repository import
     SqlAlchemyTaskRepository,
 )
 from domain.entities.task import Priority, Task, TaskStatus
-from drivers.main import app
+from drivers.config.settings import Environment, get_settings
+from drivers.main import create_app
 from tests.utilis import create_task, truncate_tables
 
 
@@ -15,10 +16,27 @@ async def truncate_all_tables(db_session_fixture):
     await truncate_tables(db_session_fixture)
 
 
+@pytest_asyncio.fixture(scope="session")
+async def app_fixture():
+    return create_app()
+
+
+@pytest_asyncio.fixture
+async def admin_headers_fixture(app_fixture, settings):
+    """
+    Headers of the admin requests, the application running as in production.
+    """
+    app_fixture.dependency_overrides[get_settings] = lambda: settings.model_copy(
+        update={"env": Environment.prod, "admin_token": "admin-secret"}
+    )
+    yield {"X-Admin-Token": "admin-secret"}
+    app_fixture.dependency_overrides.pop(get_settings)
+
+
 @pytest_asyncio.fixture
-async def async_client_fixture():
+async def async_client_fixture(app_fixture):
     async with AsyncClient(
-        transport=ASGITransport(app=app),
+        transport=ASGITransport(app=app_fixture),
         base_url="http://test",
     ) as client:
         yield client
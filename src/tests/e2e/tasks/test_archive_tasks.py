@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from domain.entities.task import TaskStatus
+from drivers.jobs.archival import archive_completed_tasks
+from tests.utilis import create_task
+
+
+async def save_task(repository, index, status=TaskStatus.COMPLETED, age_days=60):
+    task = create_task(index=index, status=status)
+    task.updated_at = datetime.now(timezone.utc) - timedelta(days=age_days)
+    return await repository.save(task)
+
+
+@pytest.fixture
+async def archived_tasks_fixture(
+    db_session_maker_fixture, task_repository_fixture, db_session_fixture
+):
+    old = [await save_task(task_repository_fixture, index) for index in range(3)]
+    recent = await save_task(task_repository_fixture, 3, age_days=1)
+    pending = await save_task(task_repository_fixture, 4, status=TaskStatus.PENDING)
+    await db_session_fixture.commit()
+
+    archived = await archive_completed_tasks(
+        db_session_maker_fixture, older_than=timedelta(days=30), batch_size=2
+    )
+    return archived, old, [recent, pending]
+
+
+@pytest.mark.asyncio
+async def test_archival_moves_the_old_completed_tasks(
+    archived_tasks_fixture, task_repository_fixture
+):
+    archived, old, kept = archived_tasks_fixture
+
+    assert archived == 3
+    assert await task_repository_fixture.count() == 2
+    assert await task_repository_fixture.count(include_archived=True) == 5
+    for task in old:
+        assert await task_repository_fixture.get(id_filter=task.id) is None
+    for task in kept:
+        assert await task_repository_fixture.get(id_filter=task.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_archived_tasks_are_listed_on_request(
+    archived_tasks_fixture, async_client_fixture: AsyncClient
+):
+    _, old, kept = archived_tasks_fixture
+
+    hot = await async_client_fixture.get("/api/v1/tasks")
+    everything = await async_client_fixture.get(
+        "/api/v1/tasks",
+        params={"include_archived": "true", "status_filter": "completed", "limit": 2},
+    )
+
+    assert {item["id"] for item in hot.json()["items"]} == {
+        str(task.id) for task in kept
+    }
+    assert everything.status_code == 200
+    assert everything.json()["total_count"] == 4
+    [first, second] = everything.json()["items"]
+    assert (first["id"], second["id"]) == (str(old[0].id), str(old[1].id))
+    assert first["status"] == "completed"
+    assert first["title"] == old[0].title
+
+
+@pytest.mark.asyncio
+async def test_archived_tasks_are_reported_as_removed(
+    archived_tasks_fixture, async_client_fixture: AsyncClient
+):
+    _, old, kept = archived_tasks_fixture
+
+    response = await async_client_fixture.get("/api/v1/tasks/changes")
+
+    data = response.json()
+    assert {item["id"] for item in data["items"]} == {str(task.id) for task in kept}
+    assert {removal["id"] for removal in data["removed"]} == {
+        str(task.id) for task in old
+    }
+    assert {removal["reason"] for removal in data["removed"]} == {"archived"}
+
+
+@pytest.mark.asyncio
+async def test_archived_tasks_cannot_be_searched(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"include_archived": "true", "q": "task"}
+    )
+
+    assert response.status_code == 422
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
 
@@ -19,6 +21,10 @@ async def test_complete_task_success(
     assert data["description"] == pending_task_with_medium_priority_fixture.description
     assert data["status"] == TaskStatus.COMPLETED.value
     assert data["priority"] == pending_task_with_medium_priority_fixture.priority.value
+    # The stored update time, not the one read before the update
+    assert datetime.fromisoformat(data["updated_at"]) > (
+        pending_task_with_medium_priority_fixture.updated_at
+    )
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from domain.entities.task import Priority, Task, TaskStatus
+from drivers.config.settings import get_settings
+from tests.utilis import create_task
+
+
+@pytest.fixture
+def small_chunks(app_fixture):
+    settings = get_settings().model_copy(
+        update={"bulk_delete_chunk_size": 2, "bulk_delete_pause_ms": 0}
+    )
+    app_fixture.dependency_overrides[get_settings] = lambda: settings
+    yield
+    app_fixture.dependency_overrides.pop(get_settings)
+
+
+@pytest.mark.asyncio
+async def test_delete_task_success(
+    async_client_fixture: AsyncClient,
+    pending_task_with_medium_priority_fixture: Task,
+    task_repository_fixture,
+):
+    url = f"/api/v1/tasks/{pending_task_with_medium_priority_fixture.id}"
+
+    response = await async_client_fixture.delete(url)
+    second_response = await async_client_fixture.delete(url)
+
+    assert response.status_code == 204
+    assert second_response.status_code == 404
+    assert await task_repository_fixture.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_task_not_found(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.delete(
+        "/api/v1/tasks/00000000-0000-0000-0000-000000000000"
+    )
+
+    assert response.status_code == 404
+    assert "detail" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_reports_progress_per_chunk(
+    async_client_fixture: AsyncClient,
+    task_repository_fixture,
+    db_session_fixture,
+    small_chunks,
+):
+    for index in range(5):
+        await task_repository_fixture.save(
+            create_task(index=index, status=TaskStatus.COMPLETED)
+        )
+    kept = await task_repository_fixture.save(
+        create_task(index=5, status=TaskStatus.PENDING, priority=Priority.LOW)
+    )
+    await db_session_fixture.commit()
+
+    response = await async_client_fixture.delete(
+        "/api/v1/tasks", params={"status_filter": "completed"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    progress = [json.loads(line) for line in response.text.splitlines()]
+    assert progress == [
+        {"deleted": 2, "total": 5, "done": False},
+        {"deleted": 4, "total": 5, "done": False},
+        {"deleted": 5, "total": 5, "done": False},
+        {"deleted": 5, "total": 5, "done": True},
+    ]
+    remaining = await task_repository_fixture.list_all()
+    assert [task.id for task in remaining] == [kept.id]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_requires_a_filter(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.delete("/api/v1/tasks")
+
+    assert response.status_code == 422
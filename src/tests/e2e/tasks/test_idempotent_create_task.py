@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from domain.exceptions.task_exception import TaskUpdateFailed
+from drivers.dependencies.idempotency import idempotencyStore
+from use_cases.tasks.create_task_usecase import CreateTaskUseCase
+
+NEW_TASK = {"title": "Idempotent task", "description": "Created once", "priority": "low"}
+
+
+@pytest.fixture
+def use_case_calls(monkeypatch):
+    """
+    Number of CreateTaskUseCase executions, each slowed down so retries overlap.
+    """
+    calls = []
+    original = CreateTaskUseCase.execute
+
+    async def counting_execute(self, data):
+        calls.append(data)
+        await asyncio.sleep(0.05)
+        return await original(self, data)
+
+    monkeypatch.setattr(CreateTaskUseCase, "execute", counting_execute)
+    return calls
+
+
+async def create(client: AsyncClient, key: str, task: dict = NEW_TASK):
+    return await client.post(
+        "/api/v1/tasks", json=task, headers={"Idempotency-Key": key}
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_the_first_response(
+    async_client_fixture: AsyncClient, task_repository_fixture, use_case_calls
+):
+    first = await create(async_client_fixture, "retry-key")
+    retry = await create(async_client_fixture, "retry-key")
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert len(use_case_calls) == 1
+    assert await task_repository_fixture.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_is_replayed_from_the_table(
+    async_client_fixture: AsyncClient, use_case_calls
+):
+    first = await create(async_client_fixture, "durable-key")
+    # As if the retry reached another worker
+    assert idempotencyStore._store is not None
+    idempotencyStore._store._cache.clear()
+    retry = await create(async_client_fixture, "durable-key")
+
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert len(use_case_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retries_wait_for_the_first_request(
+    async_client_fixture: AsyncClient, task_repository_fixture, use_case_calls
+):
+    responses = await asyncio.gather(
+        *(create(async_client_fixture, "concurrent-key") for _ in range(5))
+    )
+
+    assert {response.status_code for response in responses} == {201}
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert len(use_case_calls) == 1
+    assert await task_repository_fixture.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_another_request(
+    async_client_fixture: AsyncClient, use_case_calls
+):
+    await create(async_client_fixture, "reused-key")
+    response = await create(
+        async_client_fixture, "reused-key", {**NEW_TASK, "title": "Another task"}
+    )
+
+    assert response.status_code == 422
+    assert len(use_case_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_request_can_be_retried(
+    async_client_fixture: AsyncClient, task_repository_fixture, monkeypatch
+):
+    original = CreateTaskUseCase.execute
+
+    async def failing_execute(self, data):
+        monkeypatch.setattr(CreateTaskUseCase, "execute", original)
+        raise TaskUpdateFailed("new")
+
+    monkeypatch.setattr(CreateTaskUseCase, "execute", failing_execute)
+
+    failed = await create(async_client_fixture, "failing-key")
+    retry = await create(async_client_fixture, "failing-key")
+
+    assert failed.status_code == 409
+    assert retry.status_code == 201
+    assert "Idempotent-Replayed" not in retry.headers
+    assert await task_repository_fixture.count() == 1
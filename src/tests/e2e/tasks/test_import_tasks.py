@@ -0,0 +1,240 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, TaskStatus
+from domain.exceptions.common import DatabaseException
+from drivers.config.settings import get_settings
+
+CSV_FILE = "\n".join(
+    [
+        "title,description,priority,due_date",
+        "First task,Imported,low,2030-01-01T00:00:00Z",
+        'Second task,"A description',
+        'on two lines, with ""quotes""",high,',
+        'Third "task",Imported,urgent,',
+        ",No title,low,",
+        "Fifth task,Too many values,low,,extra",
+    ]
+)
+
+
+@pytest.fixture
+def batches(monkeypatch, app_fixture):
+    """
+    Sizes of the chunks created, 2 tasks at most.
+    """
+    sizes = []
+    original = SqlAlchemyTaskRepository.bulk_insert
+
+    async def recording_bulk_insert(self, tasks):
+        sizes.append(len(tasks))
+        return await original(self, tasks)
+
+    monkeypatch.setattr(SqlAlchemyTaskRepository, "bulk_insert", recording_bulk_insert)
+    settings = get_settings().model_copy(update={"import_chunk_size": 2})
+    app_fixture.dependency_overrides[get_settings] = lambda: settings
+    yield sizes
+    app_fixture.dependency_overrides.pop(get_settings)
+
+
+@pytest.mark.asyncio
+async def test_import_csv_reports_rejected_rows(
+    async_client_fixture: AsyncClient, task_repository_fixture, batches
+):
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=CSV_FILE.encode(),
+        headers={"Content-Type": "text/csv; charset=utf-8"},
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["rejected"] == 3
+    assert [error["row"] for error in report["errors"]] == [3, 4, 5]
+    assert report["errors"][0]["errors"][0].startswith("priority:")
+    assert report["errors"][1]["errors"][0].startswith("title:")
+    assert report["errors_truncated"] is False
+    assert report["rows_per_second"] > 0
+    assert batches == [2]
+
+    tasks = await task_repository_fixture.list_all(order_by="title")
+    assert [task.title for task in tasks] == ["First task", "Second task"]
+    assert tasks[1].description == 'A description\non two lines, with "quotes"'
+    assert tasks[1].priority == Priority.HIGH
+    assert tasks[1].due_date is None
+    assert {task.status for task in tasks} == {TaskStatus.PENDING}
+
+
+@pytest.mark.asyncio
+async def test_import_streamed_ndjson_in_chunks(
+    async_client_fixture: AsyncClient, task_repository_fixture, batches
+):
+    lines = [
+        json.dumps({"title": f"Tâche {index}", "description": "é", "priority": "low"})
+        for index in range(5)
+    ]
+    lines[2] = "{not json"
+    lines.append("[1, 2]")
+    body = "\n".join(lines).encode()
+
+    async def upload():
+        # Small chunks, splitting the multi-byte characters
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=upload(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (4, 2)
+    assert report["errors"][0]["row"] == 3
+    assert report["errors"][0]["errors"][0].startswith("Invalid JSON")
+    assert report["errors"][1] == {"row": 6, "errors": ["Expected a JSON object"]}
+    assert batches == [2, 2]
+    tasks = await task_repository_fixture.list_all(order_by="title")
+    assert [task.title for task in tasks] == [f"Tâche {i}" for i in (0, 1, 3, 4)]
+
+
+@pytest.mark.asyncio
+async def test_import_lists_the_first_errors_only(
+    async_client_fixture: AsyncClient, app_fixture
+):
+    settings = get_settings().model_copy(update={"import_max_reported_errors": 1})
+    app_fixture.dependency_overrides[get_settings] = lambda: settings
+    try:
+        response = await async_client_fixture.post(
+            "/api/v1/tasks/import",
+            content=b'{"title": ""}\n{"title": ""}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    finally:
+        app_fixture.dependency_overrides.pop(get_settings)
+
+    report = response.json()
+    assert report["rejected"] == 2
+    assert len(report["errors"]) == 1
+    assert report["errors_truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_unsupported_formats(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=b"<tasks/>",
+        headers={"Content-Type": "application/xml"},
+    )
+
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_import_requires_the_csv_columns(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=b"title,priority\nTask,low\n",
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 422
+    assert "description" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_import_csv_records_split_across_chunks(
+    async_client_fixture: AsyncClient, task_repository_fixture
+):
+    body = CSV_FILE.encode()
+
+    async def upload():
+        # The quoted field on two lines arrives in several chunks
+        for start in range(0, len(body), 5):
+            yield body[start : start + 5]
+
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=upload(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (2, 3)
+    tasks = await task_repository_fixture.list_all(order_by="title")
+    assert tasks[1].description == 'A description\non two lines, with "quotes"'
+
+
+@pytest.mark.asyncio
+async def test_import_reports_an_unterminated_quoted_field(
+    async_client_fixture: AsyncClient,
+):
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=b'title,description,priority\nTask,Imported,low\n"Open,field,low\n',
+        headers={"Content-Type": "text/csv"},
+    )
+
+    report = response.json()
+    assert (report["inserted"], report["rejected"]) == (1, 1)
+    assert report["errors"] == [{"row": 2, "errors": ["Unterminated quoted field"]}]
+
+
+@pytest.mark.asyncio
+async def test_import_stopped_by_a_database_error(
+    async_client_fixture: AsyncClient, task_repository_fixture, batches, monkeypatch
+):
+    original = SqlAlchemyTaskRepository.bulk_insert
+    calls = 0
+
+    async def failing_bulk_insert(self, tasks):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise DatabaseException()
+        return await original(self, tasks)
+
+    monkeypatch.setattr(SqlAlchemyTaskRepository, "bulk_insert", failing_bulk_insert)
+    body = "\n".join(
+        json.dumps(
+            {"title": f"Task {index}", "description": "Imported", "priority": "low"}
+        )
+        for index in range(6)
+    )
+
+    response = await async_client_fixture.post(
+        "/api/v1/tasks/import",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    # The first chunk stays created
+    assert response.status_code == 207
+    report = response.json()
+    assert report["inserted"] == 2
+    assert report["error"] == "Database error, the import stopped after 2 tasks"
+    assert await task_repository_fixture.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_import_failing_from_the_start(app_fixture, monkeypatch):
+    async def failing_bulk_insert(self, tasks):
+        raise DatabaseException()
+
+    monkeypatch.setattr(SqlAlchemyTaskRepository, "bulk_insert", failing_bulk_insert)
+
+    transport = ASGITransport(app=app_fixture, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/tasks/import",
+            content=b'{"title": "Task", "description": "Imported", "priority": "low"}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.status_code == 500
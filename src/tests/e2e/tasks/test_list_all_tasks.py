@@ -151,3 +151,65 @@ async def test_list_all_tasks_with_pagination(
     assert data["page"] == 1
     assert data["limit"] == 1
     assert "links" in data
+
+
+@pytest.mark.asyncio
+async def test_list_all_tasks_links_follow_the_parsed_params(
+    async_client_fixture: AsyncClient,
+    pending_task_with_medium_priority_fixture,
+    completed_task_with_low_priority_fixture,
+):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"page": 2, "limit": 1}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["page"], data["limit"]) == (2, 1)
+    assert "page=1&limit=1" in data["links"]["previous"]
+    assert "next" not in data["links"]
+
+
+@pytest.mark.asyncio
+async def test_list_all_tasks_with_sparse_fieldset(
+    async_client_fixture: AsyncClient,
+    pending_task_with_medium_priority_fixture,
+    completed_task_with_low_priority_fixture,
+):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks",
+        params={"fields": "title,status", "status_filter": TaskStatus.COMPLETED.value},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_count"] == 1
+    assert data["items"] == [
+        {
+            "id": str(completed_task_with_low_priority_fixture.id),
+            "title": completed_task_with_low_priority_fixture.title,
+            "status": TaskStatus.COMPLETED.value,
+        }
+    ]
+    assert "fields=title,status" in data["links"]["first"]
+
+
+@pytest.mark.asyncio
+async def test_list_all_tasks_with_unknown_field(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"fields": "title,secret"}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", ["nonexistent", "title;drop"])
+async def test_list_all_tasks_with_unknown_order_by(
+    async_client_fixture: AsyncClient, order_by: str
+):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"order_by": order_by}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,105 @@
+import pytest
+from httpx import AsyncClient
+
+from domain.entities.task import Task
+from tests.utilis import create_task
+
+
+async def save_task(repository, session, title: str, description: str) -> Task:
+    task = create_task(index=1)
+    task.title = title
+    task.description = description
+    saved_task = await repository.save(entity=task)
+    await session.commit()
+    return saved_task
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_ranks_by_relevance(
+    async_client_fixture: AsyncClient, task_repository_fixture, db_session_fixture
+):
+    await save_task(
+        task_repository_fixture, db_session_fixture, "Groceries", "Buy milk and eggs"
+    )
+    best = await save_task(
+        task_repository_fixture,
+        db_session_fixture,
+        "Write report",
+        "Quarterly report: the report for the board",
+    )
+    other = await save_task(
+        task_repository_fixture, db_session_fixture, "Review", "Read the report"
+    )
+
+    response = await async_client_fixture.get("/api/v1/tasks", params={"q": "report"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_count"] == 2
+    assert [item["id"] for item in data["items"]] == [str(best.id), str(other.id)]
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_matches_all_terms_and_prefix(
+    async_client_fixture: AsyncClient, task_repository_fixture, db_session_fixture
+):
+    expected = await save_task(
+        task_repository_fixture, db_session_fixture, "Deploy API", "Release version 2"
+    )
+    await save_task(
+        task_repository_fixture, db_session_fixture, "Deploy docs", "Publish the site"
+    )
+
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"q": "deploy relea"}
+    )
+
+    data = response.json()
+    assert data["total_count"] == 1
+    assert data["items"][0]["id"] == str(expected.id)
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_is_paginated(
+    async_client_fixture: AsyncClient, task_repository_fixture, db_session_fixture
+):
+    for index in range(3):
+        await save_task(
+            task_repository_fixture, db_session_fixture, f"Invoice {index}", "Send it"
+        )
+
+    response = await async_client_fixture.get(
+        "/api/v1/tasks", params={"q": "invoice", "page": 2, "limit": 2}
+    )
+
+    data = response.json()
+    assert data["total_count"] == 3
+    assert len(data["items"]) == 1
+    assert "q=invoice" in data["links"]["first"]
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_follows_updates_and_ignores_syntax(
+    async_client_fixture: AsyncClient, task_repository_fixture, db_session_fixture
+):
+    task = await save_task(
+        task_repository_fixture, db_session_fixture, "Draft", "First version"
+    )
+    await task_repository_fixture.update(
+        fields_to_update={"title": "Final"}, id_filter=task.id
+    )
+    await db_session_fixture.commit()
+
+    draft = await async_client_fixture.get("/api/v1/tasks", params={"q": "draft"})
+    final = await async_client_fixture.get("/api/v1/tasks", params={"q": 'final" *'})
+
+    assert draft.json()["total_count"] == 0
+    assert final.json()["total_count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("q", ['"*', "*", "  "])
+async def test_search_tasks_without_terms(async_client_fixture: AsyncClient, q: str):
+    response = await async_client_fixture.get("/api/v1/tasks", params={"q": q})
+
+    assert response.status_code == 422
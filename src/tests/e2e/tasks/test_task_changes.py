@@ -0,0 +1,117 @@
+import pytest
+from httpx import AsyncClient
+
+from domain.entities.task import Task
+
+
+async def create_tasks(async_client: AsyncClient, count: int) -> list[str]:
+    ids = []
+    for index in range(count):
+        response = await async_client.post(
+            "/api/v1/tasks",
+            json={
+                "title": f"Task {index}",
+                "description": "Synced task",
+                "priority": "low",
+            },
+        )
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_changes_are_paginated_with_a_token(async_client_fixture: AsyncClient):
+    ids = await create_tasks(async_client_fixture, 3)
+
+    first = await async_client_fixture.get("/api/v1/tasks/changes", params={"limit": 2})
+    second = await async_client_fixture.get(
+        "/api/v1/tasks/changes",
+        params={"limit": 2, "since": first.json()["next_token"]},
+    )
+
+    assert first.status_code == 200
+    assert [item["id"] for item in first.json()["items"]] == ids[:2]
+    assert first.json()["has_more"] is True
+    assert [item["id"] for item in second.json()["items"]] == ids[2:]
+    assert second.json()["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_changes_keep_the_token_when_nothing_changed(
+    async_client_fixture: AsyncClient,
+):
+    await create_tasks(async_client_fixture, 1)
+    token = (await async_client_fixture.get("/api/v1/tasks/changes")).json()[
+        "next_token"
+    ]
+
+    response = await async_client_fixture.get(
+        "/api/v1/tasks/changes", params={"since": token}
+    )
+
+    assert response.json() == {
+        "items": [],
+        "removed": [],
+        "next_token": token,
+        "has_more": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_changes_include_updated_tasks(
+    async_client_fixture: AsyncClient,
+    pending_task_with_medium_priority_fixture: Task,
+    completed_task_with_low_priority_fixture: Task,
+):
+    token = (await async_client_fixture.get("/api/v1/tasks/changes")).json()[
+        "next_token"
+    ]
+
+    await async_client_fixture.patch(
+        f"/api/v1/tasks/{pending_task_with_medium_priority_fixture.id}/complete"
+    )
+    response = await async_client_fixture.get(
+        "/api/v1/tasks/changes", params={"since": token}
+    )
+
+    items = response.json()["items"]
+    # Only the completed task changed
+    assert [item["id"] for item in items] == [
+        str(pending_task_with_medium_priority_fixture.id)
+    ]
+    assert items[0]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_changes_report_deleted_tasks(async_client_fixture: AsyncClient):
+    deleted_id, kept_id = await create_tasks(async_client_fixture, 2)
+    token = (await async_client_fixture.get("/api/v1/tasks/changes")).json()[
+        "next_token"
+    ]
+
+    await async_client_fixture.delete(f"/api/v1/tasks/{deleted_id}")
+    response = await async_client_fixture.get(
+        "/api/v1/tasks/changes", params={"since": token}
+    )
+
+    data = response.json()
+    assert data["items"] == []
+    assert [(removal["id"], removal["reason"]) for removal in data["removed"]] == [
+        (deleted_id, "deleted")
+    ]
+    # The removal moves the position forward like any change
+    assert data["next_token"] != token
+    again = await async_client_fixture.get(
+        "/api/v1/tasks/changes", params={"since": data["next_token"]}
+    )
+    assert again.json()["removed"] == []
+    assert kept_id not in [removal["id"] for removal in data["removed"]]
+
+
+@pytest.mark.asyncio
+async def test_changes_reject_an_invalid_token(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.get(
+        "/api/v1/tasks/changes", params={"since": "not-a-token"}
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from drivers.dependencies.admission import get_admission_controller
+from drivers.helpers.admission import AdmissionController, RouteClass
+
+
+@pytest.fixture
+def admission_controller(app_fixture):
+    controller = AdmissionController(
+        capacity=1, limits={}, queue_size=0, max_wait=3
+    )
+    app_fixture.dependency_overrides[get_admission_controller] = lambda: controller
+    yield controller
+    app_fixture.dependency_overrides.pop(get_admission_controller)
+
+
+@pytest.mark.asyncio
+async def test_saturated_route_answers_503_with_retry_after(
+    async_client_fixture: AsyncClient, admission_controller, admin_headers_fixture
+):
+    release = asyncio.Event()
+
+    async def hold_the_only_slot():
+        async with admission_controller.admit(RouteClass.WRITE):
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold_the_only_slot())
+    await asyncio.sleep(0)
+    response = await async_client_fixture.get("/api/v1/tasks")
+    release.set()
+    await holder
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+    state = await async_client_fixture.get(
+        "/admin/admission", headers=admin_headers_fixture
+    )
+    assert state.status_code == 200
+    assert state.json()["route_classes"]["list"]["rejected"] == 1
+    assert (await async_client_fixture.get("/api/v1/tasks")).status_code == 200
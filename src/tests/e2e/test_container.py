@@ -0,0 +1,49 @@
+import pytest
+import pytest_asyncio
+
+from drivers.config.settings import get_settings
+from drivers.dependencies.container import Container, container, get_container
+from drivers.dependencies.database import sqlAlchemySessionMaker
+from drivers.dependencies.events import get_task_event_broker
+from drivers.dependencies.repositories import get_task_repository
+
+
+@pytest_asyncio.fixture
+async def session_maker_fixture(settings, setup_database_fixture):
+    """
+    The engine of the application, created from the test settings as the lifespan
+    does, instead of whatever an earlier test left in the holder.
+    """
+    await sqlAlchemySessionMaker.start(settings)
+    yield sqlAlchemySessionMaker(settings)
+    await sqlAlchemySessionMaker.stop()
+
+
+@pytest.mark.asyncio
+async def test_container_is_application_scoped(session_maker_fixture):
+    assert await get_container() is await get_container() is container
+    assert container.settings is get_settings()
+    assert container.event_broker is get_task_event_broker()
+    assert container.session_maker is session_maker_fixture
+
+
+@pytest.mark.asyncio
+async def test_repositories_are_request_scoped(session_maker_fixture):
+    repositories = []
+    for _ in range(2):
+        async for repository in get_task_repository(container):
+            repositories.append(repository)
+
+    first, second = repositories
+    assert first is not second
+    assert first._session is not second._session
+
+
+def test_reset_forgets_the_resolved_components():
+    fresh = Container()
+    settings = fresh.settings
+
+    fresh.reset()
+
+    assert "settings" not in fresh.__dict__
+    assert fresh.settings is settings
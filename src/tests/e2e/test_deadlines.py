@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from adapters.connection_engines.sql_alchemy.deadlines import deadline_scope
+from drivers.config.settings import get_settings
+from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+
+# Counts to 50 million: runs for seconds unless interrupted
+SLOW_QUERY = text(
+    "WITH RECURSIVE counter(x) AS "
+    "(SELECT 1 UNION ALL SELECT x + 1 FROM counter WHERE x < 50000000) "
+    "SELECT count(*) FROM counter"
+)
+
+
+@pytest.fixture
+def list_deadline_ms(app_fixture, settings):
+    """
+    Override the deadline of the list routes.
+    """
+
+    def override(deadline_ms: float) -> None:
+        deadlines = {**settings.request_deadlines_ms, "list": deadline_ms}
+        overridden = settings.model_copy(update={"request_deadlines_ms": deadlines})
+        app_fixture.dependency_overrides[get_settings] = lambda: overridden
+
+    yield override
+    app_fixture.dependency_overrides.pop(get_settings, None)
+
+
+@pytest.fixture
+def slow_list_all(monkeypatch):
+    """
+    Make the list use case hang, recording whether it was cancelled.
+    """
+    calls = {"cancelled": False}
+
+    async def execute(self, params):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            calls["cancelled"] = True
+            raise
+
+    monkeypatch.setattr(ListAllTasksUseCase, "execute", execute)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_interrupts_the_statement(
+    db_session_maker_fixture, setup_database_fixture
+):
+    async with db_session_maker_fixture() as session:
+        start = time.perf_counter()
+        with deadline_scope(0.05), pytest.raises(OperationalError, match="interrupt"):
+            await session.execute(SLOW_QUERY)
+        assert time.perf_counter() - start < 2
+        await session.rollback()
+
+        # The connection is usable again, without deadline
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_route_past_its_deadline_answers_504(
+    async_client_fixture: AsyncClient, list_deadline_ms, slow_list_all
+):
+    list_deadline_ms(50)
+
+    start = time.perf_counter()
+    response = await async_client_fixture.get("/api/v1/tasks")
+
+    assert response.status_code == 504
+    assert time.perf_counter() - start < 2
+    assert slow_list_all["cancelled"] is True
+
+
+@pytest.mark.asyncio
+async def test_client_disconnection_cancels_the_use_case(app_fixture, slow_list_all):
+    messages = iter(
+        [{"type": "http.request", "body": b"", "more_body": False}, None]
+    )
+    sent = []
+
+    async def receive():
+        message = next(messages)
+        if message is None:
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+        return message
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/tasks",
+        "raw_path": b"/api/v1/tasks",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+        "root_path": "",
+    }
+
+    start = time.perf_counter()
+    await asyncio.wait_for(app_fixture(scope, receive, send), timeout=5)
+
+    assert time.perf_counter() - start < 2
+    assert slow_list_all["cancelled"] is True
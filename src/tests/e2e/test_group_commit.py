@@ -0,0 +1,101 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from adapters.repositories.task_repositories.buffered_task_writer import (
+    BufferedTaskWriter,
+)
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from tests.utilis import create_task
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """
+    Sizes of the batches written by the buffer.
+    """
+    sizes = []
+    original = SqlAlchemyTaskRepository.save_many
+
+    async def recording_save_many(self, entities):
+        sizes.append(len(entities))
+        return await original(self, entities)
+
+    monkeypatch.setattr(SqlAlchemyTaskRepository, "save_many", recording_save_many)
+    return sizes
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_share_one_insert(
+    db_session_maker_fixture, task_repository_fixture, batches
+):
+    writer = BufferedTaskWriter(db_session_maker_fixture, window_ms=20, max_batch=100)
+    tasks = [create_task(index=index) for index in range(5)]
+    for task in tasks:
+        task.id = uuid4()
+
+    saved = await asyncio.gather(*(writer.save(task) for task in tasks))
+    await writer.stop()
+
+    assert batches == [5]
+    assert [task.id for task in saved] == [task.id for task in tasks]
+    assert [task.title for task in saved] == [task.title for task in tasks]
+    assert await task_repository_fixture.count() == 5
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_without_waiting(
+    db_session_maker_fixture, batches
+):
+    writer = BufferedTaskWriter(db_session_maker_fixture, window_ms=60_000, max_batch=2)
+
+    saved = await asyncio.wait_for(
+        asyncio.gather(*(writer.save(create_task(index=i)) for i in range(4))),
+        timeout=5,
+    )
+    await writer.stop()
+
+    assert batches == [2, 2]
+    assert all(task.id is not None for task in saved)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_only_fails_the_faulty_save(
+    db_session_maker_fixture, task_repository_fixture, db_session_fixture
+):
+    existing = await task_repository_fixture.save(create_task(index=1))
+    await db_session_fixture.commit()
+    duplicate = create_task(index=2)
+    duplicate.id = existing.id
+
+    writer = BufferedTaskWriter(db_session_maker_fixture, window_ms=20, max_batch=100)
+    results = await asyncio.gather(
+        writer.save(create_task(index=3)),
+        writer.save(duplicate),
+        writer.save(create_task(index=4)),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert isinstance(results[1], IntegrityError)
+    assert results[0].title == "My task 3"
+    assert results[2].title == "My task 4"
+    assert await task_repository_fixture.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_pending_saves(db_session_maker_fixture, batches):
+    writer = BufferedTaskWriter(db_session_maker_fixture, window_ms=60_000, max_batch=100)
+
+    pending = asyncio.ensure_future(writer.save(create_task(index=1)))
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    assert (await pending).id is not None
+    assert batches == [1]
+    with pytest.raises(RuntimeError):
+        await writer.save(create_task(index=2))
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from adapters.idempotency_stores.sql_alchemy_idempotency_store import (
+    IdempotencyKeyInProgress,
+    SqlAlchemyIdempotencyStore,
+)
+
+
+def new_store(session_maker, **options):
+    return SqlAlchemyIdempotencyStore(
+        session_maker,
+        **{"ttl": 60, "lock_ttl": 60, "cache_size": 2, "wait_timeout": 0.2, **options},
+    )
+
+
+@pytest.mark.asyncio
+async def test_key_in_progress_on_another_worker(db_session_maker_fixture):
+    worker = new_store(db_session_maker_fixture)
+    other_worker = new_store(db_session_maker_fixture)
+    assert await worker.reserve("key", "hash") is None
+
+    with pytest.raises(IdempotencyKeyInProgress):
+        await other_worker.reserve("key", "hash")
+
+
+@pytest.mark.asyncio
+async def test_waits_for_the_response_of_another_worker(db_session_maker_fixture):
+    worker = new_store(db_session_maker_fixture)
+    other_worker = new_store(db_session_maker_fixture, wait_timeout=5)
+    await worker.reserve("key", "hash")
+
+    waiting = asyncio.create_task(other_worker.reserve("key", "hash"))
+    await asyncio.sleep(0.1)
+    await worker.complete("key", "hash", 201, '{"id": 1}')
+    stored = await waiting
+
+    assert (stored.status_code, stored.body) == (201, '{"id": 1}')
+
+
+@pytest.mark.asyncio
+async def test_replays_the_response_read_from_another_worker(db_session_maker_fixture):
+    worker = new_store(db_session_maker_fixture)
+    other_worker = new_store(db_session_maker_fixture)
+    await worker.reserve("replayed", "hash")
+    await worker.complete("replayed", "hash", 201, '{"id": 1}')
+
+    # The first replay reads the row, the next ones come from the worker's cache
+    for _ in range(3):
+        stored = await other_worker.reserve("replayed", "hash")
+        assert (stored.status_code, stored.body) == (201, '{"id": 1}')
+        assert stored.expires_at.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_abandoned_reservation_expires(db_session_maker_fixture):
+    crashed_worker = new_store(db_session_maker_fixture, lock_ttl=-1)
+    other_worker = new_store(db_session_maker_fixture)
+    await crashed_worker.reserve("key", "hash")
+
+    assert await other_worker.reserve("key", "hash") is None
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_keys(db_session_maker_fixture):
+    store = new_store(db_session_maker_fixture, ttl=-1)
+    await store.reserve("expired", "hash")
+    await store.complete("expired", "hash", 201, "{}")
+    await store.reserve("pending", "hash")
+
+    assert await store.purge_expired() == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_keeps_the_latest_responses(db_session_maker_fixture):
+    store = new_store(db_session_maker_fixture)
+    for key in ("a", "b", "c"):
+        await store.reserve(key, "hash")
+        await store.complete(key, "hash", 201, key)
+
+    assert list(store._cache) == ["b", "c"]
+    assert (await store.reserve("a", "hash")).body == "a"
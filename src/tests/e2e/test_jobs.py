@@ -0,0 +1,159 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from adapters.connection_engines.sql_alchemy.job_lock import JobLock, JobLockLost
+from adapters.connection_engines.sql_alchemy.models import JobLockModel
+from domain.entities.task import TaskStatus
+from drivers.jobs.overdue_sweep import sweep_overdue_tasks
+from drivers.jobs.runner import Job, JobRunner
+from tests.utilis import create_task
+
+
+async def save_task(repository, index, status=TaskStatus.PENDING, overdue_hours=1):
+    task = create_task(index=index, status=status)
+    task.due_date = datetime.now(timezone.utc) - timedelta(hours=overdue_hours)
+    return await repository.save(task)
+
+
+@pytest.mark.asyncio
+async def test_sweep_flags_the_overdue_tasks(
+    db_session_maker_fixture, task_repository_fixture, db_session_fixture
+):
+    overdue = [await save_task(task_repository_fixture, index) for index in range(5)]
+    completed = await save_task(task_repository_fixture, 5, status=TaskStatus.COMPLETED)
+    upcoming = await save_task(task_repository_fixture, 6, overdue_hours=-1)
+    await db_session_fixture.commit()
+
+    flagged = await sweep_overdue_tasks(db_session_maker_fixture, batch_size=2)
+    flagged_again = await sweep_overdue_tasks(db_session_maker_fixture, batch_size=2)
+
+    assert (flagged, flagged_again) == (5, 0)
+    for task in overdue:
+        saved = await task_repository_fixture.get(id_filter=task.id)
+        assert saved.overdue_at is not None
+    for task in (completed, upcoming):
+        saved = await task_repository_fixture.get(id_filter=task.id)
+        assert saved.overdue_at is None
+
+
+@pytest.mark.asyncio
+async def test_job_lock_is_held_by_one_owner(db_session_maker_fixture):
+    first = JobLock(db_session_maker_fixture, ttl=60)
+    second = JobLock(db_session_maker_fixture, ttl=60)
+
+    async with first.hold("job") as first_acquired:
+        async with second.hold("job") as second_acquired:
+            pass
+        async with second.hold("other-job") as other_acquired:
+            pass
+    async with second.hold("job") as acquired_after_release:
+        pass
+
+    assert first_acquired is True
+    assert second_acquired is False
+    assert other_acquired is True
+    assert acquired_after_release is True
+
+
+@pytest.mark.asyncio
+async def test_expired_job_lock_is_taken_over(db_session_maker_fixture):
+    crashed = JobLock(db_session_maker_fixture, ttl=-1)
+    other = JobLock(db_session_maker_fixture, ttl=60)
+
+    # Never released, as if its process had died
+    await crashed._acquire_lease("job")
+    async with other.hold("job") as acquired:
+        pass
+
+    assert acquired is True
+
+
+@pytest.mark.asyncio
+async def test_job_lease_is_renewed_while_the_job_runs(db_session_maker_fixture):
+    holder = JobLock(db_session_maker_fixture, ttl=0.3)
+    other = JobLock(db_session_maker_fixture, ttl=60)
+
+    async with holder.hold("job") as acquired:
+        # Longer than the ttl
+        await asyncio.sleep(0.6)
+        async with other.hold("job") as other_acquired:
+            pass
+
+    assert acquired is True
+    assert other_acquired is False
+
+
+@pytest.mark.asyncio
+async def test_job_is_aborted_when_its_lease_is_lost(db_session_maker_fixture):
+    holder = JobLock(db_session_maker_fixture, ttl=0.3)
+    steps = []
+
+    with pytest.raises(JobLockLost):
+        async with holder.hold("job"):
+            # Taken over, as if the lease had expired during a pause
+            async with db_session_maker_fixture() as session, session.begin():
+                await session.execute(update(JobLockModel).values(owner="someone-else"))
+            await asyncio.sleep(1)
+            steps.append("finished")
+
+    assert steps == []
+
+
+@pytest.mark.asyncio
+async def test_runner_reports_a_job_that_lost_its_lease(db_session_maker_fixture):
+    runs = []
+
+    async def run():
+        async with db_session_maker_fixture() as session, session.begin():
+            await session.execute(update(JobLockModel).values(owner="someone-else"))
+        await asyncio.sleep(1)
+        runs.append(1)
+
+    runner = JobRunner(JobLock(db_session_maker_fixture, ttl=0.3))
+    ran = await runner.run_once(Job(name="job", interval=60, run=run))
+
+    assert ran is True
+    assert runs == []
+
+
+@pytest.mark.asyncio
+async def test_runner_skips_a_job_locked_elsewhere(db_session_maker_fixture):
+    runs = []
+
+    async def run():
+        runs.append(1)
+
+    job = Job(name="job", interval=0.01, run=run)
+    runner = JobRunner(JobLock(db_session_maker_fixture, ttl=60))
+    async with JobLock(db_session_maker_fixture, ttl=60).hold("job"):
+        skipped = await runner.run_once(job)
+    ran = await runner.run_once(job)
+
+    assert (skipped, ran) == (False, True)
+    assert runs == [1]
+
+
+@pytest.mark.asyncio
+async def test_runner_runs_jobs_periodically_until_stopped(db_session_maker_fixture):
+    runs = []
+
+    async def run():
+        runs.append(1)
+        if len(runs) == 2:
+            raise RuntimeError("A failing run does not stop the job")
+
+    runner = JobRunner(JobLock(db_session_maker_fixture, ttl=60))
+    runner.start([Job(name="job", interval=0.01, run=run)])
+    for _ in range(200):
+        if len(runs) >= 3:
+            break
+        await asyncio.sleep(0.01)
+    await runner.stop()
+    stopped_at = len(runs)
+    await asyncio.sleep(0.05)
+
+    assert stopped_at >= 3
+    assert len(runs) == stopped_at
@@ -0,0 +1,28 @@
+import pytest
+from httpx import AsyncClient
+
+from drivers.dependencies.database import sqlAlchemySessionMaker
+
+
+@pytest.mark.asyncio
+async def test_not_ready_outside_lifespan(async_client_fixture: AsyncClient):
+    response = await async_client_fixture.get("/health/ready")
+
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_up_and_disposes_pool(
+    app_fixture, async_client_fixture: AsyncClient, setup_database_fixture
+):
+    async with app_fixture.router.lifespan_context(app_fixture):
+        response = await async_client_fixture.get("/health/ready")
+        session_maker = sqlAlchemySessionMaker()
+        pool = session_maker.kw["bind"].pool
+
+        assert response.status_code == 200
+        # The warm-up connection was opened at startup and is waiting in the pool
+        assert pool.checkedin() >= 1
+
+    assert sqlAlchemySessionMaker.ready is False
+    assert pool.checkedin() == 0
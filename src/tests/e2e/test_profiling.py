@@ -0,0 +1,149 @@
+import asyncio
+import marshal
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from drivers.api.v1.tasks.router import router as tasks_router
+from drivers.config.settings import Environment
+from drivers.middlewares.profiling import ProfilingMiddleware, sign_profile_request
+
+
+@pytest.fixture
+def profiling_settings(settings, tmp_path):
+    return settings.model_copy(
+        update={
+            "env": Environment.prod,
+            "profiling_secret": "secret",
+            "profiling_output_dir": str(tmp_path),
+        }
+    )
+
+
+@pytest.fixture
+def profiled_client_factory(setup_database_fixture):
+    def _create_client(settings) -> AsyncClient:
+        application = FastAPI()
+        application.include_router(tasks_router)
+        application.add_middleware(ProfilingMiddleware, settings=settings)
+        return AsyncClient(
+            transport=ASGITransport(app=application), base_url="http://test"
+        )
+
+    return _create_client
+
+
+@pytest.mark.asyncio
+async def test_signed_request_is_profiled_to_disk(
+    profiling_settings, profiled_client_factory, tmp_path
+):
+    async with profiled_client_factory(profiling_settings) as client:
+        response = await client.get(
+            "/api/v1/tasks",
+            headers={
+                "X-Profile": sign_profile_request("secret", "GET", "/api/v1/tasks")
+            },
+        )
+
+    assert response.status_code == 200
+    assert "items" in response.json()
+    [profile] = tmp_path.iterdir()
+    assert response.headers["X-Profile-Path"] == str(profile)
+
+
+@pytest.mark.asyncio
+async def test_profile_download(profiling_settings, profiled_client_factory):
+    settings = profiling_settings.model_copy(update={"env": Environment.test})
+    async with profiled_client_factory(settings) as client:
+        response = await client.get("/api/v1/tasks", params={"profile": "download"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["X-Profile-Response-Status"] == "200"
+    assert response.headers["X-Profile-Scope"] == "request"
+    stats = marshal.loads(response.content)
+    assert any(function == "execute" for _, _, function in stats)
+
+
+@pytest.mark.asyncio
+async def test_profile_download_keeps_the_response_status(
+    profiling_settings, profiled_client_factory
+):
+    settings = profiling_settings.model_copy(update={"env": Environment.test})
+    async with profiled_client_factory(settings) as client:
+        response = await client.get("/api/v1/missing", params={"profile": "download"})
+
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers["X-Profile-Response-Status"] == "404"
+
+
+@pytest.mark.asyncio
+async def test_profiled_request_runs_alone(profiling_settings, tmp_path):
+    settings = profiling_settings.model_copy(update={"env": Environment.test})
+    application = FastAPI()
+    order = []
+
+    @application.get("/work/{name}")
+    async def work(name: str):
+        order.append(f"{name} started")
+        await asyncio.sleep(0.05)
+        order.append(f"{name} done")
+        return {}
+
+    application.add_middleware(ProfilingMiddleware, settings=settings)
+    async with AsyncClient(
+        transport=ASGITransport(app=application), base_url="http://test"
+    ) as client:
+        in_flight = asyncio.create_task(client.get("/work/in-flight"))
+        await asyncio.sleep(0.01)
+        profiled = asyncio.create_task(client.get("/work/profiled?profile=1"))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.create_task(client.get("/work/waiting"))
+        responses = await asyncio.gather(in_flight, profiled, waiting)
+
+    # The profiled request waits for the one in flight and holds back the next one
+    assert order == [
+        "in-flight started",
+        "in-flight done",
+        "profiled started",
+        "profiled done",
+        "waiting started",
+        "waiting done",
+    ]
+    assert responses[1].headers["X-Profile-Scope"] == "request"
+
+
+@pytest.mark.asyncio
+async def test_unsigned_or_production_requests_are_not_profiled(
+    profiling_settings, profiled_client_factory, tmp_path
+):
+    async with profiled_client_factory(profiling_settings) as client:
+        flag_response = await client.get("/api/v1/tasks", params={"profile": "1"})
+        forged_response = await client.get(
+            "/api/v1/tasks",
+            headers={
+                "X-Profile": sign_profile_request("forged", "GET", "/api/v1/tasks")
+            },
+        )
+
+    assert "X-Profile-Path" not in flag_response.headers
+    assert "X-Profile-Path" not in forged_response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "env, profiled", [(Environment.prod, False), (Environment.test, True)]
+)
+async def test_requests_are_sampled_outside_production_only(
+    profiling_settings, profiled_client_factory, env, profiled
+):
+    settings = profiling_settings.model_copy(
+        update={"env": env, "profiling_sample_rate": 1.0}
+    )
+    async with profiled_client_factory(settings) as client:
+        response = await client.get("/api/v1/tasks")
+
+    assert response.status_code == 200
+    assert ("X-Profile-Path" in response.headers) is profiled
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from drivers.middlewares.query_stats import QueryBudgetExceeded, QueryStatsMiddleware
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_reports_server_timing(
+    async_client_fixture: AsyncClient, pending_task_with_medium_priority_fixture
+):
+    response = await async_client_fixture.get("/api/v1/tasks")
+
+    assert response.status_code == 200
+    server_timing = response.headers.get_list("server-timing")
+    assert any(value.startswith("db;") for value in server_timing)
+    # One statement for the page and one for the total count
+    assert 'db-queries;desc="2 statements"' in server_timing
+
+
+@pytest.mark.asyncio
+async def test_query_budget_exceeded_fails_in_strict_mode(
+    settings, db_session_maker_fixture
+):
+    application = FastAPI()
+    application.add_middleware(
+        QueryStatsMiddleware,
+        settings=settings.model_copy(
+            update={"query_budget": 2, "query_budget_strict": True}
+        ),
+    )
+
+    @application.get("/n-plus-one")
+    async def n_plus_one():
+        async with db_session_maker_fixture() as session:
+            for _ in range(3):
+                await session.execute(text("SELECT 1"))
+        return {}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=application), base_url="http://test"
+    ) as client:
+        with pytest.raises(QueryBudgetExceeded, match="3x SELECT 1"):
+            await client.get("/n-plus-one")
@@ -0,0 +1,194 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.resharding import copy_shard_rows
+from adapters.connection_engines.sql_alchemy.session import (
+    dispose_session_maker,
+    get_session_maker,
+)
+from adapters.repositories.task_repositories.sharded_task_repository import shard_for
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, TaskStatus
+from domain.value_objects.change_feed import ChangePosition, Removal
+from domain.value_objects.ordering import Ordering
+from drivers.dependencies.repositories import sharded_repository_scope
+from tests.utilis import create_task
+
+
+async def create_databases(settings, names):
+    session_makers = []
+    for url in settings.model_copy(
+        update={"db_shard_names": names}
+    ).shard_database_urls:
+        session_maker = get_session_maker(settings, database_url=url)
+        async with session_maker.kw["bind"].begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_makers.append(session_maker)
+    return session_makers
+
+
+@pytest_asyncio.fixture
+async def shards(settings, tmp_path):
+    session_makers = await create_databases(
+        settings, [str(tmp_path / f"shard_{index}") for index in range(3)]
+    )
+    yield session_makers
+    for session_maker in session_makers:
+        await dispose_session_maker(session_maker)
+
+
+def new_tasks(count):
+    tasks = []
+    for index in range(count):
+        task = create_task(
+            index=index,
+            status=list(TaskStatus)[index % 3],
+            priority=list(Priority)[index % 2],
+        )
+        task.id = uuid4()
+        task.created_at += timedelta(seconds=index)
+        tasks.append(task)
+    return tasks
+
+
+async def shard_ids(session_maker):
+    async with session_maker() as session:
+        tasks = await SqlAlchemyTaskRepository(session).list_all(limit=100)
+    return {task.id for task in tasks}
+
+
+@pytest.mark.asyncio
+async def test_tasks_are_stored_in_the_shard_of_their_id(shards):
+    tasks = new_tasks(12)
+    async with sharded_repository_scope(shards) as repository:
+        saved = await repository.save_many(tasks)
+        created = await repository.save(create_task(index=12))
+
+    assert [task.id for task in saved] == [task.id for task in tasks]
+    for index, session_maker in enumerate(shards):
+        assert await shard_ids(session_maker) == {
+            task.id for task in [*tasks, created] if shard_for(task.id, 3) == index
+        }
+    async with sharded_repository_scope(shards) as repository:
+        found = await repository.get(id_filter=created.id)
+        assert found is not None and found.title == created.title
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordering", [Ordering.ASC, Ordering.DESC])
+async def test_listing_merges_the_shards_in_order(shards, ordering):
+    tasks = new_tasks(20)
+    async with sharded_repository_scope(shards) as repository:
+        await repository.bulk_insert(tasks)
+
+    expected = sorted(
+        (task for task in tasks if task.status == TaskStatus.PENDING),
+        key=lambda task: task.created_at,
+        reverse=ordering == Ordering.DESC,
+    )
+    async with sharded_repository_scope(shards) as repository:
+        pages = [
+            await repository.list_all(
+                page=page,
+                limit=3,
+                ordering=ordering,
+                status_filter=TaskStatus.PENDING,
+            )
+            for page in (1, 2, 3)
+        ]
+        projected = await repository.list_projected(
+            ["title"], limit=5, ordering=ordering, status_filter=TaskStatus.PENDING
+        )
+        count = await repository.count(status_filter=TaskStatus.PENDING)
+
+    assert [task.id for page in pages for task in page] == [
+        task.id for task in expected
+    ]
+    assert [projection.id for projection in projected] == [
+        task.id for task in expected[:5]
+    ]
+    assert set(projected[0].values) == {"id", "title"}
+    assert count == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_writes_by_filter_run_on_every_shard(shards):
+    tasks = new_tasks(9)
+    async with sharded_repository_scope(shards) as repository:
+        await repository.save_many(tasks)
+
+    async with sharded_repository_scope(shards) as repository:
+        updated = await repository.update(
+            {"priority": Priority.HIGH}, status_filter=TaskStatus.PENDING
+        )
+        deleted = await repository.delete(id_filter=tasks[1].id)
+        deleted_in = await repository.delete(
+            id_in_filter=[tasks[2].id, tasks[4].id, uuid4()]
+        )
+
+    async with sharded_repository_scope(shards) as repository:
+        assert updated == 3
+        assert (deleted, deleted_in) == (1, 2)
+        assert await repository.count() == 6
+        assert await repository.count(priority_filter=Priority.HIGH) == 3
+        changes = await repository.list_changes(limit=100)
+    # The removals of every shard, merged in position order after the tasks
+    removals = [change for change in changes if isinstance(change, Removal)]
+    assert {removal.id for removal in removals} == {
+        tasks[1].id,
+        tasks[2].id,
+        tasks[4].id,
+    }
+    assert changes[-3:] == removals
+    assert [ChangePosition.of(change) for change in changes] == sorted(
+        ChangePosition.of(change) for change in changes
+    )
+
+
+@pytest.mark.asyncio
+async def test_after_commit_waits_for_every_shard(shards):
+    calls = []
+    async with sharded_repository_scope(shards) as repository:
+        await repository.save(create_task(index=1))
+        repository.after_commit(lambda: calls.append("committed"))
+        assert calls == []
+    assert calls == ["committed"]
+
+    with pytest.raises(RuntimeError):
+        async with sharded_repository_scope(shards) as repository:
+            repository.after_commit(lambda: calls.append("rolled back"))
+            raise RuntimeError("failed")
+    assert calls == ["committed"]
+
+
+@pytest.mark.asyncio
+async def test_resharding_copies_every_task_once(settings, shards, tmp_path):
+    [source] = await create_databases(settings, [str(tmp_path / "source")])
+    tasks = new_tasks(25)
+    async with source() as session, session.begin():
+        repository = SqlAlchemyTaskRepository(session)
+        await repository.save_many(tasks)
+        await repository.archive(status_filter=TaskStatus.COMPLETED)
+
+    copied = await copy_shard_rows(
+        [source], shards, lambda task_id: shard_for(task_id, 3), batch_size=4
+    )
+    # Copying again skips the tasks already there
+    await copy_shard_rows([source], shards, lambda task_id: shard_for(task_id, 3))
+    await dispose_session_maker(source)
+
+    # The tasks, and the tombstones of the 8 archived ones
+    assert copied == 33
+    async with sharded_repository_scope(shards) as repository:
+        assert await repository.count() == 17
+        assert await repository.count(include_archived=True) == 25
+    for index, session_maker in enumerate(shards):
+        assert all(
+            shard_for(task_id, 3) == index for task_id in await shard_ids(session_maker)
+        )
@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.connection_engines.sql_alchemy.slow_query_log import (
+    SlowQueryLog,
+    _explain,
+)
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import TaskStatus
+from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log_captures_plan_and_origin(
+    settings, setup_database_fixture
+):
+    slow_query_log = SlowQueryLog(threshold_ms=0, rate_limit=1, buffer_size=5)
+    session_maker = get_session_maker(settings, slow_query_log=slow_query_log)
+
+    async with session_maker() as session:
+        use_case = ListAllTasksUseCase(SqlAlchemyTaskRepository(session))
+        await use_case.execute({"status_filter": TaskStatus.PENDING})
+    await session_maker.kw["bind"].dispose()
+
+    # list_all and count both ran, but only one statement fits in the rate limit
+    [slow_query] = slow_query_log.recent()
+    assert slow_query_log.suppressed == 1
+    assert slow_query.statement.lstrip().startswith("SELECT")
+    assert slow_query.use_case == (
+        "use_cases.tasks.get_all_tasks_usecase.ListAllTasksUseCase.execute"
+    )
+    assert slow_query.plan
+    assert TaskStatus.PENDING.value not in str(slow_query.parameters)
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_endpoint_disabled_by_default(
+    async_client_fixture, admin_headers_fixture
+):
+    response = await async_client_fixture.get(
+        "/admin/slow-queries", headers=admin_headers_fixture
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Slow query buffer is disabled"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("token", [None, "wrong-secret"])
+async def test_admin_endpoints_need_the_token_in_production(
+    async_client_fixture, admin_headers_fixture, token
+):
+    headers = {"X-Admin-Token": token} if token else {}
+
+    response = await async_client_fixture.get("/admin/slow-queries", headers=headers)
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Not Found"
+
+
+class FailingExplainCursor:
+    def __init__(self, error: type[Exception]):
+        self.error = error
+        self.executed: list[str] = []
+
+    def execute(self, statement: str, parameters=None) -> None:
+        self.executed.append(statement)
+        if statement.startswith("EXPLAIN"):
+            raise self.error("permission denied")
+
+    def close(self) -> None:
+        pass
+
+
+def test_failed_explain_rolls_back_to_its_savepoint():
+    class DatabaseError(Exception):
+        pass
+
+    cursor = FailingExplainCursor(DatabaseError)
+    conn = SimpleNamespace(
+        dialect=SimpleNamespace(
+            name="postgresql", loaded_dbapi=SimpleNamespace(Error=DatabaseError)
+        ),
+        in_transaction=lambda: True,
+        connection=SimpleNamespace(
+            dbapi_connection=SimpleNamespace(cursor=lambda: cursor)
+        ),
+    )
+
+    plan = _explain(conn, "SELECT * FROM tasks", ())
+
+    assert plan == ["EXPLAIN failed: permission denied"]
+    assert cursor.executed == [
+        "SAVEPOINT slow_query_explain",
+        "EXPLAIN SELECT * FROM tasks",
+        "ROLLBACK TO SAVEPOINT slow_query_explain",
+        "RELEASE SAVEPOINT slow_query_explain",
+    ]
+
+
+def test_explain_does_not_swallow_other_errors():
+    cursor = FailingExplainCursor(RuntimeError)
+    conn = SimpleNamespace(
+        dialect=SimpleNamespace(
+            name="postgresql", loaded_dbapi=SimpleNamespace(Error=LookupError)
+        ),
+        in_transaction=lambda: True,
+        connection=SimpleNamespace(
+            dbapi_connection=SimpleNamespace(cursor=lambda: cursor)
+        ),
+    )
+
+    with pytest.raises(RuntimeError):
+        _explain(conn, "SELECT * FROM tasks", ())
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+
+import pytest
+
+from adapters.connection_engines.sql_alchemy import SqlAlchemyAbstractRepository
+from adapters.connection_engines.sql_alchemy.query_stats import collect_query_stats
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import Priority, TaskStatus
+from domain.value_objects.ordering import Ordering
+from tests.utilis import create_task
+
+
+@pytest.mark.asyncio
+async def test_statements_are_built_once_per_query_shape(task_repository_fixture):
+    first = task_repository_fixture._get_statement(
+        "list_all", {"status_filter": TaskStatus.PENDING}, "created_at", Ordering.ASC
+    )
+    second = task_repository_fixture._get_statement(
+        "list_all", {"status_filter": TaskStatus.COMPLETED}, "created_at", Ordering.ASC
+    )
+    other_shape = task_repository_fixture._get_statement(
+        "list_all", {"priority_filter": Priority.LOW}, "created_at", Ordering.ASC
+    )
+
+    assert first is second
+    assert first is not other_shape
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_evicts_the_least_recently_used(
+    task_repository_fixture, monkeypatch
+):
+    monkeypatch.setattr(SqlAlchemyAbstractRepository, "STATEMENT_CACHE_SIZE", 2)
+    monkeypatch.setattr(SqlAlchemyAbstractRepository, "_statement_cache", OrderedDict())
+
+    def statement(order_by):
+        return task_repository_fixture._get_statement(
+            "list_all", {}, order_by, Ordering.ASC
+        )
+
+    by_title = statement("title")
+    statement("status")
+    # Used again: the status shape is now the least recently used
+    statement("title")
+    statement("priority")
+
+    assert statement("title") is by_title
+    assert [key[3] for key in SqlAlchemyAbstractRepository._statement_cache] == [
+        "priority",
+        "title",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_all_rejects_unknown_order_by(task_repository_fixture):
+    with pytest.raises(ValueError):
+        await task_repository_fixture.list_all(order_by="title;drop")
+
+
+@pytest.mark.asyncio
+async def test_list_all_binds_filters_ordering_and_pagination(
+    task_repository_fixture, db_session_fixture
+):
+    for index in range(3):
+        await task_repository_fixture.save(create_task(index=index))
+    await task_repository_fixture.save(
+        create_task(index=3, status=TaskStatus.COMPLETED)
+    )
+    await db_session_fixture.commit()
+
+    pending = await task_repository_fixture.list_all(
+        order_by="title",
+        ordering=Ordering.DESC,
+        limit=2,
+        page=1,
+        status_filter=TaskStatus.PENDING,
+    )
+    next_page = await task_repository_fixture.list_all(
+        order_by="title",
+        ordering=Ordering.DESC,
+        limit=2,
+        page=2,
+        status_filter=TaskStatus.PENDING,
+    )
+
+    assert [task.title for task in pending] == ["My task 2", "My task 1"]
+    assert [task.title for task in next_page] == ["My task 0"]
+    assert await task_repository_fixture.count(status_filter=TaskStatus.PENDING) == 3
+
+
+@pytest.mark.asyncio
+async def test_save_is_a_single_round_trip(task_repository_fixture, db_session_fixture):
+    task = create_task(index=1)
+
+    with collect_query_stats() as stats:
+        saved = await task_repository_fixture.save(task)
+    await db_session_fixture.commit()
+
+    assert stats.count == 1
+    assert saved.id is not None
+    assert saved.title == task.title
+    assert saved.status == TaskStatus.PENDING
+    assert saved.created_at is not None
+    assert saved.updated_at is not None
+    assert await task_repository_fixture.get(id_filter=saved.id) == saved
+
+
+@pytest.mark.asyncio
+async def test_list_projected_only_reads_requested_columns(
+    task_repository_fixture, db_session_fixture
+):
+    saved = await task_repository_fixture.save(create_task(index=1))
+    await db_session_fixture.commit()
+
+    with collect_query_stats() as stats:
+        [task] = await task_repository_fixture.list_projected(["title"])
+
+    [statement] = stats.statements
+    assert "description" not in statement
+    assert task.id == saved.id
+    assert task.title == saved.title
+    assert dict(task.values) == {"id": saved.id, "title": saved.title}
+    assert not hasattr(task, "description")
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_wait_for_the_commit(db_session_maker_fixture):
+    calls = []
+    async with db_session_maker_fixture() as session:
+        repository = SqlAlchemyTaskRepository(session)
+
+        await repository.save(create_task(index=1))
+        repository.after_commit(lambda: calls.append("committed"))
+        assert calls == []
+        await session.commit()
+        assert calls == ["committed"]
+
+        await repository.save(create_task(index=2))
+        repository.after_commit(lambda: calls.append("rolled back"))
+        await session.rollback()
+        await session.commit()
+
+    assert calls == ["committed"]
+
+
+@pytest.mark.asyncio
+async def test_reads_map_rows_without_orm_instances(
+    db_session_maker_fixture, task_repository_fixture, db_session_fixture
+):
+    saved = await task_repository_fixture.save(
+        create_task(index=1, status=TaskStatus.IN_PROGRESS, priority=Priority.HIGH)
+    )
+    await db_session_fixture.commit()
+
+    async with db_session_maker_fixture() as session:
+        repository = SqlAlchemyTaskRepository(session)
+        found = await repository.get(id_filter=saved.id)
+        [listed] = await repository.list_all()
+
+        assert len(session.identity_map) == 0
+    assert found == listed == saved
+    assert found is not None and found.status is TaskStatus.IN_PROGRESS
+    assert listed.priority is Priority.HIGH
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import text
+
+from adapters.connection_engines.sql_alchemy.session import (
+    dispose_session_maker,
+    get_session_maker,
+)
+
+PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+
+
+async def read_pragmas(settings):
+    session_maker = get_session_maker(settings)
+    try:
+        async with session_maker() as session:
+            return {
+                name: await session.scalar(text(f"PRAGMA {name}")) for name in PRAGMAS
+            }
+    finally:
+        await dispose_session_maker(session_maker)
+
+
+@pytest.mark.asyncio
+async def test_connections_use_the_sqlite_profile(settings, tmp_path):
+    profiled = settings.model_copy(
+        update={"db_name": str(tmp_path / "profiled"), "sqlite_cache_size_kib": 1024}
+    )
+
+    assert await read_pragmas(profiled) == {
+        "journal_mode": "wal",
+        # NORMAL
+        "synchronous": 1,
+        "cache_size": -1024,
+        "mmap_size": 268435456,
+        # MEMORY
+        "temp_store": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_the_sqlite_profile_can_be_disabled(settings, tmp_path):
+    default = settings.model_copy(
+        update={"db_name": str(tmp_path / "default"), "sqlite_profile_enabled": False}
+    )
+
+    pragmas = await read_pragmas(default)
+
+    assert pragmas["journal_mode"] == "delete"
+    # FULL
+    assert pragmas["synchronous"] == 2
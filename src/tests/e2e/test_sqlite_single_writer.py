@@ -0,0 +1,121 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from adapters.connection_engines.sql_alchemy.models import Base
+from adapters.connection_engines.sql_alchemy.session import get_session_maker
+from adapters.connection_engines.sql_alchemy.write_queue import WriteQueue
+from adapters.repositories.task_repositories.sql_alchemy_task_repository import (
+    SqlAlchemyTaskRepository,
+)
+from domain.entities.task import TaskStatus
+from drivers.dependencies.repositories import single_writer_repository_scope
+from drivers.dependencies.single_writer import SqliteSingleWriter
+from tests.utilis import create_task
+
+
+@pytest_asyncio.fixture
+async def single_writer(settings, tmp_path):
+    settings = settings.model_copy(
+        update={
+            "db_name": str(tmp_path / "single_writer"),
+            "sqlite_single_writer_enabled": True,
+        }
+    )
+    session_maker = get_session_maker(settings)
+    async with session_maker.kw["bind"].begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await session_maker.kw["bind"].dispose()
+
+    connections = SqliteSingleWriter()
+    await connections.start(settings)
+    yield connections()
+    await connections.stop()
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """
+    Sizes of the transactions run by the write queues.
+    """
+    sizes = []
+    original = WriteQueue._write
+
+    async def recording_write(self, batch):
+        sizes.append(len(batch))
+        return await original(self, batch)
+
+    monkeypatch.setattr(WriteQueue, "_write", recording_write)
+    return sizes
+
+
+async def save(single_writer, task):
+    async with single_writer_repository_scope(single_writer) as repository:
+        return await repository.save(task)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_transactions(single_writer, batches):
+    tasks = [create_task(index=index) for index in range(20)]
+
+    saved = await asyncio.gather(*(save(single_writer, task) for task in tasks))
+
+    assert [task.title for task in saved] == [task.title for task in tasks]
+    assert sum(batches) == 20
+    assert len(batches) < 20
+    async with single_writer_repository_scope(single_writer) as repository:
+        assert await repository.count() == 20
+
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_caller(single_writer):
+    existing = await save(single_writer, create_task(index=1))
+    duplicate = create_task(index=2)
+    duplicate.id = existing.id
+
+    results = await asyncio.gather(
+        save(single_writer, create_task(index=3)),
+        save(single_writer, duplicate),
+        save(single_writer, create_task(index=4)),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], IntegrityError)
+    assert [task.title for task in (results[0], results[2])] == [
+        "My task 3",
+        "My task 4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reads_see_the_queued_writes(single_writer):
+    async with single_writer_repository_scope(single_writer) as repository:
+        task = await repository.save(create_task(index=1))
+        updated = await repository.update(
+            {"status": TaskStatus.COMPLETED}, id_filter=task.id
+        )
+        reloaded = await repository.get(id_filter=task.id)
+        # The reads run on read-only connections
+        with pytest.raises(OperationalError, match="readonly"):
+            await repository._session.execute(text("DELETE FROM tasks"))
+
+    assert updated == 1
+    assert reloaded is not None and reloaded.status == TaskStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_stop_runs_the_queued_writes(single_writer):
+    task = create_task(index=1)
+    task.id = uuid4()
+    saving = asyncio.create_task(save(single_writer, task))
+    await asyncio.sleep(0)
+
+    await single_writer.write_queue.stop()
+
+    assert (await saving).id == task.id
+    async with single_writer.readers() as session:
+        assert await SqlAlchemyTaskRepository(session).count() == 1
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from benchmarks.startup import measure_startup
+
+# Generous on purpose: the goal is to catch regressions (e.g. heavy work moved back to
+# import time), not to benchmark the CI runner. Override with STARTUP_BUDGET_SECONDS.
+STARTUP_BUDGET_SECONDS = float(os.environ.get("STARTUP_BUDGET_SECONDS", "5"))
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "0.2"))
+
+# Modules that must only be loaded when the application is built
+LAZY_MODULES = ("fastapi", "sqlalchemy", "use_cases", "adapters")
+# Modules that must only be loaded when the application first runs
+DEFERRED_MODULES = ("sqlalchemy", "use_cases", "adapters", "drivers.api")
+
+
+@pytest.fixture(scope="module")
+def startup():
+    return measure_startup()
+
+
+def test_importing_main_module_defers_heavy_imports(startup):
+    loaded = [
+        module
+        for module in startup["import_modules"]
+        if module.split(".")[0] in LAZY_MODULES
+    ]
+
+    assert loaded == []
+    assert startup["import_seconds"] < IMPORT_BUDGET_SECONDS
+
+
+def test_building_the_app_defers_the_routers(startup):
+    loaded = [
+        module
+        for module in startup["create_app_modules"]
+        if module.startswith(DEFERRED_MODULES)
+    ]
+
+    assert loaded == []
+
+
+def test_time_to_first_response_within_budget(startup):
+    assert startup["status_code"] == 200
+    assert startup["first_response_seconds"] < STARTUP_BUDGET_SECONDS
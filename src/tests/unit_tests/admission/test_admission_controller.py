@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from drivers.helpers.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    RouteClass,
+)
+
+
+def controller(capacity=2, queue_size=10, max_wait=1.0, **limits) -> AdmissionController:
+    return AdmissionController(
+        capacity=capacity,
+        limits={RouteClass(name): limit for name, limit in limits.items()},
+        queue_size=queue_size,
+        max_wait=max_wait,
+    )
+
+
+async def hold(admission: AdmissionController, route_class: RouteClass, release):
+    async with admission.admit(route_class):
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_requests_run_up_to_the_route_class_limit():
+    admission = controller(capacity=4, list=1)
+    release = asyncio.Event()
+    running = asyncio.ensure_future(hold(admission, RouteClass.LIST, release))
+    await asyncio.sleep(0)
+
+    waiting = asyncio.ensure_future(hold(admission, RouteClass.LIST, release))
+    await asyncio.sleep(0)
+    snapshot = admission.snapshot()["route_classes"]["list"]
+    assert (snapshot["active"], snapshot["queued"]) == (1, 1)
+
+    # Other route classes are not held back by the heavy one
+    async with admission.admit(RouteClass.POINT_READ):
+        assert admission.active == 2
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert admission.snapshot()["route_classes"]["list"]["admitted"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_retry_after():
+    admission = controller(capacity=1, queue_size=1, max_wait=5)
+    release = asyncio.Event()
+    running = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    waiting = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        async with admission.admit(RouteClass.WRITE):
+            pass
+
+    assert rejected.value.retry_after == 5
+    assert admission.snapshot()["route_classes"]["write"]["rejected"] == 1
+    release.set()
+    await asyncio.gather(running, waiting)
+
+
+@pytest.mark.asyncio
+async def test_long_estimated_wait_is_rejected_without_queueing():
+    admission = controller(capacity=1, max_wait=0.5)
+    admission._states[RouteClass.LIST].service_time = 2.0
+    release = asyncio.Event()
+    running = asyncio.ensure_future(hold(admission, RouteClass.LIST, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        async with admission.admit(RouteClass.LIST):
+            pass
+
+    assert rejected.value.reason == "estimated wait too long"
+    assert rejected.value.retry_after == 2
+    release.set()
+    await running
+
+
+@pytest.mark.asyncio
+async def test_waiting_too_long_is_rejected():
+    admission = controller(capacity=1, max_wait=0.05)
+    release = asyncio.Event()
+    running = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected):
+        async with admission.admit(RouteClass.WRITE):
+            pass
+
+    state = admission.snapshot()["route_classes"]["write"]
+    assert (state["timed_out"], state["queued"]) == (1, 0)
+    release.set()
+    await running
+    assert admission.active == 0
+
+
+@pytest.mark.asyncio
+async def test_point_reads_are_served_before_heavy_requests():
+    admission = controller(capacity=1)
+    order = []
+    release = asyncio.Event()
+
+    async def request(route_class):
+        async with admission.admit(route_class):
+            order.append(route_class)
+
+    running = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    await asyncio.sleep(0)
+    heavy = asyncio.ensure_future(request(RouteClass.LIST))
+    await asyncio.sleep(0)
+    cheap = asyncio.ensure_future(request(RouteClass.POINT_READ))
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(running, heavy, cheap)
+
+    assert order == [RouteClass.POINT_READ, RouteClass.LIST]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    admission = controller(capacity=1)
+    release = asyncio.Event()
+    running = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    await asyncio.sleep(0)
+    waiting = asyncio.ensure_future(hold(admission, RouteClass.WRITE, release))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert admission.snapshot()["route_classes"]["write"]["queued"] == 0
+    release.set()
+    await running
+    assert admission.active == 0
@@ -0,0 +1,99 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
+from domain.entities.task import Priority, TaskStatus
+from domain.value_objects.task_event import TaskEvent, TaskEventType
+from drivers.api.v1.tasks.schema import TaskEventParams
+from drivers.helpers.change_token import decode_change_token
+from drivers.helpers.sse import KEEP_ALIVE, stream_task_events
+from tests.utilis import create_task
+
+
+def task_event(
+    index: int = 1, status=TaskStatus.PENDING, priority=Priority.MEDIUM
+) -> TaskEvent:
+    task = create_task(index=index, status=status, priority=priority)
+    task.id = uuid4()
+    return TaskEvent(type=TaskEventType.CREATED, task=task)
+
+
+@pytest.mark.asyncio
+async def test_events_are_fanned_out_to_matching_subscribers():
+    broker = InMemoryEventBroker()
+    everything = broker.subscribe()
+    high_priority = broker.subscribe(
+        TaskEventParams(priority_filter=Priority.HIGH).matches
+    )
+    low, high = task_event(priority=Priority.LOW), task_event(priority=Priority.HIGH)
+
+    broker.publish(low)
+    broker.publish(high)
+
+    assert await everything.get() is low
+    assert await everything.get() is high
+    assert await high_priority.get() is high
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_evicted():
+    broker = InMemoryEventBroker(max_queue_size=2)
+    slow = broker.subscribe()
+    fast = broker.subscribe()
+
+    for index in range(3):
+        broker.publish(task_event(index))
+        await fast.get()
+
+    assert slow.evicted is True
+    assert await slow.get() is None
+    assert broker.subscriber_count == 1
+    assert fast.evicted is False
+
+
+@pytest.mark.asyncio
+async def test_stream_encodes_events_and_keeps_alive():
+    broker = InMemoryEventBroker()
+    subscription = broker.subscribe()
+    stream = stream_task_events(subscription, heartbeat_seconds=0.01)
+    event = task_event()
+
+    assert await anext(stream) == KEEP_ALIVE
+    broker.publish(event)
+    message = await anext(stream)
+    await stream.aclose()
+
+    lines = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    assert lines["event"] == "task.created"
+    assert json.loads(lines["data"])["id"] == str(event.task.id)
+    assert decode_change_token(lines["id"]).id == event.task.id
+    # Closing the stream (client disconnection) unsubscribes
+    assert broker.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_tells_an_evicted_subscriber():
+    broker = InMemoryEventBroker(max_queue_size=1)
+    subscription = broker.subscribe()
+    broker.publish(task_event(1))
+    broker.publish(task_event(2))
+
+    messages = [message async for message in stream_task_events(subscription, 1)]
+
+    assert messages == ["event: evicted\ndata: {}\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_the_next_event():
+    broker = InMemoryEventBroker()
+    subscription = broker.subscribe()
+    waiting = asyncio.ensure_future(subscription.get())
+    await asyncio.sleep(0)
+
+    event = task_event()
+    broker.publish(event)
+
+    assert await asyncio.wait_for(waiting, timeout=1) is event
@@ -0,0 +1,81 @@
+import pytest
+
+from drivers import server as server_module
+from drivers.server import (
+    MAX_FAST_FAILURES,
+    MAX_RESTART_BACKOFF,
+    WORKER_MIN_UPTIME,
+    Server,
+)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(server_module.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def server(settings):
+    server = Server(settings.model_copy(update={"workers": 2}))
+    server.stops = []
+    server._handle_stop = lambda signum, frame: server.stops.append(signum)
+    return server
+
+
+def crash(server: Server, clock: Clock, index: int, uptime: float) -> float | None:
+    """
+    Run worker `index` for `uptime` seconds, then make it exit. Return the delay
+    before its restart, or None when none was scheduled.
+    """
+    server.started_at[index] = clock.now
+    clock.now += uptime
+    server._schedule_restart(index, pid=1234, status=256)
+    restart_at = server.restarts.pop(index, None)
+    return None if restart_at is None else restart_at - clock.now
+
+
+def test_fast_failures_back_off_exponentially(server, clock):
+    delays = [crash(server, clock, 0, uptime=0.5) for _ in range(4)]
+
+    assert delays == [1.0, 2.0, 4.0, 8.0]
+    assert server.stops == []
+
+
+def test_backoff_is_kept_per_worker(server, clock):
+    crash(server, clock, 0, uptime=0.5)
+    crash(server, clock, 0, uptime=0.5)
+
+    assert crash(server, clock, 1, uptime=0.5) == 1.0
+
+
+def test_worker_that_ran_long_enough_restarts_at_once(server, clock):
+    crash(server, clock, 0, uptime=0.5)
+    crash(server, clock, 0, uptime=0.5)
+
+    assert crash(server, clock, 0, uptime=WORKER_MIN_UPTIME) == 0.0
+    assert crash(server, clock, 0, uptime=0.5) == 1.0
+
+
+def test_backoff_is_capped(server, clock, monkeypatch):
+    monkeypatch.setattr(server_module, "MAX_FAST_FAILURES", 20)
+
+    delays = [crash(server, clock, 0, uptime=0.5) for _ in range(10)]
+
+    assert delays[-1] == MAX_RESTART_BACKOFF
+
+
+def test_server_stops_after_consecutive_fast_failures(server, clock):
+    delays = [crash(server, clock, 0, uptime=0.5) for _ in range(MAX_FAST_FAILURES)]
+
+    assert delays[-1] is None
+    assert server.stops and server.exit_code == 1
@@ -0,0 +1,80 @@
+import pytest
+
+from drivers import server
+from drivers.server import size_worker_pool
+
+
+def test_pool_unchanged_without_connection_limit(settings):
+    settings = settings.model_copy(
+        update={"db_pool_size": 5, "db_max_overflow": 10, "db_max_connections": None}
+    )
+
+    assert size_worker_pool(settings, workers=8) == (5, 10)
+
+
+def test_pool_split_between_workers(settings):
+    settings = settings.model_copy(
+        update={"db_pool_size": 5, "db_max_overflow": 10, "db_max_connections": 100}
+    )
+
+    pool_size, max_overflow = size_worker_pool(settings, workers=8)
+
+    assert (pool_size, max_overflow) == (5, 7)
+    assert (pool_size + max_overflow) * 8 <= 100
+
+
+def test_pool_size_capped_by_connection_limit(settings):
+    settings = settings.model_copy(
+        update={"db_pool_size": 5, "db_max_overflow": 10, "db_max_connections": 6}
+    )
+
+    assert size_worker_pool(settings, workers=2) == (3, 0)
+
+
+def test_connection_limit_lower_than_workers(settings):
+    settings = settings.model_copy(update={"db_max_connections": 3})
+
+    with pytest.raises(ValueError):
+        size_worker_pool(settings, workers=4)
+
+
+def test_pool_split_between_the_primary_and_shard_engines(settings):
+    settings = settings.model_copy(
+        update={
+            "db_pool_size": 5,
+            "db_max_overflow": 10,
+            "db_max_connections": 60,
+            "db_shard_names": ["shard_0", "shard_1"],
+        }
+    )
+
+    assert size_worker_pool(settings, workers=4) == (5, 0)
+
+
+def test_single_writer_connections_counted(settings):
+    settings = settings.model_copy(
+        update={
+            "db_pool_size": 5,
+            "db_max_overflow": 10,
+            "db_max_connections": 84,
+            "sqlite_single_writer_enabled": True,
+        }
+    )
+
+    pool_size, max_overflow = size_worker_pool(settings, workers=4)
+
+    # Per worker: the primary engine, the readers and the writer's connection
+    assert (pool_size, max_overflow) == (5, 5)
+    assert ((pool_size + max_overflow) * 2 + 1) * 4 <= 84
+
+
+def test_pool_split_between_the_engines_of_a_worker(settings, monkeypatch):
+    monkeypatch.setattr(server, "get_pooled_engine_count", lambda settings: 3)
+    settings = settings.model_copy(
+        update={"db_pool_size": 5, "db_max_overflow": 10, "db_max_connections": 100}
+    )
+
+    pool_size, max_overflow = size_worker_pool(settings, workers=4)
+
+    assert (pool_size, max_overflow) == (5, 3)
+    assert (pool_size + max_overflow) * 3 * 4 <= 100
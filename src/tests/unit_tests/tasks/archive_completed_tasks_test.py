@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from domain.entities.task import TaskStatus
+from use_cases.tasks.archive_completed_tasks_usecase import (
+    ArchiveCompletedTasksUseCase,
+)
+
+
+@pytest.mark.asyncio
+async def test_archive_completed_tasks_in_batches(
+    in_memory_task_repository_fixture,
+    pending_task_fixture,
+    completed_task_fixture,
+    in_progress_task_fixture,
+):
+    repository = in_memory_task_repository_fixture
+    use_case = ArchiveCompletedTasksUseCase(repository)
+    later = datetime.now(timezone.utc) + timedelta(seconds=1)
+
+    archived = await use_case.execute(completed_before=later, batch_size=1)
+    archived_again = await use_case.execute(completed_before=later, batch_size=1)
+
+    assert (archived, archived_again) == (1, 0)
+    assert await repository.get(id_filter=completed_task_fixture.id) is None
+    assert await repository.count() == 2
+    assert await repository.count(include_archived=True) == 3
+    assert await repository.list_all(
+        include_archived=True, status_filter=TaskStatus.COMPLETED
+    ) == [completed_task_fixture]
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_recently_completed_tasks(
+    in_memory_task_repository_fixture, completed_task_fixture
+):
+    use_case = ArchiveCompletedTasksUseCase(in_memory_task_repository_fixture)
+
+    archived = await use_case.execute(
+        completed_before=completed_task_fixture.updated_at, batch_size=10
+    )
+
+    assert archived == 0
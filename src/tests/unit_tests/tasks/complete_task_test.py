@@ -2,8 +2,10 @@ from uuid import uuid4
 
 import pytest
 
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
 from domain.entities.task import TaskStatus
 from domain.exceptions.task_exception import TaskCannotBeCompleted, TaskNotFound
+from domain.value_objects.task_event import TaskEventType
 from use_cases.tasks.complete_task_usecase import CompleteTaskUseCase
 
 
@@ -24,6 +26,24 @@ async def test_complete_pending_task_successfully(
     assert completed_task.title == pending_task_fixture.title
 
 
+@pytest.mark.asyncio
+async def test_complete_task_publishes_the_stored_task(
+    in_memory_task_repository_fixture, pending_task_fixture
+):
+    broker = InMemoryEventBroker()
+    subscription = broker.subscribe()
+    use_case = CompleteTaskUseCase(in_memory_task_repository_fixture, broker)
+    previous_update = pending_task_fixture.updated_at
+
+    completed_task = await use_case.execute(pending_task_fixture.id)
+
+    event = await subscription.get()
+    assert event.type == TaskEventType.COMPLETED
+    assert event.task.status == TaskStatus.COMPLETED
+    assert event.task.updated_at == completed_task.updated_at
+    assert event.task.updated_at > previous_update
+
+
 @pytest.mark.asyncio
 async def test_complete_in_progress_task_successfully(
     complete_task_use_case, in_progress_task_fixture
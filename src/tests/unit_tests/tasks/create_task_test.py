@@ -2,8 +2,10 @@ from datetime import datetime, timezone
 
 import pytest
 
+from adapters.event_brokers.in_memory_event_broker import InMemoryEventBroker
 from domain.entities.task import Priority, TaskStatus
 from domain.value_objects.create_task_data import CreateTaskData
+from domain.value_objects.task_event import TaskEventType
 from use_cases.tasks.create_task_usecase import CreateTaskUseCase
 
 
@@ -31,3 +33,20 @@ async def test_create_client(task_use_case):
     assert created_task.due_date == created_task.due_date
 
     assert created_task.id is not None
+
+
+@pytest.mark.asyncio
+async def test_create_task_publishes_an_event(in_memory_task_repository_fixture):
+    broker = InMemoryEventBroker()
+    subscription = broker.subscribe()
+    use_case = CreateTaskUseCase(in_memory_task_repository_fixture, broker)
+
+    created_task = await use_case.execute(
+        CreateTaskData(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+    )
+
+    event = await subscription.get()
+    assert event.type == TaskEventType.CREATED
+    assert event.task is created_task
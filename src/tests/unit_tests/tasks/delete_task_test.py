@@ -0,0 +1,74 @@
+from uuid import uuid4
+
+import pytest
+
+from domain.entities.task import TaskStatus
+from domain.exceptions.common import DatabaseException
+from domain.exceptions.task_exception import TaskNotFound
+from domain.value_objects.task_deletion import TaskDeletionProgress
+from tests.utilis import repository_scope
+from use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
+from use_cases.tasks.delete_tasks_usecase import DeleteTasksUseCase
+
+
+@pytest.mark.asyncio
+async def test_delete_task(in_memory_task_repository_fixture, pending_task_fixture):
+    use_case = DeleteTaskUseCase(in_memory_task_repository_fixture)
+
+    await use_case.execute(task_id=pending_task_fixture.id)
+
+    assert await in_memory_task_repository_fixture.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_task_not_found(in_memory_task_repository_fixture):
+    use_case = DeleteTaskUseCase(in_memory_task_repository_fixture)
+
+    with pytest.raises(TaskNotFound):
+        await use_case.execute(task_id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_delete_tasks_in_chunks(
+    in_memory_task_repository_fixture,
+    pending_task_fixture,
+    in_progress_task_fixture,
+    completed_task_fixture,
+):
+    repository = in_memory_task_repository_fixture
+    for task in (pending_task_fixture, in_progress_task_fixture):
+        await repository.update(
+            fields_to_update={"status": TaskStatus.COMPLETED}, id_filter=task.id
+        )
+    use_case = DeleteTasksUseCase(repository_scope(repository))
+
+    progress = [
+        step
+        async for step in use_case.execute(
+            chunk_size=2, status_filter=TaskStatus.COMPLETED
+        )
+    ]
+
+    assert progress == [
+        TaskDeletionProgress(deleted=2, total=3),
+        TaskDeletionProgress(deleted=3, total=3),
+        TaskDeletionProgress(deleted=3, total=3, done=True),
+    ]
+    assert await repository.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_tasks_reports_a_failed_chunk(
+    in_memory_task_repository_fixture, pending_task_fixture, monkeypatch
+):
+    async def failing_delete(**filters):
+        raise DatabaseException()
+
+    monkeypatch.setattr(in_memory_task_repository_fixture, "delete", failing_delete)
+    use_case = DeleteTasksUseCase(repository_scope(in_memory_task_repository_fixture))
+
+    progress = [step async for step in use_case.execute(chunk_size=2)]
+
+    assert len(progress) == 1
+    assert (progress[0].deleted, progress[0].total, progress[0].done) == (0, 1, False)
+    assert isinstance(progress[0].failure, DatabaseException)
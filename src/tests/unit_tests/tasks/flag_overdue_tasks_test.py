@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from domain.entities.task import TaskStatus
+from tests.utilis import create_task
+from use_cases.tasks.flag_overdue_tasks_usecase import FlagOverdueTasksUseCase
+
+
+@pytest.fixture
+def flag_overdue_tasks_use_case(in_memory_task_repository_fixture):
+    return FlagOverdueTasksUseCase(in_memory_task_repository_fixture)
+
+
+async def save_task(repository, index, status=TaskStatus.PENDING, overdue_hours=1):
+    task = create_task(index=index, status=status)
+    task.due_date = datetime.now(timezone.utc) - timedelta(hours=overdue_hours)
+    return await repository.save(task)
+
+
+@pytest.mark.asyncio
+async def test_flag_overdue_tasks_in_batches(
+    flag_overdue_tasks_use_case, in_memory_task_repository_fixture
+):
+    repository = in_memory_task_repository_fixture
+    overdue = [await save_task(repository, index) for index in range(3)]
+    completed = await save_task(repository, 3, status=TaskStatus.COMPLETED)
+    upcoming = await save_task(repository, 4, overdue_hours=-1)
+    now = datetime.now(timezone.utc)
+
+    first, after = await flag_overdue_tasks_use_case.execute(now=now, batch_size=2)
+    second, after = await flag_overdue_tasks_use_case.execute(
+        now=now, batch_size=2, after=after
+    )
+    last, after = await flag_overdue_tasks_use_case.execute(
+        now=now, batch_size=2, after=after
+    )
+
+    assert (first, second, last, after) == (2, 1, 0, None)
+    for task in overdue:
+        assert (await repository.get(id_filter=task.id)).overdue_at == now
+    assert (await repository.get(id_filter=completed.id)).overdue_at is None
+    assert (await repository.get(id_filter=upcoming.id)).overdue_at is None
+
+
+@pytest.mark.asyncio
+async def test_flag_overdue_tasks_skips_flagged_tasks(
+    flag_overdue_tasks_use_case, in_memory_task_repository_fixture
+):
+    await save_task(in_memory_task_repository_fixture, 1)
+    first_sweep = datetime.now(timezone.utc)
+    await flag_overdue_tasks_use_case.execute(now=first_sweep, batch_size=10)
+
+    flagged, after = await flag_overdue_tasks_use_case.execute(
+        now=first_sweep + timedelta(minutes=1), batch_size=10
+    )
+
+    assert (flagged, after) == (0, None)
@@ -0,0 +1,69 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from domain.entities.task import Priority
+from domain.exceptions.common import DatabaseException, InvalidImportFile
+from domain.value_objects.create_task_data import CreateTaskData
+from domain.value_objects.task_import import ImportRowError
+from tests.utilis import repository_scope
+from use_cases.tasks.import_tasks_usecase import ImportTasksUseCase
+
+
+async def rows(*items):
+    for item in items:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def task_data(index: int) -> CreateTaskData:
+    return CreateTaskData(
+        title=f"Task {index}", description="Imported", priority=Priority.LOW
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_in_chunks(in_memory_task_repository_fixture):
+    use_case = ImportTasksUseCase(repository_scope(in_memory_task_repository_fixture))
+
+    result = await use_case.execute(
+        rows(task_data(1), ImportRowError(2, ["title: missing"]), task_data(3)),
+        chunk_size=1,
+        max_reported_errors=10,
+    )
+
+    assert (result.inserted, result.rejected, result.failure) == (2, 1, None)
+    assert result.errors == [ImportRowError(2, ["title: missing"])]
+    assert await in_memory_task_repository_fixture.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_stopped_midway(in_memory_task_repository_fixture):
+    use_case = ImportTasksUseCase(repository_scope(in_memory_task_repository_fixture))
+    failure = InvalidImportFile("Lines are limited")
+
+    result = await use_case.execute(
+        rows(task_data(1), task_data(2), failure), chunk_size=1, max_reported_errors=10
+    )
+
+    assert (result.inserted, result.failure) == (2, failure)
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_failing_from_the_start(in_memory_task_repository_fixture):
+    @asynccontextmanager
+    async def failing_scope():
+        raise DatabaseException()
+        yield in_memory_task_repository_fixture
+
+    with pytest.raises(DatabaseException):
+        await ImportTasksUseCase(failing_scope).execute(
+            rows(task_data(1)), chunk_size=1, max_reported_errors=10
+        )
+    with pytest.raises(InvalidImportFile):
+        await ImportTasksUseCase(failing_scope).execute(
+            rows(InvalidImportFile("Missing CSV columns")),
+            chunk_size=1,
+            max_reported_errors=10,
+        )
@@ -1,6 +1,7 @@
 import pytest
 
 from domain.entities.task import Priority, TaskStatus
+from tests.utilis import create_task
 from use_cases.tasks.get_all_tasks_usecase import ListAllTasksUseCase
 
 
@@ -108,3 +109,29 @@ async def test_list_all_tasks_filter_by_status_and_priority(
     assert result.items[0].id == completed_task_fixture.id
     assert result.items[0].status == TaskStatus.COMPLETED
     assert result.items[0].priority == Priority.LOW
+
+
+@pytest.mark.asyncio
+async def test_list_all_tasks_with_search(
+    list_all_tasks_use_case, in_memory_task_repository_fixture, pending_task_fixture
+):
+    report = create_task(index=4)
+    report.title = "Write report"
+    report.description = "The report for the report reviewers"
+    report = await in_memory_task_repository_fixture.save(report)
+    review = create_task(index=5)
+    review.description = "Review the reports"
+    review = await in_memory_task_repository_fixture.save(review)
+
+    result = await list_all_tasks_use_case.execute({"q": "report"})
+
+    assert result.count == 2
+    assert [task.id for task in result.items] == [report.id, review.id]
+
+    await in_memory_task_repository_fixture.update(
+        fields_to_update={"title": "Renamed", "description": "Nothing"},
+        id_filter=report.id,
+    )
+    result = await list_all_tasks_use_case.execute({"q": "report"})
+
+    assert [task.id for task in result.items] == [review.id]
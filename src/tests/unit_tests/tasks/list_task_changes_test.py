@@ -0,0 +1,68 @@
+import pytest
+
+from domain.entities.task import TaskStatus
+from domain.value_objects.change_feed import Removal, RemovalReason
+from use_cases.tasks.complete_task_usecase import CompleteTaskUseCase
+from use_cases.tasks.list_task_changes_usecase import ListTaskChangesUseCase
+
+
+@pytest.fixture
+def list_task_changes_use_case(in_memory_task_repository_fixture):
+    return ListTaskChangesUseCase(in_memory_task_repository_fixture)
+
+
+@pytest.mark.asyncio
+async def test_list_task_changes_empty_repository(list_task_changes_use_case):
+    feed = await list_task_changes_use_case.execute(since=None, limit=10)
+
+    assert feed.items == []
+    assert feed.position is None
+    assert feed.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_list_task_changes_resumes_from_position(
+    list_task_changes_use_case,
+    in_memory_task_repository_fixture,
+    pending_task_fixture,
+    in_progress_task_fixture,
+):
+    first = await list_task_changes_use_case.execute(since=None, limit=1)
+    second = await list_task_changes_use_case.execute(since=first.position, limit=1)
+    unchanged = await list_task_changes_use_case.execute(since=second.position, limit=1)
+
+    assert first.has_more is True
+    assert [task.id for task in first.items + second.items] == [
+        pending_task_fixture.id,
+        in_progress_task_fixture.id,
+    ]
+    assert unchanged.items == []
+    assert unchanged.position == second.position
+
+    await CompleteTaskUseCase(in_memory_task_repository_fixture).execute(
+        pending_task_fixture.id
+    )
+    changed = await list_task_changes_use_case.execute(since=second.position, limit=10)
+
+    assert [task.id for task in changed.items] == [pending_task_fixture.id]
+    assert changed.items[0].status == TaskStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_list_task_changes_reports_removals(
+    list_task_changes_use_case,
+    in_memory_task_repository_fixture,
+    pending_task_fixture,
+):
+    before = await list_task_changes_use_case.execute(since=None, limit=10)
+
+    await in_memory_task_repository_fixture.delete(id_filter=pending_task_fixture.id)
+    after = await list_task_changes_use_case.execute(since=before.position, limit=10)
+
+    assert len(after.items) == 1
+    removal = after.items[0]
+    assert isinstance(removal, Removal)
+    assert (removal.id, removal.reason) == (
+        pending_task_fixture.id,
+        RemovalReason.DELETED,
+    )
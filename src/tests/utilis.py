@@ -1,8 +1,15 @@
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import text
 
-from adapters.connection_engines.sql_alchemy.models import TaskModel
+from adapters.connection_engines.sql_alchemy.models import (
+    IdempotencyKeyModel,
+    JobLockModel,
+    TaskArchiveModel,
+    TaskModel,
+    TaskTombstoneModel,
+)
 from domain.entities.task import Priority, Task, TaskStatus
 
 
@@ -23,9 +30,25 @@ def create_task(
     )
 
 
+def repository_scope(repository):
+    """
+    A repository scope always handing out the same repository.
+    """
+
+    @asynccontextmanager
+    async def scope():
+        yield repository
+
+    return scope
+
+
 async def truncate_tables(db_session):
     table_names = [
         TaskModel.__tablename__,
+        TaskArchiveModel.__tablename__,
+        TaskTombstoneModel.__tablename__,
+        JobLockModel.__tablename__,
+        IdempotencyKeyModel.__tablename__,
     ]
 
     for table in table_names:
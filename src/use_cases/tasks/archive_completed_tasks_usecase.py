@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from domain.entities.task import TaskStatus
+from ports.task_repository_interface import TaskRepositoryInterface
+
+
+class ArchiveCompletedTasksUseCase:
+    def __init__(self, repository: TaskRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, completed_before: datetime, batch_size: int) -> int:
+        """
+        Archive up to `batch_size` of the tasks completed (last updated) before
+        `completed_before`. Returns the number of tasks archived.
+        """
+        tasks = await self.repository.list_projected(
+            ["id"],
+            page=1,
+            limit=batch_size,
+            order_by="updated_at",
+            status_filter=TaskStatus.COMPLETED,
+            updated_before_filter=completed_before,
+        )
+        if not tasks:
+            return 0
+
+        return await self.repository.archive(
+            id_in_filter=[task.id for task in tasks],
+            status_filter=TaskStatus.COMPLETED,
+        )
@@ -1,13 +1,25 @@
+from functools import partial
 from uuid import UUID
 
 from domain.entities.task import Task
-from domain.exceptions.task_exception import TaskCannotBeCompleted, TaskNotFound, TaskUpdateFailed
+from domain.exceptions.task_exception import (
+    TaskCannotBeCompleted,
+    TaskNotFound,
+    TaskUpdateFailed,
+)
+from domain.value_objects.task_event import TaskEvent, TaskEventType
+from ports.task_event_publisher_interface import TaskEventPublisherInterface
 from ports.task_repository_interface import TaskRepositoryInterface
 
 
 class CompleteTaskUseCase:
-    def __init__(self, repository: TaskRepositoryInterface):
+    def __init__(
+        self,
+        repository: TaskRepositoryInterface,
+        publisher: TaskEventPublisherInterface | None = None,
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     async def execute(self, task_id: UUID) -> Task:
         task = await self.repository.get(id_filter=task_id)
@@ -20,10 +32,16 @@ class CompleteTaskUseCase:
 
         task.mark_as_completed()
         updated_count = await self.repository.update(
-            fields_to_update={"status": task.status}
+            fields_to_update={"status": task.status}, id_filter=task_id
         )
 
         if updated_count == 0:
             raise TaskUpdateFailed(str(task_id))
 
+        # Read back the values the database set, the update time included
+        task = await self.repository.get(id_filter=task_id) or task
+        if self.publisher is not None:
+            event = TaskEvent(type=TaskEventType.COMPLETED, task=task)
+            # Subscribers must not hear of a completion that is rolled back
+            self.repository.after_commit(partial(self.publisher.publish, event))
         return task
@@ -1,14 +1,22 @@
 from datetime import datetime, timezone
+from functools import partial
 from uuid import uuid4
 
 from domain.entities.task import Task, TaskStatus
 from domain.value_objects.create_task_data import CreateTaskData
-from ports.task_repository_interface import TaskRepositoryInterface
+from domain.value_objects.task_event import TaskEvent, TaskEventType
+from ports.task_event_publisher_interface import TaskEventPublisherInterface
+from ports.task_writer_interface import TaskWriterInterface
 
 
 class CreateTaskUseCase:
-    def __init__(self, repository: TaskRepositoryInterface):
+    def __init__(
+        self,
+        repository: TaskWriterInterface,
+        publisher: TaskEventPublisherInterface | None = None,
+    ):
         self.repository = repository
+        self.publisher = publisher
 
     async def execute(self, data: CreateTaskData) -> Task:
         task = Task(
@@ -22,4 +30,9 @@ class CreateTaskUseCase:
             updated_at=datetime.now(timezone.utc),
         )
 
-        return await self.repository.save(task)
+        task = await self.repository.save(task)
+        if self.publisher is not None:
+            event = TaskEvent(type=TaskEventType.CREATED, task=task)
+            # Subscribers must not hear of a task whose creation is rolled back
+            self.repository.after_commit(partial(self.publisher.publish, event))
+        return task
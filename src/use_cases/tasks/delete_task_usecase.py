@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from domain.exceptions.task_exception import TaskCannotBeDeleted, TaskNotFound
+from ports.task_repository_interface import TaskRepositoryInterface
+
+
+class DeleteTaskUseCase:
+    def __init__(self, repository: TaskRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, task_id: UUID) -> None:
+        task = await self.repository.get(id_filter=task_id)
+
+        if task is None:
+            raise TaskNotFound(str(task_id))
+
+        if not task.can_be_deleted():
+            raise TaskCannotBeDeleted(str(task_id))
+
+        deleted_count = await self.repository.delete(id_filter=task_id)
+
+        if deleted_count == 0:
+            # Deleted by a concurrent request
+            raise TaskNotFound(str(task_id))
@@ -0,0 +1,78 @@
+import asyncio
+from typing import AsyncIterator
+from uuid import UUID
+
+from domain.exceptions.common import DatabaseException
+from domain.value_objects.task_deletion import TaskDeletionProgress
+from ports.task_repository_interface import (
+    TaskRepositoryInterface,
+    TaskRepositoryScope,
+)
+
+
+class DeleteTasksUseCase:
+    def __init__(self, repository_scope: TaskRepositoryScope):
+        self.repository_scope = repository_scope
+
+    async def execute(
+        self, chunk_size: int, pause: float = 0.0, **filters
+    ) -> AsyncIterator[TaskDeletionProgress]:
+        """
+        Delete the tasks matching the filters, one chunk per transaction so no lock
+        is held for long, and report the progress after every chunk, pausing
+        `pause` seconds between two chunks. The chunks already deleted stay
+        deleted when the caller stops iterating or a chunk fails.
+        """
+        deleted = total = 0
+        after: UUID | None = None
+        try:
+            async with self.repository_scope() as repository:
+                total = await repository.count(**filters)
+            while True:
+                async with self.repository_scope() as repository:
+                    chunk_deleted, after = await self.delete_chunk(
+                        repository, chunk_size, after, **filters
+                    )
+                if after is None:
+                    break
+                deleted += chunk_deleted
+                yield TaskDeletionProgress(deleted=deleted, total=total)
+                await asyncio.sleep(pause)
+        except DatabaseException as exception:
+            yield TaskDeletionProgress(deleted=deleted, total=total, failure=exception)
+            return
+
+        yield TaskDeletionProgress(deleted=deleted, total=total, done=True)
+
+    @staticmethod
+    async def delete_chunk(
+        repository: TaskRepositoryInterface,
+        chunk_size: int,
+        after: UUID | None = None,
+        **filters,
+    ) -> tuple[int, UUID | None]:
+        """
+        Delete the next `chunk_size` tasks matching the filters, in id order from
+        the task `after`.
+        Returns the number of tasks deleted and the id to resume from
+        (None once no matching task is left).
+        """
+        chunk_filters = dict(filters)
+        if after is not None:
+            chunk_filters["id_after_filter"] = after
+
+        # Only the ids are read, from the index
+        chunk = await repository.list_projected(
+            ["id"], page=1, limit=chunk_size, order_by="id", **chunk_filters
+        )
+        if not chunk:
+            return 0, None
+
+        last_id = chunk[-1].id
+        # The id range, not the ids read: one bound parameter whatever the chunk
+        # size (SQLite limits them), and with the filters again, a task changed
+        # since it was read is left alone
+        deleted_count = await repository.delete(
+            id_up_to_filter=last_id, **chunk_filters
+        )
+        return deleted_count, last_id
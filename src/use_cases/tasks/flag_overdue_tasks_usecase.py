@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from domain.entities.task import TaskStatus
+from ports.task_repository_interface import TaskRepositoryInterface
+
+
+class FlagOverdueTasksUseCase:
+    def __init__(self, repository: TaskRepositoryInterface):
+        self.repository = repository
+
+    async def execute(
+        self, now: datetime, batch_size: int, after: UUID | None = None
+    ) -> tuple[int, UUID | None]:
+        """
+        Flag the next `batch_size` overdue tasks, in id order from the task `after`.
+        Returns the number of tasks flagged and the id to resume from
+        (None once no overdue task is left).
+        """
+        filters: dict[str, Any] = dict(
+            due_before_filter=now,
+            status_not_filter=TaskStatus.COMPLETED,
+            flagged_overdue_filter=False,
+        )
+        if after is not None:
+            filters["id_after_filter"] = after
+
+        tasks = await self.repository.list_projected(
+            ["id"], page=1, limit=batch_size, order_by="id", **filters
+        )
+        if not tasks:
+            return 0, None
+
+        task_ids = [task.id for task in tasks]
+        flagged = await self.repository.update(
+            fields_to_update={"overdue_at": now}, id_in_filter=task_ids
+        )
+        return flagged, task_ids[-1]
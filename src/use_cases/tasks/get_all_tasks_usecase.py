@@ -1,6 +1,8 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
+from domain.entities.task import Task
 from domain.value_objects.list_entity import ListEntity
+from domain.value_objects.projection import Projection
 from ports.task_repository_interface import TaskRepositoryInterface
 
 
@@ -9,7 +11,16 @@ class ListAllTasksUseCase:
         self.repository = repository
 
     async def execute(self, params: Dict[Any, Any]) -> ListEntity:
-        tasks = await self.repository.list_all(**params)
-        count = await self.repository.count(**params)
+        """
+        With `fields` in the params, only those fields of the tasks are read.
+        """
+        filters = {key: value for key, value in params.items() if key != "fields"}
+        tasks: List[Task] | List[Projection]
+        if params.get("fields"):
+            tasks = await self.repository.list_projected(params["fields"], **filters)
+        else:
+            tasks = await self.repository.list_all(**filters)
+        # The projection only shapes the items, it does not filter them
+        count = await self.repository.count(**filters)
 
         return ListEntity(items=tasks, count=count)
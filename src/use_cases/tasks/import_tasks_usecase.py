@@ -0,0 +1,87 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Sequence
+from uuid import uuid4
+
+from domain.entities.task import Task, TaskStatus
+from domain.exceptions.common import DatabaseException, InvalidImportFile
+from domain.value_objects.create_task_data import CreateTaskData
+from domain.value_objects.task_import import ImportRowError, TaskImportResult
+from ports.task_repository_interface import TaskRepositoryScope
+
+
+class ImportTasksUseCase:
+    def __init__(self, repository_scope: TaskRepositoryScope):
+        self.repository_scope = repository_scope
+
+    async def execute(
+        self,
+        rows: AsyncIterator[CreateTaskData | ImportRowError],
+        chunk_size: int,
+        max_reported_errors: int,
+    ) -> TaskImportResult:
+        """
+        Create the valid rows as they are read, `chunk_size` per transaction: the
+        file is never held in memory, and the chunks already created stay created
+        if the import stops. A chunk is inserted while the next one is read.
+        Unlike single creations, no event is published.
+        Raises InvalidImportFile when the file is unreadable from the start, and
+        DatabaseException when the first chunk can't be created.
+        """
+        start = time.perf_counter()
+        result = TaskImportResult()
+        chunk: List[CreateTaskData] = []
+        inserting: asyncio.Task[int] | None = None
+
+        try:
+            try:
+                async for row in rows:
+                    if isinstance(row, ImportRowError):
+                        result.rejected += 1
+                        if len(result.errors) < max_reported_errors:
+                            result.errors.append(row)
+                        continue
+
+                    chunk.append(row)
+                    if len(chunk) >= chunk_size:
+                        # One chunk at a time: SQLite has a single writer
+                        if inserting is not None:
+                            previous, inserting = inserting, None
+                            result.inserted += await previous
+                        inserting = asyncio.create_task(self._insert(chunk))
+                        chunk = []
+            finally:
+                if inserting is not None:
+                    result.inserted += await inserting
+            if chunk:
+                result.inserted += await self._insert(chunk)
+        except InvalidImportFile as exception:
+            if not result.inserted and not result.rejected:
+                raise
+            result.failure = exception
+        except DatabaseException as exception:
+            if not result.inserted:
+                raise
+            result.failure = exception
+
+        result.duration = time.perf_counter() - start
+        return result
+
+    async def _insert(self, chunk: Sequence[CreateTaskData]) -> int:
+        now = datetime.now(timezone.utc)
+        tasks = [
+            Task(
+                id=uuid4(),
+                title=data.title,
+                description=data.description,
+                status=TaskStatus.PENDING,
+                priority=data.priority,
+                due_date=data.due_date,
+                created_at=now,
+                updated_at=now,
+            )
+            for data in chunk
+        ]
+        async with self.repository_scope() as repository:
+            return await repository.bulk_insert(tasks)
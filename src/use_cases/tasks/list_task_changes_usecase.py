@@ -0,0 +1,16 @@
+from domain.value_objects.change_feed import ChangeFeed, ChangePosition
+from ports.task_repository_interface import TaskRepositoryInterface
+
+
+class ListTaskChangesUseCase:
+    def __init__(self, repository: TaskRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, since: ChangePosition | None, limit: int) -> ChangeFeed:
+        # One extra change tells whether another page follows, without a count query
+        changes = await self.repository.list_changes(since=since, limit=limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        position = ChangePosition.of(changes[-1]) if changes else since
+        return ChangeFeed(items=changes, position=position, has_more=has_more)